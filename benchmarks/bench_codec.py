@@ -0,0 +1,44 @@
+"""Benchmark encoding of weeks against plain pickling of lists of weeks.
+
+Run from the repository root with ``python benchmarks/bench_codec.py``.
+"""
+
+import pickle
+import random
+import timeit
+
+from collections.abc import Callable
+from functools import partial
+
+from epiweeks import Week, WeekArray, WeekRange, codec
+
+
+def main(number: int = 200_000) -> None:
+    """Print sizes and round-trip timings of encodings of weeks."""
+    consecutive = list(WeekRange(Week(1, 1), Week(1, 1) + number))
+    rng = random.Random(number)
+    shuffled = rng.sample(consecutive, number)
+    for title, weeks in (("consecutive", consecutive), ("shuffled", shuffled)):
+        week_array = WeekArray(weeks)
+        cases: dict[str, tuple[Callable[[], bytes], Callable[[bytes], object]]] = {
+            "pickle list": (lambda w=weeks: pickle.dumps(w), pickle.loads),
+            "pickle WeekArray": (lambda a=week_array: pickle.dumps(a), pickle.loads),
+            "encode_weeks": (
+                lambda a=week_array: codec.encode_weeks(a),
+                codec.decode_weeks,
+            ),
+        }
+        print(f"{title} weeks:")
+        for name, (dump, load) in cases.items():
+            data = dump()
+            dump_seconds = min(timeit.repeat(dump, number=1, repeat=3))
+            load_seconds = min(timeit.repeat(partial(load, data), number=1, repeat=3))
+            print(
+                f"  {name:<20} {len(data) / number:6.2f} bytes "
+                f"{dump_seconds * 1e9 / number:6.0f} ns dump "
+                f"{load_seconds * 1e9 / number:6.0f} ns load per week"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""Benchmark bulk parsing of week strings against a per-string loop.
+
+Run from the repository root with ``python benchmarks/bench_fromstrings.py``.
+"""
+
+import timeit
+
+from epiweeks import Week
+
+
+def fromstring_loop(week_strings: list[str]) -> list[Week | None]:
+    """Parse week strings one by one replacing invalid ones with ``None``."""
+    weeks: list[Week | None] = []
+    for week_string in week_strings:
+        try:
+            weeks.append(Week.fromstring(week_string))
+        except ValueError:
+            weeks.append(None)
+    return weeks
+
+
+def main(number: int = 1_000_000) -> None:
+    """Print timings of ``Week.fromstrings`` compared to ``Week.fromstring``."""
+    week_strings = [
+        f"{2000 + i % 25}{'-W' if i % 2 else ''}{1 + i % 52:02}" for i in range(number)
+    ]
+    week_strings[::1000] = ["2015W60"] * len(week_strings[::1000])
+    cases = {
+        "fromstring loop": lambda: fromstring_loop(week_strings),
+        "fromstrings coerce": lambda: Week.fromstrings(week_strings, errors="coerce"),
+        "fromstrings collect": lambda: Week.fromstrings(week_strings, errors="collect"),
+    }
+    for name, case in cases.items():
+        seconds = min(timeit.repeat(case, number=1, repeat=3))
+        print(f"{name:<24} {seconds * 1e9 / number:8.0f} ns per string")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,280 @@
+"""Benchmark suite of hot paths with JSON results and baseline comparison.
+
+Run from the repository root with ``python benchmarks/bench_suite.py``. Use
+``--scale`` to shrink or grow workloads, ``--output`` to record results to a
+JSON file, and ``--baseline`` to compare results with a recorded file, in
+which case the exit status is 1 when any benchmark is slower than its
+baseline by more than ``--threshold``. Only the standard library is needed,
+while benchmarks of optional modules are skipped when their dependencies
+are not installed.
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import timeit
+
+from collections.abc import Callable
+from datetime import date
+from importlib.metadata import PackageNotFoundError, version
+from itertools import cycle, islice, pairwise
+from typing import Any
+
+import epiweeks
+
+from epiweeks import Week, WeekArray, Year, codec
+
+Benchmark = Callable[[int], Callable[[], object]]
+
+_benchmarks: dict[str, tuple[int, Benchmark]] = {}
+
+
+def benchmark(name: str, size: int) -> Callable[[Benchmark], Benchmark]:
+    """Register a benchmark of a workload of ``size`` items at scale 1.
+
+    The decorated function takes the scaled size and returns the timed
+    callable, so that preparing the workload is not timed.
+    """
+
+    def register(function: Benchmark) -> Benchmark:
+        _benchmarks[name] = size, function
+        return function
+
+    return register
+
+
+def sample_dates(size: int, pool: int = 100_000) -> list[date]:
+    """Return dates of 2000..2030 with a bounded number of distinct objects."""
+    rng = random.Random(size)
+    start, stop = date(2000, 1, 1).toordinal(), date(2030, 1, 1).toordinal()
+    dates = [date.fromordinal(rng.randrange(start, stop)) for _ in range(pool)]
+    return list(islice(cycle(dates), size))
+
+
+def sample_weeks(size: int, system: str = "cdc") -> list[Week]:
+    """Return weeks of 2000..2030 in random order."""
+    rng = random.Random(size)
+    first, last = Week(2000, 1, system).toserial(), Week(2029, 52, system).toserial()
+    return [Week.fromserial(rng.randint(first, last), system) for _ in range(size)]
+
+
+@benchmark("Week.fromdate", 10_000_000)
+def bench_fromdate(size: int) -> Callable[[], object]:
+    """Return workload of ``Week.fromdate``."""
+    dates = sample_dates(size)
+    return lambda: [Week.fromdate(d) for d in dates]
+
+
+@benchmark("Week.fromordinal", 10_000_000)
+def bench_fromordinal(size: int) -> Callable[[], object]:
+    """Return workload of ``Week.fromordinal``."""
+    ordinals = [d.toordinal() for d in sample_dates(size)]
+    return lambda: [Week.fromordinal(o) for o in ordinals]
+
+
+@benchmark("Week.fromstring", 1_000_000)
+def bench_fromstring(size: int) -> Callable[[], object]:
+    """Return workload of ``Week.fromstring``."""
+    week_strings = [w.isoformat() for w in sample_weeks(size)]
+    return lambda: [Week.fromstring(s) for s in week_strings]
+
+
+@benchmark("Week.fromstrings", 1_000_000)
+def bench_fromstrings(size: int) -> Callable[[], object]:
+    """Return workload of ``Week.fromstrings``."""
+    week_strings = [w.isoformat() for w in sample_weeks(size)]
+    return lambda: Week.fromstrings(week_strings)
+
+
+@benchmark("Week.__init__", 1_000_000)
+def bench_init(size: int) -> Callable[[], object]:
+    """Return workload of ``Week.__init__``."""
+    weektuples = [w.weektuple() for w in sample_weeks(size)]
+    return lambda: [Week(y, w) for y, w in weektuples]
+
+
+@benchmark("Week.__add__", 1_000_000)
+def bench_add(size: int) -> Callable[[], object]:
+    """Return workload of ``Week.__add__``."""
+    weeks = sample_weeks(size)
+    return lambda: [w + 10 for w in weeks]
+
+
+@benchmark("Week.__lt__", 1_000_000)
+def bench_lt(size: int) -> Callable[[], object]:
+    """Return workload of ``Week.__lt__``."""
+    weeks = sample_weeks(size + 1)
+    pairs = list(pairwise(weeks))
+    return lambda: [a < b for a, b in pairs]
+
+
+@benchmark("sorted(weeks)", 1_000_000)
+def bench_sort(size: int) -> Callable[[], object]:
+    """Return workload of ``sorted(weeks)``."""
+    weeks = sample_weeks(size)
+    return lambda: sorted(weeks)
+
+
+@benchmark("WeekArray.sort", 1_000_000)
+def bench_array_sort(size: int) -> Callable[[], object]:
+    """Return workload of ``WeekArray.sort``."""
+    serials = [w.toserial() for w in sample_weeks(size)]
+    return lambda: WeekArray.fromserials(serials).sort()
+
+
+@benchmark("Week.__contains__", 1_000_000)
+def bench_contains(size: int) -> Callable[[], object]:
+    """Return workload of ``Week.__contains__``."""
+    weeks = sample_weeks(size)
+    dates = sample_dates(size)
+    pairs = list(zip(weeks, dates, strict=True))
+    return lambda: [d in w for w, d in pairs]
+
+
+@benchmark("Week.startdate", 1_000_000)
+def bench_startdate(size: int) -> Callable[[], object]:
+    """Return workload of ``Week.startdate``."""
+    weeks = sample_weeks(size)
+    return lambda: [w.startdate() for w in weeks]
+
+
+@benchmark("Year.iterweeks", 10_000)
+def bench_iterweeks(size: int) -> Callable[[], object]:
+    """Return workload of ``Year.iterweeks``."""
+    years = [Year(1 + i % 9999) for i in range(size)]
+    return lambda: [list(y.iterweeks()) for y in years]
+
+
+@benchmark("Year.__getitem__", 1_000_000)
+def bench_year_getitem(size: int) -> Callable[[], object]:
+    """Return workload of ``Year.__getitem__``."""
+    years = [Year(w.year) for w in sample_weeks(size)]
+    return lambda: [y[20] for y in years]
+
+
+@benchmark("WeekArray.tosystem", 1_000_000)
+def bench_array_tosystem(size: int) -> Callable[[], object]:
+    """Return workload of ``WeekArray.tosystem``."""
+    week_array = WeekArray(sample_weeks(size))
+    return lambda: week_array.tosystem("iso")
+
+
+@benchmark("WeekArray.toseasons", 1_000_000)
+def bench_array_toseasons(size: int) -> Callable[[], object]:
+    """Return workload of ``WeekArray.toseasons``."""
+    week_array = WeekArray(sample_weeks(size))
+    return week_array.toseasons
+
+
+@benchmark("codec.decode_weeks", 1_000_000)
+def bench_decode_weeks(size: int) -> Callable[[], object]:
+    """Return workload of ``codec.decode_weeks``."""
+    data = codec.encode_weeks(WeekArray(sorted(sample_weeks(size))))
+    return lambda: codec.decode_weeks(data)
+
+
+@benchmark("numpy.fromdates", 10_000_000)
+def bench_numpy_fromdates(size: int) -> Callable[[], object]:
+    """Return workload of ``numpy.fromdates``."""
+    import numpy as np  # noqa: PLC0415
+
+    from epiweeks.numpy import fromdates  # noqa: PLC0415
+
+    dates = np.array(sample_dates(size, pool=10_000), dtype="datetime64[D]")
+    return lambda: fromdates(dates)
+
+
+def run(
+    names: list[str], scale: float, repeat: int
+) -> dict[str, dict[str, float | int]]:
+    """Return timings of benchmarks as minimum seconds of repeats."""
+    results: dict[str, dict[str, float | int]] = {}
+    for name in names:
+        size, function = _benchmarks[name]
+        size = max(1, int(size * scale))
+        try:
+            case = function(size)
+        except ImportError as e:
+            print(f"{name:<24} skipped: {e}", file=sys.stderr)
+            continue
+        seconds = min(timeit.repeat(case, number=1, repeat=repeat))
+        results[name] = {"size": size, "seconds": seconds, "ns": seconds * 1e9 / size}
+        print(f"{name:<24} {size:>10} items {results[name]['ns']:10.1f} ns per item")
+    return results
+
+
+def compare(
+    results: dict[str, dict[str, Any]],
+    baseline: dict[str, dict[str, Any]],
+    threshold: float,
+) -> list[str]:
+    """Print comparison with baseline and return names of regressed benchmarks."""
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        ratio = result["ns"] / baseline[name]["ns"]
+        regressed = ratio > 1 + threshold
+        if regressed:
+            regressions.append(name)
+        status = "REGRESSION" if regressed else "ok"
+        print(
+            f"{name:<24} {baseline[name]['ns']:10.1f} ns -> "
+            f"{result['ns']:10.1f} ns ({ratio:.2f}x) {status}"
+        )
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run benchmarks and return exit status."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "-k",
+        dest="filter",
+        default="",
+        help="run only benchmarks with names containing this string",
+    )
+    parser.add_argument(
+        "--scale", type=float, default=1.0, help="multiplier of workload sizes"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="number of repeats")
+    parser.add_argument("--output", help="JSON file to write results to")
+    parser.add_argument("--baseline", help="JSON file of results to compare with")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="allowed slowdown relative to baseline, such as 0.1 for 10%%",
+    )
+    args = parser.parse_args(argv)
+
+    names = [name for name in _benchmarks if args.filter in name]
+    epiweeks._year_table("cdc")  # Exclude table building from timings
+    epiweeks._year_table("iso")
+    results = run(names, args.scale, args.repeat)
+    if args.output:
+        try:
+            package_version = version("epiweeks")
+        except PackageNotFoundError:
+            package_version = None
+        report = {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "epiweeks": package_version,
+            "scale": args.scale,
+            "results": results,
+        }
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)["results"]
+        if compare(results, baseline, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
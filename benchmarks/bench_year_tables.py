@@ -0,0 +1,83 @@
+"""Benchmark year tables against on-the-fly year start arithmetic.
+
+Run from the repository root with ``python benchmarks/bench_year_tables.py``.
+"""
+
+import timeit
+
+from datetime import date
+
+import epiweeks
+
+from epiweeks import Week
+
+
+def reference_year_start(year: int, system: str) -> int:
+    """Return ordinal for first day of first week as computed before tables."""
+    adjustment = epiweeks._system_adjustment(system)
+    mid_weekday = 3 - adjustment
+    jan1 = date(year, 1, 1)
+    jan1_ordinal = jan1.toordinal()
+    jan1_weekday = jan1.weekday()
+    week1_start_ordinal = jan1_ordinal - jan1_weekday - adjustment
+    if jan1_weekday > mid_weekday:
+        week1_start_ordinal += 7
+    return week1_start_ordinal
+
+
+def reference_fromdate(date_object: date, system: str = "cdc") -> Week:
+    """Construct Week object from a date as done before tables."""
+    epiweeks._check_system(system)
+    min_weeks_per_year = 52
+    year = date_object.year
+    date_ordinal = date_object.toordinal()
+    week = (date_ordinal - reference_year_start(year, system)) // 7
+    if week < 0:
+        year -= 1
+        week = (date_ordinal - reference_year_start(year, system)) // 7
+    elif week >= min_weeks_per_year:
+        if date_ordinal >= reference_year_start(year + 1, system):
+            year += 1
+            week = 0
+    return Week(year, week + 1, system, validate=False)
+
+
+def reference_week(year: int, week: int, system: str = "cdc") -> Week:
+    """Construct validated Week object as done before tables."""
+    epiweeks._check_year(year)
+    epiweeks._check_system(system)
+    start = reference_year_start(year, system)
+    max_weeks = (reference_year_start(year + 1, system) - start) // 7
+    if not 1 <= week <= max_weeks:
+        message = f"Week must be in 1..{max_weeks} for year"
+        raise ValueError(message)
+    return Week(year, week, system, validate=False)
+
+
+def main(number: int = 200_000) -> None:
+    """Print timings of table lookups compared to reference arithmetic."""
+    start = date(2000, 1, 1).toordinal()
+    dates = [date.fromordinal(start + i % 9000) for i in range(number)]
+    weeks = [(2000 + i % 25, 1 + i % 52) for i in range(number)]
+    cases = {
+        "fromdate": (
+            lambda: [reference_fromdate(d) for d in dates],
+            lambda: [Week.fromdate(d) for d in dates],
+        ),
+        "validated construction": (
+            lambda: [reference_week(y, w) for y, w in weeks],
+            lambda: [Week(y, w) for y, w in weeks],
+        ),
+    }
+    epiweeks._year_table("cdc")  # Exclude table building from timings
+    for name, (reference, tables) in cases.items():
+        before = min(timeit.repeat(reference, number=1, repeat=5))
+        after = min(timeit.repeat(tables, number=1, repeat=5))
+        print(
+            f"{name:<24} {before * 1e9 / number:8.0f} ns -> "
+            f"{after * 1e9 / number:8.0f} ns ({before / after:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
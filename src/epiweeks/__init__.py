@@ -5,16 +5,124 @@ Based on the US CDC (MMWR) and ISO week numbering systems.
 https://github.com/dralshehri/epiweeks
 """
 
-from collections.abc import Iterator
-from datetime import date, timedelta
+import os
+import sys
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter, OrderedDict
+from collections.abc import Callable, Iterable, Iterator
+from datetime import date, datetime, timedelta, timezone, tzinfo
+from functools import wraps
+from itertools import pairwise
+from threading import Lock
+from types import FunctionType
+from typing import Any, Literal, NamedTuple, cast, overload
+
+__all__ = [
+    "CDC",
+    "ISO",
+    "CacheInfo",
+    "Season",
+    "Week",
+    "WeekArray",
+    "WeekBucket",
+    "WeekBucketer",
+    "WeekRange",
+    "WeekSystem",
+    "Year",
+    "cache_clear",
+    "cache_info",
+    "disable_cache",
+    "disable_stats",
+    "enable_cache",
+    "enable_stats",
+    "register_system",
+    "stats",
+    "unregister_system",
+]
+
+
+class WeekSystem(str):
+    """A WeekSystem object represents a week numbering system.
+
+    It is a string of the upper-case system name, so that it compares equal
+    to the name as used before, while carrying values and tables that are
+    otherwise looked up for each calculation. Passing a WeekSystem object,
+    such as ``CDC`` or ``ISO``, wherever a system name is accepted avoids
+    resolving the name on each call. Other systems can be defined with
+    ``register_system``.
+    """
+
+    _name: str
+    _startweekday: int
+    _firstweek: str
+    _adjustment: int
+    _offset: int
+    _year_table: "_YearTable | None"
+    _serial_range: range
+    _ordinal_range: range
+    _day_table: "_DayTable | None"
+
+    def __new__(
+        cls, name: str, startweekday: int, firstweek: str = "fourdays"
+    ) -> "WeekSystem":
+        """Construct WeekSystem object.
 
-__all__ = ["Week", "Year"]
+        Args:
+            name: Name of week numbering system.
+            startweekday: Week day on which weeks start, which may be
+                ``0..6`` where Monday is 0 and Sunday is 6.
+            firstweek: Rule of first week of year, which may be ``firstday``
+                for week containing 1 January, ``fourdays`` for first week
+                with four or more days in year, or ``fullweek`` for first
+                week with all days in year.
+
+        Raises:
+            ValueError: When ``startweekday`` is out of weekdays range.
+            ValueError: When ``firstweek`` is not within supported rules.
+        """
+        if not 0 <= startweekday <= 6:  # noqa: PLR2004
+            message = "Start weekday must be in 0..6"
+            raise ValueError(message)
+        if firstweek not in _FIRST_WEEK_DAYS:
+            message = f"First week must be in {tuple(_FIRST_WEEK_DAYS)}"
+            raise ValueError(message)
+        system = super().__new__(cls, name.upper())
+        system._name = name.lower()
+        system._startweekday = startweekday
+        system._firstweek = firstweek
+        system._adjustment = (7 - startweekday) % 7
+        system._offset = (startweekday + 1) % 7
+        system._year_table = None
+        system._serial_range = range(0)
+        system._ordinal_range = range(0)
+        system._day_table = None
+        return system
+
+    def __reduce__(self) -> tuple[object, tuple[str]]:
+        return _get_system, (self._name,)
+
+    @property
+    def name(self) -> str:
+        """Return lower-case name of system as a string."""
+        return self._name
+
+    @property
+    def startweekday(self) -> int:
+        """Return week day on which weeks start, where Monday is 0."""
+        return self._startweekday
+
+    @property
+    def firstweek(self) -> str:
+        """Return rule of first week of year as a string."""
+        return self._firstweek
 
 
 class Week:
     """A Week object represents a week in epidemiological week calendar."""
 
-    __slots__ = "_system", "_week", "_year"
+    __slots__ = "_serial", "_system", "_week", "_year"
 
     def __init__(
         self, year: int, week: int, system: str = "cdc", *, validate: bool = True
@@ -27,21 +135,34 @@ class Week:
             system: Week numbering system, which may be ``cdc`` where the
                 week starts on Sunday or ``iso`` where the week starts on
                 Monday.
-            validate: Whether to validate year, week and system or not.
+            validate: Whether to validate year and week or not. The system
+                is always resolved and validated.
 
         Raises:
             ValueError: When ``year`` is out of supported range.
             ValueError: When ``week`` is out of weeks range for year.
-            ValueError: When ``system`` is not within supported systems.
+            ValueError: When ``system`` is not within supported systems, even
+                if ``validate`` is false.
         """
+        if system.__class__ is not WeekSystem:
+            system = _systems.get(system) or _get_system(system)
+        table = system._year_table or _year_table(system)
         if validate:
-            _check_year(year)
-            _check_system(system)
-            _check_week(year, week, system)
+            if not 1 <= year <= _MAX_YEAR:
+                _check_year(year)
+            if not 1 <= week <= table[1][year]:
+                _check_week(year, week, system)
+            start = table[0][year]
+        elif 0 <= year <= _MAX_YEAR + 1:
+            start = table[0][year]
+        else:
+            firstday = _FIRST_WEEK_DAYS[system._firstweek]
+            start = _compute_year_start(year, system._startweekday, firstday)
 
         self._year = year
         self._week = week
-        self._system = system.upper()
+        self._system = system
+        self._serial = start // 7 + week - 1
 
     def __repr__(self) -> str:
         class_name = self.__class__.__name__
@@ -87,22 +208,28 @@ class Week:
                 f"numbering systems: '{self._system}' and '{other.system}'"
             )
             raise TypeError(message)
-        self_week = self.weektuple()
-        other_week = other.weektuple()
-        return 0 if self_week == other_week else 1 if self_week > other_week else -1
+        return (self._serial > other._serial) - (self._serial < other._serial)
 
     def __add__(self, other: int) -> "Week":
         if not isinstance(other, int):
             other_type = type(other).__name__
             message = f"Second operand must be 'int': {other_type}"
             raise TypeError(message)
-        new_date = self.startdate() + timedelta(weeks=other)
-        return self.__class__.fromdate(new_date, self._system)
+        return self.__class__.fromserial(self._serial + other, self._system)
+
+    @overload
+    def __sub__(self, other: int) -> "Week": ...
 
-    def __sub__(self, other: int) -> "Week":
+    @overload
+    def __sub__(self, other: "Week") -> int: ...
+
+    def __sub__(self, other: "int | Week") -> "Week | int":
+        if isinstance(other, Week):
+            self._compare(other)
+            return self._serial - other._serial
         if not isinstance(other, int):
             other_type = type(other).__name__
-            message = f"Second operand must be 'int': {other_type}"
+            message = f"Second operand must be 'int' or 'Week': {other_type}"
             raise TypeError(message)
         return self.__add__(-other)
 
@@ -111,7 +238,44 @@ class Week:
             other_type = type(other).__name__
             message = f"Tested operand must be 'datetime.date' object: {other_type}"
             raise TypeError(message)
-        return other in self.iterdates()
+        return (other.toordinal() - self._system._offset) // 7 == self._serial
+
+    def __reduce__(self) -> tuple[object, tuple[type, int, WeekSystem]]:
+        return _unpickle_week, (self.__class__, self._serial, self._system)
+
+    def __setstate__(self, state: tuple[None, dict[str, Any]]) -> None:
+        """Restore Week object pickled by versions before week serial numbers."""
+        slots = state[1]
+        year, week, system = slots["_year"], slots["_week"], slots["_system"]
+        Week.__init__(self, year, week, system, validate=False)
+
+    @classmethod
+    def _new(cls, year: int, week: int, system: WeekSystem, serial: int) -> "Week":
+        """Construct Week object from already validated values."""
+        week_object = cls.__new__(cls)
+        week_object._year = year
+        week_object._week = week
+        week_object._system = system
+        week_object._serial = serial
+        return week_object
+
+    @classmethod
+    def _cached(
+        cls, year: int, week: int, system: str, *, validate: bool = False
+    ) -> "Week":
+        """Construct Week object or return shared one when cache is enabled.
+
+        Values must be already validated unless ``validate`` is true, so that
+        invalid weeks are never cached.
+        """
+        cache = _instance_cache
+        if cache is None:
+            return cls(year, week, system, validate=validate)
+        key = cls, year, week, _get_system(system)
+        week_object = cache.get(key)
+        if week_object is None:
+            week_object = cache.add(key, cls(year, week, system, validate=validate))
+        return cast("Week", week_object)
 
     @classmethod
     def fromdate(cls, date_object: date, system: str = "cdc") -> "Week":
@@ -123,23 +287,107 @@ class Week:
                 week starts on Sunday or ``iso`` where the week starts on
                 Monday.
         """
-        _check_system(system)
-        min_weeks_per_year = 52
-        year = date_object.year
-        date_ordinal = date_object.toordinal()
-        year_start_ordinal = _year_start(year, system)
-        week = (date_ordinal - year_start_ordinal) // 7
-        if week < 0:
-            year -= 1
-            year_start_ordinal = _year_start(year, system)
-            week = (date_ordinal - year_start_ordinal) // 7
-        elif week >= min_weeks_per_year:
-            year_start_ordinal = _year_start(year + 1, system)
-            if date_ordinal >= year_start_ordinal:
-                year += 1
-                week = 0
-        week += 1
-        return cls(year, week, system, validate=False)
+        system = _get_system(system)
+        ordinal = date_object.toordinal()
+        year, week = _ordinal_weektuple(ordinal, system)
+        if _instance_cache is None:
+            return cls._new(year, week, system, (ordinal - system._offset) // 7)
+        return cls._cached(year, week, system)
+
+    @classmethod
+    def fromordinal(cls, ordinal: int, system: str = "cdc") -> "Week":
+        """Construct Week object from a date ordinal without creating a date.
+
+        Args:
+            ordinal: Proleptic Gregorian ordinal as returned by
+                ``date.toordinal``.
+            system: Week numbering system, which may be ``cdc`` where the
+                week starts on Sunday or ``iso`` where the week starts on
+                Monday.
+
+        Raises:
+            ValueError: When ``ordinal`` is out of supported range.
+            ValueError: When ``system`` is not within supported systems.
+        """
+        system = _get_system(system)
+        if not 1 <= ordinal <= _MAX_ORDINAL:
+            _check_ordinal(ordinal, system)
+        year, week = _ordinal_weektuple(ordinal, system)
+        if _instance_cache is None:
+            return cls._new(year, week, system, (ordinal - system._offset) // 7)
+        return cls._cached(year, week, system)
+
+    @classmethod
+    def fromepochday(cls, epochday: int, system: str = "cdc") -> "Week":
+        """Construct Week object from number of days since 1970-01-01.
+
+        Args:
+            epochday: Number of days since 1 January 1970, as in ``date32``
+                columns and ``datetime64[D]`` arrays.
+            system: Week numbering system, which may be ``cdc`` where the
+                week starts on Sunday or ``iso`` where the week starts on
+                Monday.
+
+        Raises:
+            ValueError: When ``epochday`` is for a date out of supported range.
+            ValueError: When ``system`` is not within supported systems.
+        """
+        return cls.fromordinal(epochday + _EPOCH_ORDINAL, system)
+
+    @classmethod
+    def fromtimestamp(
+        cls, timestamp: float, system: str = "cdc", *, tz: tzinfo | None = None
+    ) -> "Week":
+        """Construct Week object from a POSIX timestamp.
+
+        Dates of timestamps are calculated with integer arithmetic when
+        ``tz`` is a fixed-offset ``datetime.timezone``, such as
+        ``timezone.utc``, and as in ``datetime.fromtimestamp`` otherwise.
+
+        Args:
+            timestamp: Number of seconds since 1970-01-01 00:00:00 UTC.
+            system: Week numbering system, which may be ``cdc`` where the
+                week starts on Sunday or ``iso`` where the week starts on
+                Monday.
+            tz: Time zone in which to take date of timestamp, where ``None``
+                is the local time zone.
+
+        Raises:
+            ValueError: When ``timestamp`` is for a date out of supported range.
+            ValueError: When ``system`` is not within supported systems.
+        """
+        if isinstance(tz, timezone):
+            offset = tz.utcoffset(None)
+            seconds = timestamp + offset.days * 86400 + offset.seconds
+            return cls.fromordinal(int(seconds // 86400) + _EPOCH_ORDINAL, system)
+        ordinal = datetime.fromtimestamp(timestamp, tz).toordinal()
+        return cls.fromordinal(ordinal, system)
+
+    @classmethod
+    def fromserial(cls, serial: int, system: str = "cdc") -> "Week":
+        """Construct Week object from an absolute week serial number.
+
+        Args:
+            serial: Week serial number as returned by ``toserial``.
+            system: Week numbering system, which may be ``cdc`` where the
+                week starts on Sunday or ``iso`` where the week starts on
+                Monday.
+
+        Raises:
+            ValueError: When ``serial`` is for a week out of supported range.
+            ValueError: When ``system`` is not within supported systems.
+        """
+        system = _get_system(system)
+        if system._year_table is None:
+            _year_table(system)
+        serials = system._serial_range
+        if serial not in serials:
+            message = f"Serial must be in {serials.start}..{serials.stop - 1}"
+            raise ValueError(message)
+        year, week = _ordinal_weektuple(serial * 7 + system._offset, system)
+        if _instance_cache is None:
+            return cls._new(year, week, system, serial)
+        return cls._cached(year, week, system)
 
     @classmethod
     def fromstring(
@@ -154,12 +402,113 @@ class Week:
             system: Week numbering system, which may be ``cdc`` where the
                 week starts on Sunday or ``iso`` where the week starts on
                 Monday.
-            validate: Whether to validate year, week and system or not.
+            validate: Whether to validate year and week or not. The system
+                is always resolved and validated.
         """
         week_string = week_string.replace("-", "").replace("W", "")
         year = int(week_string[0:4])
         week = int(week_string[4:6])
-        return cls(year, week, system, validate=validate)
+        if not validate:
+            return cls(year, week, system, validate=False)
+        return cls._cached(year, week, system, validate=True)
+
+    @overload
+    @classmethod
+    def fromstrings(
+        cls,
+        week_strings: Iterable[str],
+        system: str = ...,
+        *,
+        errors: Literal["raise"] = ...,
+    ) -> list["Week"]: ...
+
+    @overload
+    @classmethod
+    def fromstrings(
+        cls,
+        week_strings: Iterable[str],
+        system: str = ...,
+        *,
+        errors: Literal["coerce"],
+    ) -> list["Week | None"]: ...
+
+    @overload
+    @classmethod
+    def fromstrings(
+        cls,
+        week_strings: Iterable[str],
+        system: str = ...,
+        *,
+        errors: Literal["collect"],
+    ) -> tuple[list["Week"], list[tuple[int, str]]]: ...
+
+    @classmethod
+    def fromstrings(
+        cls,
+        week_strings: Iterable[str],
+        system: str = "cdc",
+        *,
+        errors: Literal["raise", "coerce", "collect"] = "raise",
+    ) -> (
+        list["Week"] | list["Week | None"] | tuple[list["Week"], list[tuple[int, str]]]
+    ):
+        """Construct Week objects from a sequence of formatted strings.
+
+        Strings are parsed as in ``fromstring`` and validated in one pass,
+        which is faster than calling ``fromstring`` for each string.
+
+        Args:
+            week_strings: Week strings formatted as ``YYYYww``, ``YYYYWww``,
+                or ``YYYY-Www``.
+            system: Week numbering system, which may be ``cdc`` where the
+                week starts on Sunday or ``iso`` where the week starts on
+                Monday.
+            errors: How to handle invalid strings, which may be ``raise`` to
+                raise an exception, ``coerce`` to return ``None`` in place of
+                invalid weeks, or ``collect`` to return a tuple of valid weeks
+                and a list of (index, message) tuples for invalid strings.
+
+        Raises:
+            ValueError: When a string is invalid and ``errors`` is ``raise``.
+            ValueError: When ``system`` is not within supported systems.
+            ValueError: When ``errors`` is not within supported values.
+        """
+        system = _get_system(system)
+        if errors not in ("raise", "coerce", "collect"):
+            message = "Errors must be in ('raise', 'coerce', 'collect')"
+            raise ValueError(message)
+        year_starts, year_weeks = _year_table(system)
+        weeks: list[Week | None] = []
+        invalid: list[tuple[int, str]] = []
+        for index, week_string in enumerate(week_strings):
+            try:
+                compact_string = week_string.replace("-", "").replace("W", "")
+                year = int(compact_string[0:4])
+                week = int(compact_string[4:6])
+                if not 1 <= year <= _MAX_YEAR:
+                    message = f"Year must be in 1..{_MAX_YEAR}"
+                    raise ValueError(message)
+                max_weeks = year_weeks[year]
+                if not 1 <= week <= max_weeks:
+                    message = f"Week must be in 1..{max_weeks} for year"
+                    raise ValueError(message)
+            except (AttributeError, TypeError, ValueError) as e:
+                if errors == "raise":
+                    message = f"Invalid week string at index {index}: {e}"
+                    raise ValueError(message) from e
+                if errors == "coerce":
+                    weeks.append(None)
+                else:
+                    invalid.append((index, str(e)))
+                continue
+            if _instance_cache is not None:
+                weeks.append(cls._cached(year, week, system))
+                continue
+            serial = year_starts[year] // 7 + week - 1
+            weeks.append(cls._new(year, week, system, serial))
+        if errors == "collect":
+            return cast("list[Week]", weeks), invalid
+        return weeks
 
     @classmethod
     def thisweek(cls, system: str = "cdc") -> "Week":
@@ -183,14 +532,47 @@ class Week:
         return self._week
 
     @property
-    def system(self) -> str:
-        """Return week numbering system as a string."""
+    def system(self) -> WeekSystem:
+        """Return week numbering system as a WeekSystem object."""
         return self._system
 
     def weektuple(self) -> tuple[int, int]:
         """Return week as a tuple of (year, week)."""
         return self._year, self._week
 
+    def toserial(self) -> int:
+        """Return week as an absolute serial number.
+
+        Serial numbers count weeks continuously across years, so that
+        consecutive weeks have consecutive serial numbers within the same
+        week numbering system.
+        """
+        return self._serial
+
+    def tosystem(self, system: str) -> "Week":
+        """Return equivalent week in another week numbering system.
+
+        The equivalent week is the week of ``system`` that overlaps four or
+        more days of this week, which is the week containing its middle
+        day. Weeks of the CDC and ISO systems are shifted by one day, so
+        that each week overlaps six days of its equivalent week, and both
+        have the same week serial number. Around the start of years, the
+        equivalent week may have a different week number and year, such as
+        week ``2014-W53`` in CDC system that is week ``2015-W01`` in ISO
+        system, and week ``2015-W01`` in CDC system that is week
+        ``2015-W02`` in ISO system.
+
+        Args:
+            system: Week numbering system of equivalent week.
+
+        Raises:
+            ValueError: When equivalent week is out of supported range.
+            ValueError: When ``system`` is not within supported systems.
+        """
+        system = _get_system(system)
+        serial = self._serial + _serial_shift(self._system, system)
+        return self.__class__.fromserial(serial, system)
+
     def cdcformat(self) -> str:
         """Return a string representing the week in CDC format ``YYYYww``."""
         return f"{self._year:04}{self._week:02}"
@@ -199,12 +581,13 @@ class Week:
         """Return a string representing the week in ISO compact format ``YYYYWww``."""
         return f"{self._year:04}W{self._week:02}"
 
+    def startordinal(self) -> int:
+        """Return date ordinal for first day of week."""
+        return self._serial * 7 + self._system._offset
+
     def startdate(self) -> date:
         """Return date for first day of week."""
-        year_start_ordinal = _year_start(self._year, self._system)
-        week_start_ordinal = year_start_ordinal + ((self._week - 1) * 7)
-        startdate = date.fromordinal(week_start_ordinal)
-        return startdate
+        return date.fromordinal(self.startordinal())
 
     def enddate(self) -> date:
         """Return date for last day of week."""
@@ -224,14 +607,18 @@ class Week:
             weekday: Week day, which may be ``0..6`` where Monday is 0 and
                 Sunday is 6.
         """
-        diff = (_system_adjustment(self._system) + weekday) % 7
+        diff = (self._system._adjustment + weekday) % 7
         return self.startdate() + timedelta(days=diff)
 
 
 class Year:
-    """A Year object represents a year in epidemiological week calendar."""
+    """A Year object represents a year in epidemiological week calendar.
 
-    __slots__ = "_system", "_year"
+    It behaves like a sequence of its weeks, where weeks are only created
+    when accessed, so that week N of a year is ``year[N - 1]``.
+    """
+
+    __slots__ = "_start", "_system", "_totalweeks", "_year"
 
     def __init__(self, year: int, system: str = "cdc"):
         """Initialize Year object.
@@ -247,9 +634,12 @@ class Year:
             ValueError: When ``system`` is not within supported systems.
         """
         _check_year(year)
-        _check_system(system)
+        system = _get_system(system)
+        year_starts, year_weeks = system._year_table or _year_table(system)
         self._year = year
-        self._system = system.upper()
+        self._system = system
+        self._start = year_starts[year]
+        self._totalweeks = year_weeks[year]
 
     def __repr__(self) -> str:
         class_name = self.__class__.__name__
@@ -261,6 +651,118 @@ class Year:
     def __hash__(self) -> int:
         return hash((self._year, self._system))
 
+    def __reduce__(self) -> tuple[type, tuple[int, WeekSystem]]:
+        return self.__class__, (self._year, self._system)
+
+    def __setstate__(self, state: tuple[None, dict[str, Any]]) -> None:
+        """Restore Year object pickled by versions before year tables."""
+        slots = state[1]
+        Year.__init__(self, slots["_year"], slots["_system"])
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        return self._year == other._year and self._system == other._system
+
+    def __gt__(self, other: object) -> bool:
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        return self._compare(other) > 0
+
+    def __ge__(self, other: object) -> bool:
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        return self._compare(other) >= 0
+
+    def __lt__(self, other: object) -> bool:
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        return self._compare(other) < 0
+
+    def __le__(self, other: object) -> bool:
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        return self._compare(other) <= 0
+
+    def _compare(self, other: "Year") -> int:
+        """Order two Year objects after checking if they are comparable.
+
+        Years of different numbering systems are not equal, but can not be
+        ordered.
+        """
+        class_name = self.__class__.__name__
+        if self._system != other.system:
+            message = (
+                f"Can not compare '{class_name}' objects with different "
+                f"numbering systems: '{self._system}' and '{other.system}'"
+            )
+            raise TypeError(message)
+        return (self._year > other._year) - (self._year < other._year)
+
+    def __add__(self, other: int) -> "Year":
+        if not isinstance(other, int):
+            other_type = type(other).__name__
+            message = f"Second operand must be 'int': {other_type}"
+            raise TypeError(message)
+        return self.__class__(self._year + other, self._system)
+
+    @overload
+    def __sub__(self, other: int) -> "Year": ...
+
+    @overload
+    def __sub__(self, other: "Year") -> int: ...
+
+    def __sub__(self, other: "int | Year") -> "Year | int":
+        if isinstance(other, Year):
+            self._compare(other)
+            return self._year - other._year
+        if not isinstance(other, int):
+            other_type = type(other).__name__
+            message = f"Second operand must be 'int' or 'Year': {other_type}"
+            raise TypeError(message)
+        return self.__add__(-other)
+
+    def __len__(self) -> int:
+        return self._totalweeks
+
+    def __iter__(self) -> Iterator[Week]:
+        return self.iterweeks()
+
+    def __reversed__(self) -> Iterator[Week]:
+        for week in range(self._totalweeks, 0, -1):
+            yield Week._cached(self._year, week, self._system)
+
+    def __contains__(self, other: object) -> bool:
+        if not isinstance(other, Week) or other.system != self._system:
+            return False
+        return other.year == self._year
+
+    @overload
+    def __getitem__(self, index: int) -> Week: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "WeekRange": ...
+
+    def __getitem__(self, index: int | slice) -> "Week | WeekRange":
+        if isinstance(index, slice):
+            return WeekRange._fromrange(self._serials()[index], self._system)
+        week = range(1, self._totalweeks + 1)[index]
+        return Week._cached(self._year, week, self._system)
+
+    @classmethod
+    def fromdate(cls, date_object: date, system: str = "cdc") -> "Year":
+        """Construct Year object from a date.
+
+        Args:
+            date_object: Python date object.
+            system: Week numbering system, which may be ``cdc`` where the
+                week starts on Sunday or ``iso`` where the week starts on
+                Monday.
+        """
+        system = _get_system(system)
+        year = _ordinal_weektuple(date_object.toordinal(), system)[0]
+        return cls._cached(year, system)
+
     @classmethod
     def thisyear(cls, system: str = "cdc") -> "Year":
         """Construct Year object from current date.
@@ -270,7 +772,19 @@ class Year:
                 week starts on Sunday or ``iso`` where the week starts on
                 Monday.
         """
-        return cls(date.today().year, system)
+        return cls._cached(date.today().year, system)
+
+    @classmethod
+    def _cached(cls, year: int, system: str) -> "Year":
+        """Construct Year object or return shared one when cache is enabled."""
+        cache = _instance_cache
+        if cache is None:
+            return cls(year, system)
+        key = cls, year, _get_system(system)
+        year_object = cache.get(key)
+        if year_object is None:
+            year_object = cache.add(key, cls(year, system))
+        return cast("Year", year_object)
 
     @property
     def year(self) -> int:
@@ -278,76 +792,1392 @@ class Year:
         return self._year
 
     @property
-    def system(self) -> str:
-        """Return week numbering system as a string."""
+    def system(self) -> WeekSystem:
+        """Return week numbering system as a WeekSystem object."""
         return self._system
 
     def totalweeks(self) -> int:
         """Return number of weeks in year."""
-        return _year_total_weeks(self._year, self._system)
+        return self._totalweeks
 
     def startdate(self) -> date:
         """Return date for first day of first week of year."""
-        year_start_ordinal = _year_start(self._year, self._system)
-        return date.fromordinal(year_start_ordinal)
+        return date.fromordinal(self._start)
 
     def enddate(self) -> date:
         """Return date for last day of last week of year."""
-        year_end_ordinal = _year_start(self._year + 1, self._system) - 1
-        return date.fromordinal(year_end_ordinal)
+        return date.fromordinal(self._start + self._totalweeks * 7 - 1)
 
     def iterweeks(self) -> Iterator[Week]:
         """Return an iterator that yield Week objects for all weeks of year."""
-        for week in range(1, self.totalweeks() + 1):
-            yield Week(self._year, week, self._system, validate=False)
+        for week in range(1, self._totalweeks + 1):
+            yield Week._cached(self._year, week, self._system)
 
+    def _serials(self) -> range:
+        """Return range of week serial numbers of weeks of year."""
+        first = self._start // 7
+        return range(first, first + self._totalweeks)
 
-def _check_year(year: int) -> None:
-    """Check value of year."""
-    max_years = 9999
-    if not 1 <= year <= max_years:
-        message = f"Year must be in 1..{max_years}"
-        raise ValueError(message)
 
+class Season:
+    """A Season object represents a surveillance season spanning two years.
 
-def _check_week(year: int, week: int, system: str) -> None:
-    """Check value of week."""
-    max_weeks = _year_total_weeks(year, system)
-    if not 1 <= week <= max_weeks:
-        message = f"Week must be in 1..{max_weeks} for year"
-        raise ValueError(message)
+    A season starts on a start week of a year and ends on the week before
+    start week of next year, such as week 40 to week 39 of influenza
+    seasons, and is named after the year in which it starts. It behaves
+    like a sequence of its weeks, so that season week N is ``season[N - 1]``.
+    """
 
+    __slots__ = "_start", "_startweek", "_system", "_totalweeks", "_year"
 
-def _check_system(system: str) -> None:
-    """Check value of week numbering system."""
-    systems = ("cdc", "iso")
-    if system.lower() not in systems:
-        message = f"System must be in {systems}"
-        raise ValueError(message)
+    def __init__(self, year: int, system: str = "cdc", startweek: int = 40):
+        """Initialize Season object.
 
+        Args:
+            year: Epidemiological year in which season starts.
+            system: Week numbering system, which may be ``cdc`` where the
+                week starts on Sunday or ``iso`` where the week starts on
+                Monday.
+            startweek: Week of year on which season starts.
 
-def _system_adjustment(system: str) -> int:
-    """Return needed adjustment based on week numbering system."""
-    systems = ("iso", "cdc")  # Monday, Sunday
-    return systems.index(system.lower())
+        Raises:
+            ValueError: When ``year`` is out of supported range.
+            ValueError: When ``startweek`` is out of weeks of all years.
+            ValueError: When ``system`` is not within supported systems.
+        """
+        _check_season(year, startweek)
+        system = _get_system(system)
+        year_starts = (system._year_table or _year_table(system))[0]
+        self._year = year
+        self._system = system
+        self._startweek = startweek
+        self._start = year_starts[year] // 7 + startweek - 1
+        self._totalweeks = year_starts[year + 1] // 7 + startweek - 1 - self._start
 
+    def __repr__(self) -> str:
+        class_name = self.__class__.__name__
+        return f"{class_name}({self._year}, {self._system}, {self._startweek})"
 
-def _year_start(year: int, system: str) -> int:
-    """Return ordinal for first day of first week for year."""
-    adjustment = _system_adjustment(system)
-    mid_weekday = 3 - adjustment  # Sun is 6 .. Mon is 0
-    jan1 = date(year, 1, 1)
-    jan1_ordinal = jan1.toordinal()
-    jan1_weekday = jan1.weekday()
-    week1_start_ordinal = jan1_ordinal - jan1_weekday - adjustment
-    if jan1_weekday > mid_weekday:
-        week1_start_ordinal += 7
-    return week1_start_ordinal
+    def __str__(self) -> str:
+        return f"{self._year:04}-{self._year + 1:04}"
 
+    def __hash__(self) -> int:
+        return hash((self._year, self._system, self._startweek))
 
-def _year_total_weeks(year: int, system: str) -> int:
-    """Return number of weeks in year."""
-    year_start_ordinal = _year_start(year, system)
-    next_year_start_ordinal = _year_start(year + 1, system)
-    weeks = (next_year_start_ordinal - year_start_ordinal) // 7
-    return weeks
+    def __reduce__(self) -> tuple[type, tuple[int, WeekSystem, int]]:
+        return self.__class__, (self._year, self._system, self._startweek)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        return (
+            self._year == other._year
+            and self._system == other._system
+            and self._startweek == other._startweek
+        )
+
+    def __gt__(self, other: object) -> bool:
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        return self._compare(other) > 0
+
+    def __ge__(self, other: object) -> bool:
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        return self._compare(other) >= 0
+
+    def __lt__(self, other: object) -> bool:
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        return self._compare(other) < 0
+
+    def __le__(self, other: object) -> bool:
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        return self._compare(other) <= 0
+
+    def _compare(self, other: "Season") -> int:
+        """Order two Season objects after checking if they are comparable.
+
+        Seasons of different numbering systems or start weeks are not equal,
+        but can not be ordered.
+        """
+        class_name = self.__class__.__name__
+        if self._system != other.system:
+            message = (
+                f"Can not compare '{class_name}' objects with different "
+                f"numbering systems: '{self._system}' and '{other.system}'"
+            )
+            raise TypeError(message)
+        if self._startweek != other.startweek:
+            message = (
+                f"Can not compare '{class_name}' objects with different "
+                f"start weeks: {self._startweek} and {other.startweek}"
+            )
+            raise TypeError(message)
+        return (self._year > other._year) - (self._year < other._year)
+
+    def __add__(self, other: int) -> "Season":
+        if not isinstance(other, int):
+            other_type = type(other).__name__
+            message = f"Second operand must be 'int': {other_type}"
+            raise TypeError(message)
+        return self.__class__(self._year + other, self._system, self._startweek)
+
+    @overload
+    def __sub__(self, other: int) -> "Season": ...
+
+    @overload
+    def __sub__(self, other: "Season") -> int: ...
+
+    def __sub__(self, other: "int | Season") -> "Season | int":
+        if isinstance(other, Season):
+            self._compare(other)
+            return self._year - other._year
+        if not isinstance(other, int):
+            other_type = type(other).__name__
+            message = f"Second operand must be 'int' or 'Season': {other_type}"
+            raise TypeError(message)
+        return self.__add__(-other)
+
+    def __len__(self) -> int:
+        return self._totalweeks
+
+    def __iter__(self) -> Iterator[Week]:
+        return self.iterweeks()
+
+    def __reversed__(self) -> Iterator[Week]:
+        for serial in reversed(self._serials()):
+            year, week = _serial_weektuple(serial, self._system)
+            yield Week._cached(year, week, self._system)
+
+    def __contains__(self, other: object) -> bool:
+        if not isinstance(other, Week) or other.system != self._system:
+            return False
+        return 0 <= other.toserial() - self._start < self._totalweeks
+
+    @overload
+    def __getitem__(self, index: int) -> Week: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "WeekRange": ...
+
+    def __getitem__(self, index: int | slice) -> "Week | WeekRange":
+        if isinstance(index, slice):
+            return WeekRange._fromrange(self._serials()[index], self._system)
+        year, week = _serial_weektuple(self._serials()[index], self._system)
+        return Week._cached(year, week, self._system)
+
+    @classmethod
+    def fromweek(cls, week_object: Week, startweek: int = 40) -> "Season":
+        """Construct Season object of season containing a week.
+
+        Args:
+            week_object: Week object, whose numbering system is used.
+            startweek: Week of year on which season starts.
+
+        Raises:
+            ValueError: When season of week is out of supported range.
+            ValueError: When ``startweek`` is out of weeks of all years.
+        """
+        year, week, system = week_object.year, week_object.week, week_object.system
+        season_year = _season_weektuple(year, week, system, startweek)[0]
+        return cls(season_year, system, startweek)
+
+    @classmethod
+    def fromdate(
+        cls, date_object: date, system: str = "cdc", startweek: int = 40
+    ) -> "Season":
+        """Construct Season object of season containing a date.
+
+        Args:
+            date_object: Python date object.
+            system: Week numbering system, which may be ``cdc`` where the
+                week starts on Sunday or ``iso`` where the week starts on
+                Monday.
+            startweek: Week of year on which season starts.
+
+        Raises:
+            ValueError: When season of date is out of supported range.
+            ValueError: When ``startweek`` is out of weeks of all years.
+            ValueError: When ``system`` is not within supported systems.
+        """
+        system = _get_system(system)
+        year, week = _ordinal_weektuple(date_object.toordinal(), system)
+        season_year = _season_weektuple(year, week, system, startweek)[0]
+        return cls(season_year, system, startweek)
+
+    @property
+    def year(self) -> int:
+        """Return year in which season starts as an integer."""
+        return self._year
+
+    @property
+    def system(self) -> WeekSystem:
+        """Return week numbering system as a WeekSystem object."""
+        return self._system
+
+    @property
+    def startweek(self) -> int:
+        """Return week of year on which season starts as an integer."""
+        return self._startweek
+
+    def totalweeks(self) -> int:
+        """Return number of weeks in season."""
+        return self._totalweeks
+
+    def startdate(self) -> date:
+        """Return date for first day of first week of season."""
+        return date.fromordinal(self._start * 7 + self._system._offset)
+
+    def enddate(self) -> date:
+        """Return date for last day of last week of season."""
+        stop = self._start + self._totalweeks
+        return date.fromordinal(stop * 7 + self._system._offset - 1)
+
+    def seasonweek(self, week_object: Week) -> int:
+        """Return number of a week within season, which starts from 1.
+
+        Args:
+            week_object: Week object within season.
+
+        Raises:
+            ValueError: When ``week_object`` is not within season.
+        """
+        if week_object not in self:
+            message = f"{week_object!r} is not in season {self}"
+            raise ValueError(message)
+        return week_object.toserial() - self._start + 1
+
+    def iterweeks(self) -> Iterator[Week]:
+        """Return an iterator that yield Week objects for all weeks of season."""
+        for serial in self._serials():
+            year, week = _serial_weektuple(serial, self._system)
+            yield Week._cached(year, week, self._system)
+
+    def _serials(self) -> range:
+        """Return range of week serial numbers of weeks of season."""
+        return range(self._start, self._start + self._totalweeks)
+
+
+class WeekRange:
+    """A WeekRange object represents an immutable range of weeks.
+
+    It behaves like the built-in ``range`` but for Week objects, where weeks
+    are only created when accessed and year boundaries are handled using
+    week serial numbers.
+    """
+
+    __slots__ = "_range", "_system"
+
+    def __init__(self, start: Week, stop: Week, step: int = 1):
+        """Initialize WeekRange object.
+
+        Args:
+            start: First week of range.
+            stop: Week at which range stops, which is not included in range.
+            step: Number of weeks between consecutive weeks of range.
+
+        Raises:
+            TypeError: When ``start`` and ``stop`` are not Week objects of
+                same numbering system.
+            ValueError: When ``step`` is zero.
+        """
+        if not isinstance(start, Week) or not isinstance(stop, Week):
+            message = "Start and stop must be 'Week' objects"
+            raise TypeError(message)
+        start._compare(stop)
+        if step == 0:
+            message = "Step must not be zero"
+            raise ValueError(message)
+        self._range = range(start.toserial(), stop.toserial(), step)
+        self._system = start.system
+
+    @classmethod
+    def fromdates(
+        cls,
+        startdate: date,
+        enddate: date,
+        system: str = "cdc",
+        *,
+        partial: bool = True,
+    ) -> "WeekRange":
+        """Construct WeekRange object of weeks overlapping a span of dates.
+
+        Weeks are calculated from date ordinals of both ends of span without
+        iterating its days, so that numbers of weeks fully and partially
+        within a span can be found from lengths of ranges returned with
+        ``partial`` set to false and true.
+
+        Args:
+            startdate: First date of span.
+            enddate: Last date of span, which is included in span.
+            system: Week numbering system, which may be ``cdc`` where the
+                week starts on Sunday or ``iso`` where the week starts on
+                Monday.
+            partial: Whether to include weeks that are only partially within
+                span or only weeks with all days within span.
+
+        Raises:
+            ValueError: When ``system`` is not within supported systems.
+        """
+        system = _get_system(system)
+        start = startdate.toordinal() - system._offset
+        end = enddate.toordinal() - system._offset
+        if partial:
+            first, stop = start // 7, end // 7 + 1
+        else:
+            first, stop = -(-start // 7), (end + 1) // 7
+        return cls._fromrange(range(first, max(first, stop)), system)
+
+    @classmethod
+    def _fromrange(cls, serials: range, system: WeekSystem) -> "WeekRange":
+        """Construct WeekRange object from a range of week serial numbers."""
+        week_range = cls.__new__(cls)
+        week_range._range = serials
+        week_range._system = system
+        return week_range
+
+    def __repr__(self) -> str:
+        class_name = self.__class__.__name__
+        start = self._endpoint(self._range.start)
+        stop = self._endpoint(self._range.stop)
+        return f"{class_name}({start!r}, {stop!r}, {self._range.step})"
+
+    def __hash__(self) -> int:
+        return hash((self._range, self._system))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        return self._range == other._range and self._system == other._system
+
+    def __len__(self) -> int:
+        return len(self._range)
+
+    def __iter__(self) -> Iterator[Week]:
+        for serial in self._range:
+            year, week = _serial_weektuple(serial, self._system)
+            yield Week._cached(year, week, self._system)
+
+    def __reversed__(self) -> Iterator[Week]:
+        return iter(self[::-1])
+
+    def __contains__(self, other: object) -> bool:
+        if not isinstance(other, Week) or other.system != self._system:
+            return False
+        return other.toserial() in self._range
+
+    @overload
+    def __getitem__(self, index: int) -> Week: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "WeekRange": ...
+
+    def __getitem__(self, index: int | slice) -> "Week | WeekRange":
+        if isinstance(index, slice):
+            return self._fromrange(self._range[index], self._system)
+        year, week = _serial_weektuple(self._range[index], self._system)
+        return Week._cached(year, week, self._system)
+
+    @property
+    def start(self) -> Week:
+        """Return first week of range."""
+        return self._endpoint(self._range.start)
+
+    @property
+    def stop(self) -> Week:
+        """Return week at which range stops.
+
+        The week is not validated, as ranges of weeks near the limits of
+        supported range may stop after or before it.
+        """
+        return self._endpoint(self._range.stop)
+
+    @property
+    def step(self) -> int:
+        """Return number of weeks between consecutive weeks of range."""
+        return self._range.step
+
+    @property
+    def system(self) -> WeekSystem:
+        """Return week numbering system as a WeekSystem object."""
+        return self._system
+
+    def tosystem(self, system: str) -> "WeekRange":
+        """Return range of equivalent weeks in another week numbering system.
+
+        Equivalent weeks are as returned by ``Week.tosystem``, which are
+        consecutive, so that the returned range has the same length and
+        step.
+
+        Args:
+            system: Week numbering system of equivalent weeks.
+
+        Raises:
+            ValueError: When ``system`` is not within supported systems.
+        """
+        system = _get_system(system)
+        shift = _serial_shift(self._system, system)
+        serials = self._range
+        shifted = range(serials.start + shift, serials.stop + shift, serials.step)
+        return self._fromrange(shifted, system)
+
+    def index(self, week: Week) -> int:
+        """Return index of week in range.
+
+        Args:
+            week: Week object to look for.
+
+        Raises:
+            ValueError: When ``week`` is not in range.
+        """
+        if week not in self:
+            message = f"{week!r} is not in range"
+            raise ValueError(message)
+        return self._range.index(week.toserial())
+
+    def count(self, week: Week) -> int:
+        """Return number of occurrences of week in range, which is 0 or 1.
+
+        Args:
+            week: Week object to count.
+        """
+        return int(week in self)
+
+    def _endpoint(self, serial: int) -> Week:
+        """Return unvalidated Week object of start or stop serial number."""
+        year, week = _extended_weektuple(serial, self._system)
+        return Week._new(year, week, self._system, serial)
+
+
+class WeekArray:
+    """A WeekArray object represents a compact array of weeks.
+
+    Weeks are stored as week serial numbers in a buffer of C integers, which
+    takes 4 bytes per week, and Week objects are only created when accessed.
+    Slicing returns a view that shares the buffer of the original array
+    without copying. Like ``array.array``, an array can not be resized while
+    its buffer is shared with a view or a ``memoryview``.
+    """
+
+    __slots__ = "_serials", "_system"
+
+    def __init__(self, weeks: Iterable[Week] = (), system: str = "cdc"):
+        """Initialize WeekArray object.
+
+        Args:
+            weeks: Week objects to initialize array with.
+            system: Week numbering system, which may be ``cdc`` where the
+                week starts on Sunday or ``iso`` where the week starts on
+                Monday.
+
+        Raises:
+            ValueError: When ``system`` is not within supported systems.
+            TypeError: When ``weeks`` are not Week objects of ``system``.
+        """
+        self._serials: array[int] | memoryview = array("i")
+        self._system = _get_system(system)
+        self.extend(weeks)
+
+    @classmethod
+    def fromserials(cls, serials: Iterable[int], system: str = "cdc") -> "WeekArray":
+        """Construct WeekArray object from week serial numbers.
+
+        Args:
+            serials: Week serial numbers as returned by ``Week.toserial``.
+            system: Week numbering system, which may be ``cdc`` where the
+                week starts on Sunday or ``iso`` where the week starts on
+                Monday.
+
+        Raises:
+            ValueError: When any of ``serials`` is out of supported range.
+            ValueError: When ``system`` is not within supported systems.
+        """
+        week_array = cls(system=system)
+        system = week_array._system
+        if system._year_table is None:
+            _year_table(system)
+        valid = system._serial_range
+        week_array._serials = array("i", serials)
+        if week_array._serials and (
+            min(week_array._serials) < valid.start
+            or max(week_array._serials) >= valid.stop
+        ):
+            message = f"Serial must be in {valid.start}..{valid.stop - 1}"
+            raise ValueError(message)
+        return week_array
+
+    def __repr__(self) -> str:
+        class_name = self.__class__.__name__
+        return f"{class_name}({self.tolist()!r}, {self._system})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        return self._system == other._system and self._serials == other._serials
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __len__(self) -> int:
+        return len(self._serials)
+
+    def __iter__(self) -> Iterator[Week]:
+        for serial in self._serials:
+            year, week = _serial_weektuple(serial, self._system)
+            yield Week._cached(year, week, self._system)
+
+    def __contains__(self, other: object) -> bool:
+        if not isinstance(other, Week) or other.system != self._system:
+            return False
+        return other.toserial() in self._serials
+
+    @overload
+    def __getitem__(self, index: int) -> Week: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "WeekArray": ...
+
+    def __getitem__(self, index: int | slice) -> "Week | WeekArray":
+        if isinstance(index, slice):
+            week_array = self.__class__(system=self._system)
+            week_array._serials = memoryview(self._serials)[index]
+            return week_array
+        year, week = _serial_weektuple(self._serials[index], self._system)
+        return Week._cached(year, week, self._system)
+
+    def __reduce__(self) -> tuple[object, tuple["array[int]", WeekSystem]]:
+        return self.__class__.fromserials, (array("i", self._serials), self._system)
+
+    def __buffer__(self, flags: int) -> memoryview:
+        """Return a read-only view of week serial numbers buffer.
+
+        The buffer protocol of Python classes requires Python 3.12 or later,
+        where ``memoryview(week_array)`` is equivalent to ``serials``.
+        """
+        return memoryview(self._serials).toreadonly()
+
+    @property
+    def system(self) -> WeekSystem:
+        """Return week numbering system as a WeekSystem object."""
+        return self._system
+
+    @property
+    def serials(self) -> memoryview:
+        """Return a read-only view of week serial numbers buffer."""
+        return memoryview(self._serials).toreadonly()
+
+    def append(self, week: Week) -> None:
+        """Append a week to the end of array.
+
+        Args:
+            week: Week object to append.
+
+        Raises:
+            TypeError: When ``week`` is not a Week object of array system.
+        """
+        self._check_week(week)
+        self._owned_serials().append(week.toserial())
+
+    def extend(self, weeks: Iterable[Week]) -> None:
+        """Append weeks to the end of array.
+
+        Args:
+            weeks: Week objects to append.
+
+        Raises:
+            TypeError: When ``weeks`` are not Week objects of array system.
+        """
+        serials = self._owned_serials()
+        if isinstance(weeks, WeekArray) and weeks.system == self._system:
+            serials.extend(weeks._serials)
+        elif isinstance(weeks, WeekRange) and weeks.system == self._system:
+            serials.extend(weeks._range)
+        else:
+            for week in weeks:
+                self._check_week(week)
+                serials.append(week.toserial())
+
+    def sort(self, *, reverse: bool = False) -> None:
+        """Sort weeks of array in place.
+
+        Args:
+            reverse: Whether to sort in descending order or not.
+        """
+        self._serials = array("i", sorted(self._serials, reverse=reverse))
+
+    def searchsorted(self, week: Week, side: Literal["left", "right"] = "left") -> int:
+        """Return index where week would be inserted to keep array sorted.
+
+        Args:
+            week: Week object to look for.
+            side: Which index to return if ``week`` is already in array, which
+                may be ``left`` for index of first occurrence or ``right`` for
+                index after last occurrence.
+
+        Raises:
+            TypeError: When ``week`` is not a Week object of array system.
+        """
+        self._check_week(week)
+        bisect = bisect_left if side == "left" else bisect_right
+        return bisect(self._serials, week.toserial())
+
+    def unique(self) -> "WeekArray":
+        """Return a new sorted array of unique weeks of array."""
+        return self.fromserials(sorted(set(self._serials)), self._system)
+
+    def counts(self) -> dict[Week, int]:
+        """Return a dictionary of unique weeks of array and their counts."""
+        counter = Counter(self._serials)
+        counts = {}
+        for serial in sorted(counter):
+            year, week = _serial_weektuple(serial, self._system)
+            counts[Week._cached(year, week, self._system)] = counter[serial]
+        return counts
+
+    def tosystem(self, system: str) -> "WeekArray":
+        """Return a new array of equivalent weeks in another numbering system.
+
+        Equivalent weeks are as returned by ``Week.tosystem``, and are
+        calculated by adding the same number to all week serial numbers,
+        which is zero between CDC and ISO systems.
+
+        Args:
+            system: Week numbering system of equivalent weeks.
+
+        Raises:
+            ValueError: When ``system`` is not within supported systems.
+        """
+        system = _get_system(system)
+        shift = _serial_shift(self._system, system)
+        if shift == 0:
+            return self.fromserials(self._serials, system)
+        return self.fromserials((serial + shift for serial in self._serials), system)
+
+    def toseasons(self, startweek: int = 40) -> tuple["array[int]", "array[int]"]:
+        """Return season years and season weeks of weeks of array.
+
+        Seasons are as in ``Season.fromweek``, and are calculated from week
+        serial numbers of first weeks of seasons, which are found from the
+        year table of system, without creating Week or Season objects.
+
+        Args:
+            startweek: Week of year on which seasons start.
+
+        Raises:
+            ValueError: When ``startweek`` is out of weeks of all years.
+            ValueError: When season year of any week is out of range.
+        """
+        _check_season(1, startweek)
+        year_starts = _year_table(self._system)[0]
+        offset, shift = self._system._offset, startweek - 1
+        season_years, season_weeks = array("i"), array("i")
+        for serial in self._serials:
+            ordinal = serial * 7 + offset
+            year = (ordinal - 1) * 400 // 146097 + 2  # Season year or after it
+            first = year_starts[year] // 7 + shift
+            while serial < first:
+                year -= 1
+                first = year_starts[year] // 7 + shift
+            season_years.append(year)
+            season_weeks.append(serial - first + 1)
+        if season_years and (min(season_years) < 1 or max(season_years) >= _MAX_YEAR):
+            message = f"Season year must be in 1..{_MAX_YEAR - 1}"
+            raise ValueError(message)
+        return season_years, season_weeks
+
+    def tolist(self) -> list[Week]:
+        """Return a list of Week objects for all weeks of array."""
+        return list(self)
+
+    def _check_week(self, week: object) -> None:
+        """Check that object is a Week object of array system."""
+        if not isinstance(week, Week) or week.system != self._system:
+            message = f"Item must be 'Week' object of '{self._system}' system"
+            raise TypeError(message)
+
+    def _owned_serials(self) -> "array[int]":
+        """Return serial numbers buffer after copying it if shared with view."""
+        if isinstance(self._serials, memoryview):
+            self._serials = array("i", self._serials)
+        return self._serials
+
+
+class WeekBucket(NamedTuple):
+    """Aggregated values of a week bucket.
+
+    Attributes:
+        n: Number of values added to bucket.
+        total: Sum of values added to bucket.
+    """
+
+    n: int
+    total: float
+
+
+class WeekBucketer:
+    """A WeekBucketer object aggregates a stream of values into weeks.
+
+    Values are added with their dates in any order, and only a count and a
+    total are kept for each week. Weeks are closed and emitted once a
+    watermark date passes their last day, and values for closed weeks are
+    counted as dropped.
+    """
+
+    __slots__ = "_buckets", "_closed", "_dropped", "_lateness", "_system"
+
+    def __init__(self, system: str = "cdc", *, lateness: int = 0):
+        """Initialize WeekBucketer object.
+
+        Args:
+            system: Week numbering system, which may be ``cdc`` where the
+                week starts on Sunday or ``iso`` where the week starts on
+                Monday.
+            lateness: Number of days after last day of week during which
+                late values are still accepted.
+
+        Raises:
+            ValueError: When ``system`` is not within supported systems.
+            ValueError: When ``lateness`` is negative.
+        """
+        if lateness < 0:
+            message = "Lateness must not be negative"
+            raise ValueError(message)
+        self._system = _get_system(system)
+        self._lateness = lateness
+        self._buckets: dict[int, list[float]] = {}
+        self._closed = (1 - self._system._offset) // 7  # Week of first date
+        self._dropped = 0
+
+    def __repr__(self) -> str:
+        class_name = self.__class__.__name__
+        return f"{class_name}({self._system}, lateness={self._lateness})"
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    @property
+    def system(self) -> WeekSystem:
+        """Return week numbering system as a WeekSystem object."""
+        return self._system
+
+    @property
+    def dropped(self) -> int:
+        """Return number of values dropped for arriving after weeks closed."""
+        return self._dropped
+
+    def add(self, date_object: date, value: float = 1) -> None:
+        """Add a value to bucket of week containing a date.
+
+        Args:
+            date_object: Python date object.
+            value: Value to add to total of week.
+        """
+        serial = (date_object.toordinal() - self._system._offset) // 7
+        if serial < self._closed:
+            self._dropped += 1
+            return
+        bucket = self._buckets.get(serial)
+        if bucket is None:
+            self._buckets[serial] = [1, value]
+        else:
+            bucket[0] += 1
+            bucket[1] += value
+
+    def update(self, items: Iterable[tuple[date, float]]) -> None:
+        """Add values to buckets of weeks containing their dates.
+
+        Args:
+            items: Iterable of (date, value) tuples.
+        """
+        offset = self._system._offset
+        closed = self._closed
+        buckets = self._buckets
+        for date_object, value in items:
+            serial = (date_object.toordinal() - offset) // 7
+            if serial < closed:
+                self._dropped += 1
+                continue
+            bucket = buckets.get(serial)
+            if bucket is None:
+                buckets[serial] = [1, value]
+            else:
+                bucket[0] += 1
+                bucket[1] += value
+
+    def merge(self, other: "WeekBucketer") -> None:
+        """Merge open buckets and dropped count of another bucketer.
+
+        This combines partial states of bucketers of different parts of a
+        stream. Buckets of weeks that are already closed are dropped.
+
+        Args:
+            other: WeekBucketer object of same numbering system.
+
+        Raises:
+            TypeError: When ``other`` is not a WeekBucketer object of same
+                numbering system.
+        """
+        if not isinstance(other, WeekBucketer) or other.system != self._system:
+            message = f"Other must be 'WeekBucketer' of '{self._system}' system"
+            raise TypeError(message)
+        closed = self._closed
+        buckets = self._buckets
+        self._dropped += other._dropped
+        for serial, (count, total) in other._buckets.items():
+            if serial < closed:
+                self._dropped += int(count)
+                continue
+            bucket = buckets.get(serial)
+            if bucket is None:
+                buckets[serial] = [count, total]
+            else:
+                bucket[0] += count
+                bucket[1] += total
+
+    def advance(self, watermark: date) -> list[tuple[Week, WeekBucket]]:
+        """Close weeks that end before a watermark date and emit them.
+
+        Args:
+            watermark: Date up to which all values are assumed to have
+                arrived, allowing for lateness days.
+
+        Returns:
+            List of (week, bucket) tuples of closed weeks sorted by week.
+        """
+        last_ordinal = watermark.toordinal() - self._lateness - 1
+        closed = (last_ordinal - self._system._offset - 6) // 7 + 1
+        if closed <= self._closed:
+            return []
+        self._closed = closed
+        return self._emit([serial for serial in self._buckets if serial < closed])
+
+    def peek(self) -> list[tuple[Week, WeekBucket]]:
+        """Return list of (week, bucket) tuples of open weeks sorted by week."""
+        return [
+            (self._week(serial), WeekBucket(int(count), total))
+            for serial, (count, total) in sorted(self._buckets.items())
+        ]
+
+    def flush(self) -> list[tuple[Week, WeekBucket]]:
+        """Emit all open weeks without closing them.
+
+        Returns:
+            List of (week, bucket) tuples of open weeks sorted by week.
+        """
+        return self._emit(list(self._buckets))
+
+    def _emit(self, serials: list[int]) -> list[tuple[Week, WeekBucket]]:
+        """Remove buckets of weeks and return them sorted by week."""
+        emitted = []
+        for serial in sorted(serials):
+            count, total = self._buckets.pop(serial)
+            emitted.append((self._week(serial), WeekBucket(int(count), total)))
+        return emitted
+
+    def _week(self, serial: int) -> Week:
+        """Return Week object of serial number."""
+        year, week = _serial_weektuple(serial, self._system)
+        return Week._cached(year, week, self._system)
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of cache of shared Week and Year objects."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class _InstanceCache:
+    """A thread-safe least recently used cache of Week and Year objects."""
+
+    __slots__ = "_items", "_lock", "hits", "maxsize", "misses"
+
+    def __init__(self, maxsize: int):
+        self._items: OrderedDict[tuple[Any, ...], object] = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.maxsize = maxsize
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get(self, key: tuple[Any, ...]) -> object | None:
+        """Return cached object for key, or None after counting a miss."""
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return item
+
+    def add(self, key: tuple[Any, ...], item: object) -> object:
+        """Add object for key, or return object added by another thread."""
+        with self._lock:
+            item = self._items.setdefault(key, item)
+            if len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+            return item
+
+    def clear(self) -> None:
+        """Remove all cached objects and reset statistics."""
+        with self._lock:
+            self._items.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_instance_cache: _InstanceCache | None = None
+
+
+def enable_cache(maxsize: int = 1024) -> None:
+    """Enable cache of shared Week and Year objects.
+
+    When enabled, weeks constructed by class methods such as
+    ``Week.fromdate``, ``Week.fromstring`` and ``Week.thisweek``, by week
+    arithmetic, and by iterating years, ranges and arrays of weeks, are
+    shared objects kept in a least recently used cache of bounded size.
+    Weeks constructed by calling ``Week`` directly are not shared. Enabling
+    the cache again replaces it with an empty cache of the new size.
+
+    Args:
+        maxsize: Maximum number of cached objects.
+
+    Raises:
+        ValueError: When ``maxsize`` is not positive.
+    """
+    global _instance_cache  # noqa: PLW0603
+    if maxsize < 1:
+        message = "Maxsize must be a positive integer"
+        raise ValueError(message)
+    _instance_cache = _InstanceCache(maxsize)
+
+
+def disable_cache() -> None:
+    """Disable cache of shared Week and Year objects and remove its objects."""
+    global _instance_cache  # noqa: PLW0603
+    _instance_cache = None
+
+
+def cache_info() -> CacheInfo | None:
+    """Return statistics of cache, or None when cache is not enabled."""
+    cache = _instance_cache
+    if cache is None:
+        return None
+    return CacheInfo(cache.hits, cache.misses, cache.maxsize, len(cache))
+
+
+def cache_clear() -> None:
+    """Remove all objects from cache, if enabled, and reset its statistics."""
+    cache = _instance_cache
+    if cache is not None:
+        cache.clear()
+
+
+class _Stats:
+    """Counters of calls and paths installed by wrapping functions."""
+
+    __slots__ = "_counts", "_lock", "_originals"
+
+    _operators = frozenset(
+        (
+            *("__init__", "__add__", "__sub__", "__contains__", "__getitem__"),
+            *("__iter__", "__eq__", "__lt__", "__le__", "__gt__", "__ge__"),
+        )
+    )
+
+    def __init__(self) -> None:
+        self._counts: Counter[str] = Counter()
+        self._lock = Lock()
+        self._originals: list[tuple[object, str, Any]] = []
+
+    def count(self, key: str) -> None:
+        """Increment counter of key."""
+        with self._lock:
+            self._counts[key] += 1
+
+    def snapshot(self, *, reset: bool = False) -> dict[str, int]:
+        """Return copy of counters sorted by key, and reset them if asked."""
+        with self._lock:
+            counts = dict(sorted(self._counts.items()))
+            if reset:
+                self._counts.clear()
+        return counts
+
+    def install(self) -> None:
+        """Replace public methods and internal paths with counting wrappers."""
+        for cls in (Week, Year, Season, WeekRange, WeekArray, WeekBucketer):
+            for name, attribute in list(vars(cls).items()):
+                if name.startswith("_") and name not in self._operators:
+                    continue
+                key = f"{cls.__name__}.{name}"
+                if isinstance(attribute, classmethod):
+                    wrapper = self._wrap(attribute.__func__, key)
+                    self._replace(cls, name, classmethod(wrapper))
+                elif isinstance(attribute, FunctionType):
+                    self._replace(cls, name, self._wrap(attribute, key))
+        module = sys.modules[__name__]
+        self._replace(_InstanceCache, "get", self._wrap_cache_get(_InstanceCache.get))
+        self._replace(module, "_ordinal_weektuple", self._wrap_ordinal_weektuple())
+        self._replace(module, "_year_table", self._wrap_year_table())
+
+    def uninstall(self) -> None:
+        """Restore functions replaced by ``install``."""
+        for owner, name, original in reversed(self._originals):
+            setattr(owner, name, original)
+        self._originals.clear()
+
+    def _replace(self, owner: object, name: str, replacement: object) -> None:
+        """Replace attribute of owner after keeping original one."""
+        owner_vars = vars(owner)
+        self._originals.append((owner, name, owner_vars[name]))
+        setattr(owner, name, replacement)
+
+    def _wrap(self, function: Callable[..., Any], key: str) -> Callable[..., Any]:
+        """Return wrapper counting calls of function."""
+        count = self.count
+
+        @wraps(function)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            count(key)
+            return function(*args, **kwargs)
+
+        return wrapper
+
+    def _wrap_cache_get(
+        self, function: Callable[[_InstanceCache, tuple[Any, ...]], object | None]
+    ) -> Callable[[_InstanceCache, tuple[Any, ...]], object | None]:
+        """Return wrapper counting hits and misses of instance cache."""
+        count = self.count
+
+        @wraps(function)
+        def wrapper(cache: _InstanceCache, key: tuple[Any, ...]) -> object | None:
+            item = function(cache, key)
+            count("cache.misses" if item is None else "cache.hits")
+            return item
+
+        return wrapper
+
+    def _wrap_ordinal_weektuple(self) -> Callable[[int, WeekSystem], tuple[int, int]]:
+        """Return wrapper counting conversions using day and year tables."""
+        count, function = self.count, _ordinal_weektuple
+
+        @wraps(function)
+        def wrapper(ordinal: int, system: WeekSystem) -> tuple[int, int]:
+            day_table = system._day_table
+            if day_table is None or not 0 <= ordinal - day_table[0] < len(day_table[1]):
+                count("ordinal.yeartable")
+            else:
+                count("ordinal.daytable")
+            return function(ordinal, system)
+
+        return wrapper
+
+    def _wrap_year_table(self) -> Callable[[str], "_YearTable"]:
+        """Return wrapper counting builds of year tables."""
+        count, function = self.count, _year_table
+
+        @wraps(function)
+        def wrapper(system: str) -> _YearTable:
+            if _get_system(system)._year_table is None:
+                count("yeartable.builds")
+            return function(system)
+
+        return wrapper
+
+
+_stats: _Stats | None = None
+_stats_lock = Lock()
+
+
+def enable_stats() -> None:
+    """Enable counting calls of public methods and paths taken by them.
+
+    When enabled, calls of public methods and operators of ``Week``,
+    ``Year``, ``Season``, ``WeekRange``, ``WeekArray`` and ``WeekBucketer``
+    are counted by qualified name, including calls made within the package. Paths are
+    counted as ``cache.hits`` and ``cache.misses`` of the cache of shared
+    objects, ``ordinal.daytable`` and ``ordinal.yeartable`` for dates
+    converted using loaded lookup tables or year tables, and
+    ``yeartable.builds`` for year tables built on first use. Methods are
+    only replaced by counting ones while enabled, so that disabled stats
+    add no overhead. Setting ``EPIWEEKS_STATS`` environment variable to
+    ``1`` enables stats on import. Enabling stats again keeps its counters.
+    """
+    global _stats  # noqa: PLW0603
+    with _stats_lock:
+        if _stats is None:
+            _stats = _Stats()
+            _stats.install()
+
+
+def disable_stats() -> None:
+    """Disable counting calls, restore methods and remove counters."""
+    global _stats  # noqa: PLW0603
+    with _stats_lock:
+        if _stats is not None:
+            _stats.uninstall()
+            _stats = None
+
+
+def stats(*, reset: bool = False) -> dict[str, int] | None:
+    """Return snapshot of counters, or None when stats are not enabled.
+
+    Args:
+        reset: Whether to reset counters after taking snapshot, so that
+            successive snapshots count calls between them.
+    """
+    stats_object = _stats
+    if stats_object is None:
+        return None
+    return stats_object.snapshot(reset=reset)
+
+
+def _enable_environ_stats() -> None:
+    """Enable stats when ``EPIWEEKS_STATS`` environment variable is ``1``."""
+    if os.environ.get("EPIWEEKS_STATS") == "1":
+        enable_stats()
+
+
+def _unpickle_week(cls: type[Week], serial: int, system: WeekSystem) -> Week:
+    """Return Week object of serial number as pickled by ``Week.__reduce__``."""
+    year, week = _serial_weektuple(serial, system)
+    return cls._new(year, week, system, serial)
+
+
+def _check_year(year: int) -> None:
+    """Check value of year."""
+    if not 1 <= year <= _MAX_YEAR:
+        message = f"Year must be in 1..{_MAX_YEAR}"
+        raise ValueError(message)
+
+
+def _check_season(year: int, startweek: int) -> None:
+    """Check values of season year and start week."""
+    max_years, max_weeks = _MAX_YEAR - 1, 52
+    if not 1 <= year <= max_years:
+        message = f"Season year must be in 1..{max_years}"
+        raise ValueError(message)
+    if not 1 <= startweek <= max_weeks:
+        message = f"Start week must be in 1..{max_weeks}"
+        raise ValueError(message)
+
+
+def _check_week(year: int, week: int, system: str) -> None:
+    """Check value of week."""
+    max_weeks = _year_total_weeks(year, system)
+    if not 1 <= week <= max_weeks:
+        message = f"Week must be in 1..{max_weeks} for year"
+        raise ValueError(message)
+
+
+def _check_ordinal(ordinal: int, system: WeekSystem) -> None:
+    """Check value of date ordinal for system.
+
+    Dates near the limits of ``date`` may be in weeks of years 0 or 10000
+    for some systems, which are out of supported range.
+    """
+    if system._year_table is None:
+        _year_table(system)
+    ordinals = system._ordinal_range
+    if ordinal not in ordinals:
+        message = f"Ordinal must be in {ordinals.start}..{ordinals.stop - 1}"
+        raise ValueError(message)
+
+
+def _check_system(system: str) -> None:
+    """Check value of week numbering system."""
+    _get_system(system)
+
+
+def _get_system(system: str) -> WeekSystem:
+    """Return week numbering system object after checking system name."""
+    if isinstance(system, WeekSystem):
+        return system
+    week_system = _systems.get(system) or _systems.get(system.lower())
+    if week_system is None:
+        message = f"System must be in {tuple(_systems)}"
+        raise ValueError(message)
+    return week_system
+
+
+def _system_adjustment(system: str) -> int:
+    """Return needed adjustment based on week numbering system."""
+    return _get_system(system)._adjustment
+
+
+def _serial_shift(system: WeekSystem, other: WeekSystem) -> int:
+    """Return difference of serial numbers of equivalent weeks of systems.
+
+    Weeks with serial number zero start on ordinals ``0..6`` and their middle
+    days are on ordinals ``3..9``, so that the equivalent week of each week
+    is shifted by the same number of serial numbers, which is ``-1``, ``0``
+    or ``1``.
+    """
+    return (system._offset + 3 - other._offset) // 7
+
+
+def _ordinal_weektuple(ordinal: int, system: WeekSystem) -> tuple[int, int]:
+    """Return (year, week) tuple of week containing date ordinal."""
+    day_table = system._day_table
+    if day_table is not None:
+        index = ordinal - day_table[0]
+        if 0 <= index < len(day_table[1]):
+            return divmod(day_table[1][index], 100)
+    year_starts = (system._year_table or _year_table(system))[0]
+    year = (ordinal - 1) * 400 // 146097 + 1  # Calendar year or year before
+    if ordinal < year_starts[year]:
+        year -= 1
+    elif ordinal >= year_starts[year + 1]:
+        year += 1
+    if not 1 <= year <= _MAX_YEAR:
+        _check_ordinal(ordinal, system)
+    week = (ordinal - year_starts[year]) // 7 + 1
+    return year, week
+
+
+def _serial_weektuple(serial: int, system: WeekSystem) -> tuple[int, int]:
+    """Return (year, week) tuple of week with serial number."""
+    return _ordinal_weektuple(serial * 7 + system._offset, system)
+
+
+def _season_weektuple(
+    year: int, week: int, system: WeekSystem, startweek: int
+) -> tuple[int, int]:
+    """Return (season year, season week) tuple of week of year.
+
+    Weeks before start week belong to season of previous year, whose weeks
+    after start week are counted using total weeks of previous year.
+    """
+    if week >= startweek:
+        return year, week - startweek + 1
+    year_weeks = (system._year_table or _year_table(system))[1]
+    return year - 1, week + year_weeks[year - 1] - startweek + 1
+
+
+def _extended_weektuple(serial: int, system: WeekSystem) -> tuple[int, int]:
+    """Return (year, week) tuple of week with serial number in any year.
+
+    Years out of supported range are calculated instead of looked up in
+    the year table, such as for weeks at which ranges of weeks stop.
+    """
+    ordinal = serial * 7 + system._offset
+    weekday, day = system._startweekday, _FIRST_WEEK_DAYS[system._firstweek]
+    year = (ordinal - 1) * 400 // 146097 + 1  # Calendar year or year before
+    while ordinal >= _compute_year_start(year + 1, weekday, day):
+        year += 1
+    return year, (ordinal - _compute_year_start(year, weekday, day)) // 7 + 1
+
+
+def _year_start(year: int, system: str) -> int:
+    """Return ordinal for first day of first week for year."""
+    return _year_table(system)[0][year]
+
+
+def _year_total_weeks(year: int, system: str) -> int:
+    """Return number of weeks in year."""
+    return _year_table(system)[1][year]
+
+
+_DayTable = tuple[int, memoryview]  # Loaded by epiweeks.lookup module
+_YearTable = tuple["array[int]", "array[int]"]
+
+
+def _year_table(system: str) -> _YearTable:
+    """Return tables of week-1 start ordinals and total weeks indexed by year.
+
+    Tables are built on first use for each system and cover years
+    ``0..10000``, one year beyond the supported range on each side, so that
+    dates near the range limits can still be mapped to their weeks.
+    """
+    system = _get_system(system)
+    table = system._year_table
+    if table is None:
+        weekday, day = system._startweekday, _FIRST_WEEK_DAYS[system._firstweek]
+        years = range(10001)
+        starts = array("i", (_compute_year_start(y, weekday, day) for y in years))
+        weeks = array("B", ((b - a) // 7 for a, b in pairwise(starts)))
+        table = system._year_table = starts, weeks
+        system._serial_range = range(starts[1] // 7, starts[_MAX_YEAR + 1] // 7)
+        first, last = max(1, starts[1]), min(_MAX_ORDINAL, starts[_MAX_YEAR + 1] - 1)
+        system._ordinal_range = range(first, last + 1)
+    return table
+
+
+def _compute_year_start(year: int, startweekday: int, firstday: int = 4) -> int:
+    """Compute ordinal for first day of first week for year.
+
+    First week of year is the week containing the January day ``firstday``.
+    """
+    days_before_year = (year - 1) * 365 + (year - 1) // 4
+    days_before_year += (year - 1) // 400 - (year - 1) // 100
+    first_ordinal = days_before_year + firstday
+    first_weekday = (first_ordinal - 1) % 7  # Mon is 0 .. Sun is 6
+    return first_ordinal - (first_weekday - startweekday) % 7
+
+
+def register_system(
+    name: str, startweekday: int, firstweek: str = "fourdays"
+) -> WeekSystem:
+    """Register a week numbering system to be accepted wherever systems are.
+
+    Tables of the system are built on registration, so that calculations
+    for it are as fast as for the predefined ``cdc`` and ``iso`` systems.
+
+    Args:
+        name: Name of week numbering system, which is case-insensitive.
+        startweekday: Week day on which weeks start, which may be ``0..6``
+            where Monday is 0 and Sunday is 6.
+        firstweek: Rule of first week of year, which may be ``firstday`` for
+            week containing 1 January, ``fourdays`` for first week with four
+            or more days in year, or ``fullweek`` for first week with all
+            days in year.
+
+    Raises:
+        ValueError: When a system with ``name`` is already registered.
+        ValueError: When ``startweekday`` is out of weekdays range.
+        ValueError: When ``firstweek`` is not within supported rules.
+    """
+    if name.lower() in _systems:
+        message = f"System already registered: {name.lower()!r}"
+        raise ValueError(message)
+    system = WeekSystem(name, startweekday, firstweek)
+    _year_table(system)
+    _systems[system.name] = system
+    return system
+
+
+def unregister_system(name: str) -> None:
+    """Unregister a week numbering system registered with ``register_system``.
+
+    Args:
+        name: Name of week numbering system.
+
+    Raises:
+        ValueError: When ``name`` is not a registered system or is one of
+            the predefined ``cdc`` and ``iso`` systems.
+    """
+    system = _get_system(name)
+    if system in (CDC, ISO):
+        message = f"System can not be unregistered: {system.name!r}"
+        raise ValueError(message)
+    del _systems[system.name]
+
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+_MAX_YEAR = 9999
+_MAX_ORDINAL = date.max.toordinal()
+
+_FIRST_WEEK_DAYS = {"firstday": 1, "fourdays": 4, "fullweek": 7}
+
+CDC = WeekSystem("cdc", 6)
+ISO = WeekSystem("iso", 0)
+
+_systems = {"cdc": CDC, "iso": ISO}
+
+_enable_environ_stats()
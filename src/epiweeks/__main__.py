@@ -0,0 +1,5 @@
+"""Run command-line interface with ``python -m epiweeks``."""
+
+from epiweeks.cli import main
+
+raise SystemExit(main())
@@ -0,0 +1,217 @@
+"""Epidemiological weeks extension type and compute functions for Apache Arrow.
+
+Importing this module registers the ``epiweeks.epiweek`` extension type, so
+that columns of weeks round-trip through Parquet and Arrow IPC files as week
+serial numbers without string formatting. It requires PyArrow, which is an
+optional dependency that is not imported by the core package.
+"""
+
+from collections.abc import Iterable
+from datetime import date
+from typing import Any
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from epiweeks import Week, _check_system, _get_system, calendar as _calendar
+
+__all__ = [
+    "EpiWeekScalar",
+    "EpiWeekType",
+    "calendar",
+    "enddates",
+    "fromdates",
+    "fromweeks",
+    "startdates",
+]
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+class EpiWeekType(pa.ExtensionType):
+    """Arrow extension type for epidemiological weeks of a numbering system.
+
+    Weeks are stored as ``int32`` week serial numbers as returned by
+    ``Week.toserial``, while the numbering system is stored as metadata.
+    """
+
+    def __init__(self, system: str = "cdc"):
+        """Initialize EpiWeekType object.
+
+        Args:
+            system: Week numbering system, which may be ``cdc`` where the
+                week starts on Sunday or ``iso`` where the week starts on
+                Monday.
+
+        Raises:
+            ValueError: When ``system`` is not within supported systems.
+        """
+        _check_system(system)
+        self._system = system.upper()
+        super().__init__(pa.int32(), "epiweeks.epiweek")
+
+    def __repr__(self) -> str:
+        class_name = self.__class__.__name__
+        return f"{class_name}({self._system})"
+
+    def __hash__(self) -> int:
+        return hash((self.extension_name, self._system))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        return self._system == other._system
+
+    def __ne__(self, other: object) -> bool:
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        return self._system != other._system
+
+    def __arrow_ext_serialize__(self) -> bytes:
+        return self._system.encode()
+
+    @classmethod
+    def __arrow_ext_deserialize__(
+        cls, storage_type: pa.DataType, serialized: bytes
+    ) -> "EpiWeekType":
+        return cls(serialized.decode())
+
+    def __arrow_ext_scalar_class__(self) -> type["EpiWeekScalar"]:
+        return EpiWeekScalar
+
+    def to_pandas_dtype(self) -> Any:
+        """Return equivalent ``epiweek`` pandas dtype."""
+        from epiweeks.pandas import EpiWeekDtype  # noqa: PLC0415
+
+        return EpiWeekDtype(self._system)
+
+    @property
+    def system(self) -> str:
+        """Return week numbering system as a string."""
+        return self._system
+
+
+class EpiWeekScalar(pa.ExtensionScalar):
+    """Arrow scalar of epidemiological week type."""
+
+    def as_py(self, **kwargs: Any) -> Week | None:
+        """Return scalar as a Week object or ``None`` if null."""
+        serial = self.value.as_py() if self.value is not None else None
+        return None if serial is None else Week.fromserial(serial, self.type.system)
+
+
+def fromweeks(weeks: Iterable[Week | None], system: str = "cdc") -> pa.ExtensionArray:
+    """Return Arrow array of weeks from Week objects.
+
+    Args:
+        weeks: Week objects, where ``None`` values become nulls.
+        system: Week numbering system, which may be ``cdc`` where the
+            week starts on Sunday or ``iso`` where the week starts on
+            Monday.
+
+    Raises:
+        TypeError: When ``weeks`` are not Week objects of ``system``.
+    """
+    week_type = EpiWeekType(system)
+    serials = []
+    for week in weeks:
+        if week is not None and (
+            not isinstance(week, Week) or week.system != week_type.system
+        ):
+            message = f"Item must be 'Week' object of '{week_type.system}' system"
+            raise TypeError(message)
+        serials.append(None if week is None else week.toserial())
+    storage = pa.array(serials, pa.int32())
+    return pa.ExtensionArray.from_storage(week_type, storage)
+
+
+def fromdates(dates: Any, system: str = "cdc") -> pa.ExtensionArray:
+    """Return Arrow array of weeks containing dates.
+
+    This is the vectorized equivalent of ``Week.fromdate``.
+
+    Args:
+        dates: Arrow array of dates or timestamps, or anything that can be
+            converted to ``date32`` array.
+        system: Week numbering system, which may be ``cdc`` where the
+            week starts on Sunday or ``iso`` where the week starts on
+            Monday.
+    """
+    week_type = EpiWeekType(system)
+    days = pc.cast(pc.cast(dates, pa.date32()), pa.int32())
+    ordinals = pc.add(days, _EPOCH_ORDINAL - _get_system(system)._offset)
+    storage = pc.cast(pc.divide(ordinals, 7), pa.int32())
+    return pa.ExtensionArray.from_storage(week_type, storage)
+
+
+def startdates(weeks: pa.ExtensionArray) -> pa.Array:
+    """Return Arrow array of first days of weeks.
+
+    Args:
+        weeks: Arrow array of epidemiological week type.
+    """
+    return _daydates(weeks, 0)
+
+
+def enddates(weeks: pa.ExtensionArray) -> pa.Array:
+    """Return Arrow array of last days of weeks.
+
+    Args:
+        weeks: Arrow array of epidemiological week type.
+    """
+    return _daydates(weeks, 6)
+
+
+def calendar(
+    start: int, stop: int, system: str = "cdc", *, other: str | None = None
+) -> pa.Table:
+    """Return Arrow table of calendar of all weeks for a range of years.
+
+    Columns are as returned by ``epiweeks.calendar.columns``, except that
+    ``serial`` is replaced by ``epiweek`` column of epidemiological week
+    type, and ``startdate`` and ``enddate`` columns of ``date32`` type
+    replace date ordinals. Integer columns share buffers of the generated
+    columns without copying. The table can be written to a Parquet file
+    using ``pyarrow.parquet.write_table``.
+
+    Args:
+        start: First year of range.
+        stop: Year at which range stops, which is not included in range.
+        system: Week numbering system, which may be ``cdc`` where the
+            week starts on Sunday or ``iso`` where the week starts on
+            Monday.
+        other: Week numbering system of equivalent weeks to add.
+
+    Raises:
+        ValueError: When ``stop`` is not after ``start``.
+        ValueError: When ``start`` or ``stop`` is out of supported range.
+        ValueError: When ``system`` or ``other`` is not within supported
+            systems.
+    """
+    week_type = EpiWeekType(system)
+    columns = _calendar.columns(start, stop, system, other=other)
+    table = {}
+    for name, column in columns.items():
+        buffers = [None, pa.py_buffer(column)]
+        array = pa.Array.from_buffers(pa.int32(), len(column), buffers)
+        if name == "serial":
+            table["epiweek"] = pa.ExtensionArray.from_storage(week_type, array)
+        elif name.endswith("ordinal"):
+            days = pc.subtract(array, pa.scalar(_EPOCH_ORDINAL, pa.int32()))
+            table[name.replace("ordinal", "date")] = pc.cast(days, pa.date32())
+        else:
+            table[name] = array
+    return pa.table(table)
+
+
+def _daydates(weeks: pa.ExtensionArray, days: int) -> pa.Array:
+    """Return Arrow array of dates for number of days after first days of weeks."""
+    if not isinstance(weeks.type, EpiWeekType):
+        message = f"Array must be of 'EpiWeekType' type: {weeks.type}"
+        raise TypeError(message)
+    offset = _get_system(weeks.type.system)._offset + days - _EPOCH_ORDINAL
+    ordinals = pc.add(pc.multiply(weeks.storage, 7), offset)
+    return pc.cast(pc.cast(ordinals, pa.int32()), pa.date32())
+
+
+pa.register_extension_type(EpiWeekType())
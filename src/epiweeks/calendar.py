@@ -0,0 +1,159 @@
+"""Bulk generation of epidemiological calendar tables.
+
+A calendar table has a row for each week of a range of years, which is
+useful as a dimension table to join with data grouped by weeks. Columns are
+computed for each year at once from the year tables of the numbering
+system, without creating Week or date objects for each week.
+"""
+
+import csv
+
+from array import array
+from collections.abc import Iterator
+from datetime import date
+from itertools import repeat
+from typing import TextIO
+
+from epiweeks import (
+    WeekSystem,
+    _check_year,
+    _get_system,
+    _ordinal_weektuple,
+    _year_table,
+)
+
+__all__ = ["columns", "write_csv"]
+
+
+def columns(
+    start: int, stop: int, system: str = "cdc", *, other: str | None = None
+) -> dict[str, "array[int]"]:
+    """Return columns of calendar table for a range of years.
+
+    Columns are ``year``, ``week``, ``serial`` of week serial numbers,
+    ``startordinal`` and ``endordinal`` of date ordinals of first and last
+    days of weeks, and ``totalweeks`` of number of weeks in years, as arrays
+    of 32-bit integers. When ``other`` system is given, ``<other>_year`` and
+    ``<other>_week`` columns are added with its equivalent weeks, which are
+    those overlapping four or more days of weeks.
+
+    Args:
+        start: First year of range.
+        stop: Year at which range stops, which is not included in range.
+        system: Week numbering system, which may be ``cdc`` where the
+            week starts on Sunday or ``iso`` where the week starts on
+            Monday.
+        other: Week numbering system of equivalent weeks to add.
+
+    Raises:
+        ValueError: When ``stop`` is not after ``start``.
+        ValueError: When ``start`` or ``stop`` is out of supported range.
+        ValueError: When ``system`` or ``other`` is not within supported
+            systems.
+    """
+    system, other_system = _check_range(start, stop, system, other)
+    names = _column_names(other_system)
+    table = {name: array("i") for name in names}
+    year_starts, year_weeks = _year_table(system)
+    for year in range(start, stop):
+        first, total = year_starts[year], year_weeks[year]
+        stop_ordinal = first + total * 7
+        table["year"].extend(repeat(year, total))
+        table["week"].extend(range(1, total + 1))
+        table["serial"].extend(range(first // 7, first // 7 + total))
+        table["startordinal"].extend(range(first, stop_ordinal, 7))
+        table["endordinal"].extend(range(first + 6, stop_ordinal, 7))
+        table["totalweeks"].extend(repeat(total, total))
+        if other_system is not None:
+            _extend_other(table, names[-2:], first + 3, stop_ordinal, other_system)
+    return table
+
+
+def write_csv(
+    file: TextIO,
+    start: int,
+    stop: int,
+    system: str = "cdc",
+    *,
+    other: str | None = None,
+) -> None:
+    """Write calendar table for a range of years to a CSV file.
+
+    Columns are as returned by ``columns``, except that ``startdate`` and
+    ``enddate`` of ``YYYY-MM-DD`` dates replace date ordinals. Rows are
+    written one at a time as they are generated, and end with a line feed as
+    in output of the command-line interface.
+
+    Args:
+        file: Text file object to write to, which should be opened with
+            ``newline=""``.
+        start: First year of range.
+        stop: Year at which range stops, which is not included in range.
+        system: Week numbering system, which may be ``cdc`` where the
+            week starts on Sunday or ``iso`` where the week starts on
+            Monday.
+        other: Week numbering system of equivalent weeks to add.
+
+    Raises:
+        ValueError: When ``stop`` is not after ``start``.
+        ValueError: When ``start`` or ``stop`` is out of supported range.
+        ValueError: When ``system`` or ``other`` is not within supported
+            systems.
+    """
+    system, other_system = _check_range(start, stop, system, other)
+    names = _column_names(other_system)
+    writer = csv.writer(file, lineterminator="\n")
+    writer.writerow([name.replace("ordinal", "date") for name in names])
+    writer.writerows(_rows(start, stop, system, other_system))
+
+
+def _check_range(
+    start: int, stop: int, system: str, other: str | None
+) -> tuple[WeekSystem, WeekSystem | None]:
+    """Check range of years and return systems of calendar table."""
+    if stop <= start:
+        message = "Stop year must be after start year"
+        raise ValueError(message)
+    _check_year(start)
+    _check_year(stop - 1)
+    return _get_system(system), None if other is None else _get_system(other)
+
+
+def _column_names(other: WeekSystem | None) -> list[str]:
+    """Return names of columns of calendar table."""
+    names = ["year", "week", "serial", "startordinal", "endordinal", "totalweeks"]
+    if other is not None:
+        names += [f"{other.name}_year", f"{other.name}_week"]
+    return names
+
+
+def _rows(
+    start: int, stop: int, system: WeekSystem, other: WeekSystem | None
+) -> Iterator[tuple[int | str, ...]]:
+    """Yield rows of calendar table with dates formatted as ``YYYY-MM-DD``."""
+    year_starts, year_weeks = _year_table(system)
+    for year in range(start, stop):
+        first, total = year_starts[year], year_weeks[year]
+        for week, ordinal in enumerate(range(first, first + total * 7, 7), 1):
+            startdate = date.fromordinal(ordinal)
+            enddate = date.fromordinal(ordinal + 6)
+            row = year, week, ordinal // 7, startdate.isoformat(), enddate.isoformat()
+            if other is None:
+                yield *row, total
+            else:
+                yield *row, total, *_ordinal_weektuple(ordinal + 3, other)
+
+
+def _extend_other(
+    table: dict[str, "array[int]"],
+    names: list[str],
+    first_ordinal: int,
+    stop_ordinal: int,
+    system: WeekSystem,
+) -> None:
+    """Extend columns of equivalent weeks for middle days of weeks."""
+    years, weeks = table[names[0]], table[names[1]]
+    for ordinal in range(first_ordinal, stop_ordinal, 7):
+        year, week = _ordinal_weektuple(ordinal, system)
+        years.append(year)
+        weeks.append(week)
@@ -0,0 +1,303 @@
+"""Command-line interface for annotating dates with epidemiological weeks.
+
+The input is read and written in chunks of rows, so that large CSV or NDJSON
+files can be annotated in bounded memory. Dates of each chunk may be
+converted in a pool of worker processes, while rows are written in the same
+order as they are read.
+"""
+
+import argparse
+import csv
+import io
+import json
+import sys
+
+from collections import deque
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+from datetime import date, datetime
+from itertools import islice
+from typing import IO, Any
+
+from epiweeks import Week, _check_system
+from epiweeks.parallel import _map_ordered
+
+__all__ = ["main"]
+
+_Fields = tuple[str, str, str, str]
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run command-line interface and return exit status.
+
+    Args:
+        argv: Command-line arguments, which defaults to ``sys.argv[1:]``.
+    """
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    try:
+        _check_system(args.system)
+    except ValueError as e:
+        parser.error(str(e))
+    file_format = args.format or _guess_format(args.input)
+    try:
+        input_file = _open_file(args.input, "r")
+    except OSError as e:
+        parser.error(f"can't open {args.input!r}: {e.strerror}")
+    try:
+        output_file = _open_file(args.output, "w")
+    except OSError as e:
+        _close_file(input_file, args.input)
+        parser.error(f"can't open {args.output!r}: {e.strerror}")
+    executor = ProcessPoolExecutor(args.workers) if args.workers > 1 else None
+    try:
+        if file_format == "csv":
+            _annotate_csv(input_file, output_file, args, executor)
+        else:
+            _annotate_ndjson(input_file, output_file, args, executor)
+    except (KeyError, ValueError) as e:
+        sys.stderr.write(f"{parser.prog}: error: {e.args[0]}\n")
+        return 1
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+        output_file.flush()
+        _close_file(input_file, args.input)
+        _close_file(output_file, args.output)
+    return 0
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Return parser of command-line arguments."""
+    parser = argparse.ArgumentParser(
+        prog="epiweeks",
+        description=(
+            "Annotate a date column of a CSV or NDJSON file with epidemiological "
+            "week columns: PREFIX (formatted week), PREFIX_year, PREFIX_week "
+            "and PREFIX_startdate."
+        ),
+    )
+    parser.add_argument(
+        "input",
+        nargs="?",
+        default="-",
+        help="input file path, or '-' to read from standard input (default)",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        default="-",
+        help="output file path, or '-' to write to standard output (default)",
+    )
+    parser.add_argument(
+        "-c", "--column", required=True, help="name of column containing dates"
+    )
+    parser.add_argument(
+        "-s",
+        "--system",
+        default="cdc",
+        help="week numbering system, which may be 'cdc' (default) or 'iso'",
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        choices=("csv", "ndjson"),
+        help="input and output format, which is guessed from input file extension",
+    )
+    parser.add_argument(
+        "--date-format",
+        help="strptime format of dates, which defaults to ISO format 'YYYY-MM-DD'",
+    )
+    parser.add_argument(
+        "--prefix", default="epiweek", help="prefix of added column names"
+    )
+    parser.add_argument(
+        "--errors",
+        choices=("raise", "coerce"),
+        default="raise",
+        help=(
+            "whether to stop at invalid or missing dates (default) or leave "
+            "columns empty"
+        ),
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=_positive_int,
+        default=10000,
+        help="number of rows processed at a time (default: 10000)",
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=_positive_int,
+        default=1,
+        help="number of worker processes converting dates (default: 1)",
+    )
+    return parser
+
+
+def _positive_int(value: str) -> int:
+    """Return value converted to a positive integer."""
+    number = int(value)
+    if number < 1:
+        message = f"must be a positive integer: {value}"
+        raise argparse.ArgumentTypeError(message)
+    return number
+
+
+def _guess_format(path: str) -> str:
+    """Return file format guessed from file path extension."""
+    return "ndjson" if path.endswith((".ndjson", ".jsonl")) else "csv"
+
+
+def _open_file(path: str, mode: str) -> IO[str]:
+    """Return text file object for a file path or standard stream."""
+    if path == "-":
+        stream = sys.stdin if mode == "r" else sys.stdout
+        return io.TextIOWrapper(stream.buffer, encoding="utf-8", newline="")
+    return open(path, mode, encoding="utf-8", newline="")
+
+
+def _close_file(file: IO[str], path: str) -> None:
+    """Close text file object, leaving standard streams open."""
+    if path == "-":
+        file.detach()  # type: ignore[attr-defined]
+    else:
+        file.close()
+
+
+def _annotate_csv(
+    input_file: IO[str],
+    output_file: IO[str],
+    args: argparse.Namespace,
+    executor: Executor | None,
+) -> None:
+    """Annotate rows of a CSV file with week columns."""
+    reader = csv.reader(input_file)
+    writer = csv.writer(output_file, lineterminator="\n")
+    header = next(reader, None)
+    if header is None:
+        return
+    if args.column not in header:
+        message = f"Column not found in input: {args.column!r}"
+        raise KeyError(message)
+    index = header.index(args.column)
+    writer.writerow([*header, *_column_names(args.prefix)])
+    for rows, fields in _convert_chunks(reader, index, args, executor):
+        writer.writerows(row + list(f) for row, f in zip(rows, fields, strict=True))
+
+
+def _annotate_ndjson(
+    input_file: IO[str],
+    output_file: IO[str],
+    args: argparse.Namespace,
+    executor: Executor | None,
+) -> None:
+    """Annotate records of an NDJSON file with week fields."""
+    records = (json.loads(line) for line in input_file if line.strip())
+    names = _column_names(args.prefix)
+    for chunk, fields in _convert_chunks(records, args.column, args, executor):
+        lines = []
+        for record, (week, year, number, startdate) in zip(chunk, fields, strict=True):
+            record[names[0]] = week or None
+            record[names[1]] = int(year) if year else None
+            record[names[2]] = int(number) if number else None
+            record[names[3]] = startdate or None
+            lines.append(json.dumps(record, ensure_ascii=False))
+        output_file.write("\n".join(lines) + "\n")
+
+
+def _column_names(prefix: str) -> list[str]:
+    """Return names of added week columns."""
+    return [prefix, f"{prefix}_year", f"{prefix}_week", f"{prefix}_startdate"]
+
+
+def _convert_chunks(
+    rows: Iterable[Any],
+    key: Any,
+    args: argparse.Namespace,
+    executor: Executor | None,
+) -> Iterator[tuple[list[Any], list[_Fields]]]:
+    """Yield chunks of rows with week fields of their dates, in input order.
+
+    When an executor is used, only a bounded number of chunks are submitted
+    ahead of the chunk being yielded.
+    """
+    options = args.system, args.date_format, args.errors
+    pending: deque[list[Any]] = deque()
+
+    def arguments() -> Iterator[tuple[Any, ...]]:
+        for chunk in _iter_chunks(rows, args.chunk_size):
+            pending.append(chunk)
+            yield _dates_of(chunk, key, args.errors), *options
+
+    ahead = args.workers * 2
+    for fields in _map_ordered(executor, _convert_dates, arguments(), ahead):
+        yield pending.popleft(), fields
+
+
+def _iter_chunks(rows: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    """Yield lists of rows of specific size."""
+    iterator = iter(rows)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _dates_of(chunk: list[Any], key: Any, errors: str) -> list[Any]:
+    """Return date values of rows of chunk.
+
+    Date values of NDJSON records without the date field are ``None`` when
+    errors are coerced, so that their week fields are left empty.
+    """
+    try:
+        return [row[key] for row in chunk]
+    except (IndexError, KeyError, TypeError):
+        if errors != "coerce":
+            message = f"Column not found in row: {key!r}"
+            raise KeyError(message) from None
+    values = []
+    for row in chunk:
+        if isinstance(row, dict):
+            values.append(row.get(key))
+        elif isinstance(row, list) and isinstance(key, int) and key < len(row):
+            values.append(row[key])
+        else:
+            message = f"Column not found in row: {key!r}"
+            raise KeyError(message)
+    return values
+
+
+def _convert_dates(
+    values: list[Any], system: str, date_format: str | None, errors: str
+) -> list[_Fields]:
+    """Return week fields for date values.
+
+    Week fields of a repeated date value are only calculated once.
+    """
+    cache: dict[str, _Fields] = {}
+    fields = []
+    for value in values:
+        key = value if isinstance(value, str) else repr(value)
+        if key not in cache:
+            cache[key] = _convert_date(value, system, date_format, errors)
+        fields.append(cache[key])
+    return fields
+
+
+def _convert_date(
+    value: Any, system: str, date_format: str | None, errors: str
+) -> _Fields:
+    """Return week fields for a date value."""
+    try:
+        if date_format is None:
+            date_object = date.fromisoformat(value[:10])
+        else:
+            date_object = datetime.strptime(value, date_format).date()
+    except (TypeError, ValueError) as e:
+        if errors == "coerce":
+            return "", "", "", ""
+        message = f"Invalid date {value!r}: {e}"
+        raise ValueError(message) from None
+    week = Week.fromdate(date_object, system)
+    startdate = week.startdate().isoformat()
+    return str(week), str(week.year), str(week.week), startdate
@@ -0,0 +1,113 @@
+"""Compact binary encoding of sequences of weeks.
+
+Encoded weeks start with a header of 2 bytes ``EW`` signature, format
+version, length of system name and system name as bytes. Then, number of
+weeks and week serial numbers follow as variable-length integers, where
+each serial number is stored as its difference from the previous one, or
+from zero for the first one. Differences are zigzag encoded, so that small
+negative and positive differences take one byte. Weeks of sorted or
+consecutive series, such as reporting periods, take about one byte each.
+"""
+
+from array import array
+from collections.abc import Iterable
+
+from epiweeks import Week, WeekArray, _get_system
+
+__all__ = ["decode_weeks", "encode_weeks"]
+
+_SIGNATURE = b"EW"
+_VERSION = 1
+
+
+def encode_weeks(weeks: Iterable[Week], system: str = "cdc") -> bytes:
+    """Return weeks encoded as bytes.
+
+    Args:
+        weeks: Week objects, or a WeekArray object whose serial numbers are
+            encoded without creating Week objects.
+        system: Week numbering system, which may be ``cdc`` where the
+            week starts on Sunday or ``iso`` where the week starts on
+            Monday.
+
+    Raises:
+        ValueError: When ``system`` is not within supported systems.
+        TypeError: When ``weeks`` are not Week objects of ``system``.
+    """
+    system = _get_system(system)
+    if not isinstance(weeks, WeekArray) or weeks.system != system:
+        weeks = WeekArray(weeks, system)
+    name = system.name.encode()
+    data = bytearray(_SIGNATURE)
+    data += bytes((_VERSION, len(name)))
+    data += name
+    _write_varint(data, len(weeks))
+    previous = 0
+    for serial in weeks.serials:
+        delta = serial - previous
+        _write_varint(data, delta << 1 if delta >= 0 else (~delta << 1) | 1)
+        previous = serial
+    return bytes(data)
+
+
+def decode_weeks(data: bytes | bytearray | memoryview) -> WeekArray:
+    """Return WeekArray object of weeks decoded from bytes.
+
+    Weeks are decoded straight into buffer of the returned array without
+    creating Week objects, and ``data`` is read without copying it, so that
+    it may also be a memory-mapped file or a slice of a larger buffer.
+
+    Args:
+        data: Bytes as returned by ``encode_weeks``.
+
+    Raises:
+        ValueError: When ``data`` is not valid encoded weeks.
+        ValueError: When system of weeks is not within supported systems.
+    """
+    view = memoryview(data).cast("B")
+    header_size = len(_SIGNATURE) + 2
+    if len(view) < header_size or view[:2] != _SIGNATURE or view[2] != _VERSION:
+        message = "Data must be weeks encoded by 'encode_weeks'"
+        raise ValueError(message)
+    position = header_size + view[3]
+    system = _get_system(bytes(view[header_size:position]).decode())
+    serials = array("i")
+    append = serials.append
+    try:
+        count, position = _read_varint(view, position)
+        serial = 0
+        for _ in range(count):
+            value, position = _read_varint(view, position)
+            serial += value >> 1 if not value & 1 else ~(value >> 1)
+            append(serial)
+    except (IndexError, OverflowError):
+        message = "Data of encoded weeks is truncated or corrupted"
+        raise ValueError(message) from None
+    if position != len(view):
+        message = "Data of encoded weeks has trailing bytes"
+        raise ValueError(message)
+    try:
+        return WeekArray.fromserials(serials, system)
+    except ValueError:
+        message = "Data of encoded weeks is truncated or corrupted"
+        raise ValueError(message) from None
+
+
+def _write_varint(data: bytearray, value: int) -> None:
+    """Append non-negative integer as 7 bits per byte, low bits first."""
+    while value > 0x7F:  # noqa: PLR2004
+        data.append(value & 0x7F | 0x80)
+        value >>= 7
+    data.append(value)
+
+
+def _read_varint(view: memoryview, position: int) -> tuple[int, int]:
+    """Return integer read at position and position after it."""
+    value = shift = 0
+    while True:
+        byte = view[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:  # noqa: PLR2004
+            return value, position
+        shift += 7
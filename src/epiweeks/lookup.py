@@ -0,0 +1,116 @@
+"""Memory-mapped lookup tables of weeks for days.
+
+A lookup table file maps every day in a range of dates to its week in both
+CDC and ISO systems. Once loaded, ``Week.fromdate`` and other conversions
+of dates to weeks read weeks from the table for dates within its range,
+and calculate weeks as usual for other dates. The file is memory-mapped, so
+that processes loading the same file share one copy of it in memory.
+
+The file starts with a 24 bytes header of 8 bytes ``EPIWEEK`` signature,
+format version, ordinal of first day and number of days as 32-bit integers,
+and 4 reserved bytes. Then, weeks of days in CDC system followed by weeks of
+days in ISO system as 32-bit integers packed as ``YYYYww``. Integers are
+stored in byte order of the machine building the file, which must be the
+same as that of machines loading it.
+"""
+
+import mmap
+import os
+import struct
+
+from array import array
+from datetime import date
+
+from epiweeks import CDC, ISO, _ordinal_weektuple
+
+__all__ = ["build", "load", "loaded", "unload"]
+
+_HEADER = struct.Struct("=8siii4x")
+_SIGNATURE = b"EPIWEEK\0"
+_VERSION = 1
+_SYSTEMS = CDC, ISO
+
+_mapping: mmap.mmap | None = None
+
+
+def build(
+    path: str | os.PathLike[str],
+    start: date = date(1900, 1, 1),
+    stop: date = date(2100, 1, 1),
+) -> None:
+    """Build lookup table file for a range of dates.
+
+    Args:
+        path: Path of lookup table file to write.
+        start: First date of range.
+        stop: Date at which range stops, which is not included in range.
+
+    Raises:
+        ValueError: When ``stop`` is not after ``start``.
+    """
+    first, last = start.toordinal(), stop.toordinal()
+    if last <= first:
+        message = "Stop date must be after start date"
+        raise ValueError(message)
+    with open(path, "wb") as file:
+        file.write(_HEADER.pack(_SIGNATURE, _VERSION, first, last - first))
+        for system in _SYSTEMS:
+            weeks = array("i")
+            for ordinal in range(first, last):
+                year, week = _ordinal_weektuple(ordinal, system)
+                weeks.append(year * 100 + week)
+            weeks.tofile(file)
+
+
+def load(path: str | os.PathLike[str]) -> None:
+    """Load lookup table file to be used for conversions of dates to weeks.
+
+    Any previously loaded lookup table is unloaded first.
+
+    Args:
+        path: Path of lookup table file to load.
+
+    Raises:
+        ValueError: When file is not a valid lookup table file.
+    """
+    global _mapping  # noqa: PLW0603
+    unload()
+    with open(path, "rb") as file:
+        mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        signature, version, first, days = _HEADER.unpack_from(mapping)
+    except struct.error:
+        signature = version = first = days = None
+    if (
+        signature != _SIGNATURE
+        or version != _VERSION
+        or len(mapping) != _HEADER.size + days * 4 * len(_SYSTEMS)
+    ):
+        mapping.close()
+        message = f"Invalid lookup table file: {os.fspath(path)!r}"
+        raise ValueError(message)
+    weeks = memoryview(mapping)[_HEADER.size :].cast("i")
+    for index, system in enumerate(_SYSTEMS):
+        table = first, memoryview(weeks)[index * days : (index + 1) * days]
+        system._day_table = table
+    _mapping = mapping
+
+
+def unload() -> None:
+    """Unload lookup table, if any, to calculate weeks of all dates."""
+    global _mapping  # noqa: PLW0603
+    for system in _SYSTEMS:
+        if system._day_table is not None:
+            system._day_table[1].release()
+            system._day_table = None
+    if _mapping is not None:
+        _mapping.close()
+        _mapping = None
+
+
+def loaded() -> tuple[date, date] | None:
+    """Return range of dates of loaded lookup table as (start, stop) tuple."""
+    if CDC._day_table is None:
+        return None
+    first, weeks = CDC._day_table
+    return date.fromordinal(first), date.fromordinal(first + len(weeks))
@@ -0,0 +1,124 @@
+"""Vectorized epidemiological weeks calculation using NumPy.
+
+This module requires NumPy, which is an optional dependency that is not
+imported by the core package.
+"""
+
+from datetime import date
+
+import numpy as np
+
+from numpy.typing import ArrayLike, NDArray
+
+from epiweeks import _MAX_YEAR, _check_season, _get_system, _year_table
+
+__all__ = ["fromdates", "fromordinals", "pack", "toseasons"]
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def fromdates(
+    dates: ArrayLike, system: str = "cdc"
+) -> tuple[NDArray[np.int32], NDArray[np.int32]]:
+    """Return epidemiological years and weeks for an array of dates.
+
+    This is the vectorized equivalent of ``Week.fromdate``.
+
+    Args:
+        dates: Array of ``datetime64`` values or anything that can be
+            converted to it, such as a list of Python date objects.
+        system: Week numbering system, which may be ``cdc`` where the
+            week starts on Sunday or ``iso`` where the week starts on
+            Monday.
+
+    Raises:
+        ValueError: When any of ``dates`` is ``NaT`` or out of supported range.
+        ValueError: When ``system`` is not within supported systems.
+    """
+    days = np.asarray(dates, dtype="datetime64[D]").astype(np.int64)
+    return fromordinals(days + _EPOCH_ORDINAL, system)
+
+
+def fromordinals(
+    ordinals: ArrayLike, system: str = "cdc"
+) -> tuple[NDArray[np.int32], NDArray[np.int32]]:
+    """Return epidemiological years and weeks for an array of date ordinals.
+
+    Args:
+        ordinals: Array of proleptic Gregorian ordinals as returned by
+            ``date.toordinal``.
+        system: Week numbering system, which may be ``cdc`` where the
+            week starts on Sunday or ``iso`` where the week starts on
+            Monday.
+
+    Raises:
+        ValueError: When any of ``ordinals`` is out of supported range.
+        ValueError: When ``system`` is not within supported systems.
+    """
+    system = _get_system(system)
+    year_starts = np.frombuffer(_year_table(system)[0], dtype=np.int32)
+    first, last = system._ordinal_range[0], system._ordinal_range[-1]
+    ordinals = np.asarray(ordinals, dtype=np.int64)
+    if ordinals.size and (ordinals.min() < first or ordinals.max() > last):
+        message = f"Ordinal must be in {first}..{last}"
+        raise ValueError(message)
+    day_table = system._day_table
+    if day_table is not None and ordinals.size:
+        first, packed_weeks = day_table
+        if ordinals.min() >= first and ordinals.max() < first + len(packed_weeks):
+            packed = np.frombuffer(packed_weeks, dtype=np.int32)[ordinals - first]
+            return packed // 100, packed % 100
+    years = np.searchsorted(year_starts, ordinals, side="right") - 1
+    weeks = (ordinals - year_starts[years]) // 7 + 1
+    return years.astype(np.int32), weeks.astype(np.int32)
+
+
+def pack(years: ArrayLike, weeks: ArrayLike) -> NDArray[np.int32]:
+    """Return weeks packed as integers in CDC format ``YYYYww``.
+
+    Args:
+        years: Array of epidemiological years.
+        weeks: Array of epidemiological weeks.
+    """
+    years = np.asarray(years, dtype=np.int32)
+    weeks = np.asarray(weeks, dtype=np.int32)
+    packed: NDArray[np.int32] = years * 100 + weeks
+    return packed
+
+
+def toseasons(
+    years: ArrayLike, weeks: ArrayLike, system: str = "cdc", startweek: int = 40
+) -> tuple[NDArray[np.int32], NDArray[np.int32]]:
+    """Return season years and season weeks for arrays of years and weeks.
+
+    This is the vectorized equivalent of ``Season.fromweek`` and
+    ``Season.seasonweek``, where weeks before ``startweek`` are counted
+    from start week of previous year using total weeks of years.
+
+    Args:
+        years: Array of epidemiological years, as returned by ``fromdates``.
+        weeks: Array of epidemiological weeks, as returned by ``fromdates``.
+        system: Week numbering system, which may be ``cdc`` where the
+            week starts on Sunday or ``iso`` where the week starts on
+            Monday.
+        startweek: Week of year on which seasons start.
+
+    Raises:
+        ValueError: When ``startweek`` is out of weeks of all years.
+        ValueError: When season year of any week is out of range.
+        ValueError: When ``system`` is not within supported systems.
+    """
+    _check_season(1, startweek)
+    years = np.asarray(years, dtype=np.int32)
+    weeks = np.asarray(weeks, dtype=np.int32)
+    year_weeks = np.frombuffer(_year_table(system)[1], dtype=np.uint8)
+    before = weeks < startweek
+    season_years = years - before
+    season_weeks = weeks - startweek + 1
+    if season_years.size and (
+        season_years.min() < 1 or season_years.max() >= _MAX_YEAR
+    ):
+        message = f"Season year must be in 1..{_MAX_YEAR - 1}"
+        raise ValueError(message)
+    season_weeks[before] += year_weeks[season_years[before]]
+    return season_years.astype(np.int32), season_weeks.astype(np.int32)
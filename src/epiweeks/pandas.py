@@ -0,0 +1,455 @@
+"""Epidemiological weeks extension type and accessor for pandas.
+
+Importing this module registers the ``epiweek`` extension dtype and the
+``Series.epiweek`` accessor. It requires pandas and NumPy, which are optional
+dependencies that are not imported by the core package.
+"""
+
+import builtins
+import operator
+import re
+
+from collections.abc import Callable, Sequence
+from datetime import date
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from numpy.typing import NDArray
+from pandas.api.extensions import (
+    ExtensionArray,
+    ExtensionDtype,
+    register_extension_dtype,
+    register_series_accessor,
+    take,
+)
+
+from epiweeks import Week, _check_system, _get_system
+from epiweeks.numpy import fromordinals
+
+__all__ = ["EpiWeekAccessor", "EpiWeekArray", "EpiWeekDtype"]
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+_NA_SERIAL = np.iinfo(np.int64).min
+
+
+@register_extension_dtype
+class EpiWeekDtype(ExtensionDtype):
+    """Extension dtype for epidemiological weeks of a numbering system."""
+
+    _metadata = ("system",)
+    _match = re.compile(r"^epiweek(?:\[(?P<system>\w+)\])?$", re.IGNORECASE)
+    type = Week
+    na_value = pd.NA
+    kind = "O"
+
+    def __init__(self, system: str = "cdc"):
+        """Initialize EpiWeekDtype object.
+
+        Args:
+            system: Week numbering system, which may be ``cdc`` where the
+                week starts on Sunday or ``iso`` where the week starts on
+                Monday.
+
+        Raises:
+            ValueError: When ``system`` is not within supported systems.
+        """
+        _check_system(system)
+        self.system = system.upper()
+
+    def __repr__(self) -> str:
+        return self.name
+
+    @property
+    def name(self) -> str:
+        """Return string identifying the dtype."""
+        return f"epiweek[{self.system}]"
+
+    @classmethod
+    def construct_from_string(cls, string: str) -> "EpiWeekDtype":
+        """Construct EpiWeekDtype object from a string like ``epiweek[cdc]``."""
+        if not isinstance(string, str):
+            message = f"'construct_from_string' expects a string, got {type(string)}"
+            raise TypeError(message)
+        match = cls._match.match(string)
+        if match is None:
+            message = f"Cannot construct a '{cls.__name__}' from '{string}'"
+            raise TypeError(message)
+        return cls(match.group("system") or "cdc")
+
+    def __from_arrow__(self, array: Any) -> "EpiWeekArray":
+        """Construct EpiWeekArray object from an Arrow array of weeks."""
+        import pyarrow as pa  # noqa: PLC0415
+
+        chunks = array.chunks if isinstance(array, pa.ChunkedArray) else [array]
+        serials = [
+            chunk.storage.cast(pa.int64()).fill_null(_NA_SERIAL).to_numpy()
+            for chunk in chunks
+        ]
+        return EpiWeekArray(np.concatenate([[], *serials]), self.system)
+
+    @classmethod
+    def construct_array_type(cls) -> builtins.type["EpiWeekArray"]:
+        """Return array type associated with this dtype."""
+        return EpiWeekArray
+
+
+class EpiWeekArray(ExtensionArray):
+    """Extension array of epidemiological weeks stored as week serial numbers."""
+
+    def __init__(self, serials: Any, system: str = "cdc"):
+        """Initialize EpiWeekArray object.
+
+        Args:
+            serials: Array of week serial numbers as returned by
+                ``Week.toserial``, where missing weeks are the minimum
+                ``int64`` value.
+            system: Week numbering system, which may be ``cdc`` where the
+                week starts on Sunday or ``iso`` where the week starts on
+                Monday.
+        """
+        self._serials: NDArray[np.int64] = np.asarray(serials, dtype=np.int64)
+        self._dtype = EpiWeekDtype(system)
+
+    @classmethod
+    def _from_sequence(
+        cls, scalars: Any, *, dtype: Any = None, copy: bool = False
+    ) -> "EpiWeekArray":
+        """Construct EpiWeekArray object from a sequence of Week objects.
+
+        Week strings are parsed as in ``Week.fromstring`` using the system of
+        dtype, which defaults to ``cdc``, so that series of strings can be
+        converted with ``astype``.
+        """
+        if isinstance(scalars, cls):
+            return scalars.copy() if copy else scalars
+        system = _resolve_dtype(dtype).system if dtype is not None else None
+        serials = []
+        for scalar in scalars:
+            if isinstance(scalar, str):
+                week = Week.fromstring(scalar, system or "cdc")
+                serials.append(week.toserial())
+                system = week.system
+            elif isinstance(scalar, Week):
+                if system is None:
+                    system = scalar.system
+                elif scalar.system != system:
+                    message = f"Week must be of '{system}' system: {scalar!r}"
+                    raise TypeError(message)
+                serials.append(scalar.toserial())
+            elif pd.isna(scalar):
+                serials.append(_NA_SERIAL)
+            else:
+                message = f"Item must be 'Week' object: {type(scalar).__name__}"
+                raise TypeError(message)
+        return cls(np.array(serials, dtype=np.int64), system or "cdc")
+
+    @classmethod
+    def _from_sequence_of_strings(
+        cls, strings: Any, *, dtype: Any = None, copy: bool = False
+    ) -> "EpiWeekArray":
+        """Construct EpiWeekArray object from a sequence of week strings."""
+        system = _resolve_dtype(dtype).system if dtype is not None else "cdc"
+        weeks = Week.fromstrings(
+            [s if isinstance(s, str) else "" for s in strings], system, errors="coerce"
+        )
+        return cls._from_sequence(weeks, dtype=EpiWeekDtype(system))
+
+    @classmethod
+    def _from_factorized(
+        cls, values: NDArray[np.int64], original: "EpiWeekArray"
+    ) -> "EpiWeekArray":
+        return cls(values, original.dtype.system)
+
+    @classmethod
+    def fromdates(cls, dates: Any, system: str = "cdc") -> "EpiWeekArray":
+        """Construct EpiWeekArray object from an array of dates.
+
+        Args:
+            dates: Array of ``datetime64`` values or anything that can be
+                converted to it, where ``NaT`` values become missing weeks.
+            system: Week numbering system, which may be ``cdc`` where the
+                week starts on Sunday or ``iso`` where the week starts on
+                Monday.
+        """
+        offset = _get_system(system)._offset
+        days = np.asarray(dates, dtype="datetime64[D]")
+        missing = np.isnat(days)
+        ordinals = days.astype(np.int64) + _EPOCH_ORDINAL
+        serials = (ordinals - offset) // 7
+        serials[missing] = _NA_SERIAL
+        return cls(serials, system)
+
+    def __arrow_array__(self, type: Any = None) -> Any:  # noqa: A002
+        """Return Arrow array of weeks using ``epiweeks.arrow`` extension type."""
+        import pyarrow as pa  # noqa: PLC0415
+
+        from epiweeks.arrow import EpiWeekType  # noqa: PLC0415
+
+        storage = pa.array(self._serials, pa.int32(), mask=self.isna())
+        return pa.ExtensionArray.from_storage(EpiWeekType(self._dtype.system), storage)
+
+    @property
+    def dtype(self) -> EpiWeekDtype:
+        """Return dtype of array."""
+        return self._dtype
+
+    @property
+    def nbytes(self) -> int:
+        """Return number of bytes used by array."""
+        return int(self._serials.nbytes)
+
+    @property
+    def serials(self) -> NDArray[np.int64]:
+        """Return underlying array of week serial numbers."""
+        return self._serials
+
+    def __len__(self) -> int:
+        return len(self._serials)
+
+    def __getitem__(self, item: Any) -> Any:
+        if isinstance(item, (int, np.integer)):
+            serial = int(self._serials[item])
+            if serial == _NA_SERIAL:
+                return pd.NA
+            return Week.fromserial(serial, self._dtype.system)
+        item = pd.api.indexers.check_array_indexer(self, item)
+        return self.__class__(self._serials[item], self._dtype.system)
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        key = pd.api.indexers.check_array_indexer(self, key)
+        if pd.api.types.is_list_like(value) and not isinstance(value, Week):
+            self._serials[key] = self._from_sequence(value, dtype=self._dtype).serials
+        else:
+            self._serials[key] = self._scalar_serial(value)
+
+    def __eq__(self, other: object) -> Any:
+        return self._compare(other, operator.eq)
+
+    def __ne__(self, other: object) -> Any:
+        return self._compare(other, operator.ne)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __lt__(self, other: object) -> Any:
+        return self._compare(other, operator.lt)
+
+    def __le__(self, other: object) -> Any:
+        return self._compare(other, operator.le)
+
+    def __gt__(self, other: object) -> Any:
+        return self._compare(other, operator.gt)
+
+    def __ge__(self, other: object) -> Any:
+        return self._compare(other, operator.ge)
+
+    def _compare(self, other: object, op: Callable[[Any, Any], Any]) -> Any:
+        """Compare weeks of array with a Week object or another array."""
+        if isinstance(other, (pd.Series, pd.Index, pd.DataFrame)):
+            return NotImplemented
+        other_serials: int | NDArray[np.int64]
+        if isinstance(other, Week) or pd.api.types.is_scalar(other):
+            other_serials = self._scalar_serial(other)
+        else:
+            other_serials = self._from_sequence(other, dtype=self._dtype).serials
+        result = op(self._serials, other_serials)
+        result[self.isna() | (other_serials == _NA_SERIAL)] = op is operator.ne
+        return result
+
+    def _scalar_serial(self, value: object) -> int:
+        """Return serial number of a Week object or missing value."""
+        if isinstance(value, Week):
+            if value.system != self._dtype.system:
+                message = f"Week must be of '{self._dtype.system}' system: {value!r}"
+                raise TypeError(message)
+            return value.toserial()
+        if pd.isna(value):
+            return int(_NA_SERIAL)
+        message = f"Item must be 'Week' object: {type(value).__name__}"
+        raise TypeError(message)
+
+    def isna(self) -> NDArray[np.bool_]:
+        """Return boolean array indicating missing weeks."""
+        missing: NDArray[np.bool_] = self._serials == _NA_SERIAL
+        return missing
+
+    def take(
+        self,
+        indices: Sequence[int],
+        *,
+        allow_fill: bool = False,
+        fill_value: Any = None,
+    ) -> "EpiWeekArray":
+        """Return array of weeks at indices."""
+        if allow_fill:
+            fill_value = self._scalar_serial(fill_value)
+        serials = take(
+            self._serials, indices, allow_fill=allow_fill, fill_value=fill_value
+        )
+        return self.__class__(serials, self._dtype.system)
+
+    def copy(self) -> "EpiWeekArray":
+        """Return a copy of array."""
+        return self.__class__(self._serials.copy(), self._dtype.system)
+
+    @classmethod
+    def _concat_same_type(cls, to_concat: Sequence["EpiWeekArray"]) -> "EpiWeekArray":
+        systems = {array.dtype.system for array in to_concat}
+        if len(systems) > 1:
+            message = f"Can not concatenate arrays of different systems: {systems}"
+            raise TypeError(message)
+        serials = np.concatenate([array.serials for array in to_concat])
+        return cls(serials, to_concat[0].dtype.system)
+
+    def _reduce(
+        self, name: str, *, skipna: bool = True, keepdims: bool = False, **kwargs: Any
+    ) -> Any:
+        """Return minimum or maximum week of array, which are only reductions."""
+        if name not in ("min", "max"):
+            return super()._reduce(name, skipna=skipna, keepdims=keepdims, **kwargs)
+        missing = self.isna()
+        if missing.all() or (missing.any() and not skipna):
+            serial = _NA_SERIAL
+        else:
+            serials = self._serials[~missing]
+            serial = serials.min() if name == "min" else serials.max()
+        if keepdims:
+            return self.__class__([serial], self._dtype.system)
+        return self.__class__([serial], self._dtype.system)[0]
+
+    def _values_for_factorize(self) -> tuple[NDArray[np.int64], int]:
+        return self._serials, int(_NA_SERIAL)
+
+    def _values_for_argsort(self) -> NDArray[np.int64]:
+        return self._serials
+
+    def years(self) -> NDArray[np.int32]:
+        """Return years of weeks, where missing weeks are 0."""
+        return self._weektuples()[0]
+
+    def weeks(self) -> NDArray[np.int32]:
+        """Return week numbers of weeks, where missing weeks are 0."""
+        return self._weektuples()[1]
+
+    def startdates(self) -> NDArray[np.datetime64]:
+        """Return first days of weeks, where missing weeks are ``NaT``."""
+        return self._daydates(0)
+
+    def enddates(self) -> NDArray[np.datetime64]:
+        """Return last days of weeks, where missing weeks are ``NaT``."""
+        return self._daydates(6)
+
+    def _daydates(self, days: int) -> NDArray[np.datetime64]:
+        """Return dates for number of days after first days of weeks."""
+        ordinals = self._serials * 7 + _get_system(self._dtype.system)._offset + days
+        daydates = (ordinals - _EPOCH_ORDINAL).astype("datetime64[D]")
+        daydates[self.isna()] = np.datetime64("NaT", "D")
+        return daydates
+
+    def _weektuples(self) -> tuple[NDArray[np.int32], NDArray[np.int32]]:
+        """Return years and week numbers of weeks."""
+        missing = self.isna()
+        serials = np.where(missing, 0, self._serials)
+        ordinals = serials * 7 + _get_system(self._dtype.system)._offset
+        ordinals[missing] = 1
+        years, weeks = fromordinals(ordinals, self._dtype.system)
+        years[missing] = 0
+        weeks[missing] = 0
+        return years, weeks
+
+
+@register_series_accessor("epiweek")
+class EpiWeekAccessor:
+    """Accessor for epidemiological weeks calculation on pandas Series.
+
+    It is available as ``Series.epiweek`` after importing this module.
+    """
+
+    def __init__(self, series: pd.Series):
+        """Initialize EpiWeekAccessor object.
+
+        Args:
+            series: Series of dates or epidemiological weeks.
+        """
+        self._series = series
+
+    def fromdates(self, system: str = "cdc") -> pd.Series:
+        """Return Series of weeks for Series of dates.
+
+        Args:
+            system: Week numbering system, which may be ``cdc`` where the
+                week starts on Sunday or ``iso`` where the week starts on
+                Monday.
+        """
+        dates = pd.to_datetime(self._series).to_numpy(dtype="datetime64[D]")
+        weeks = EpiWeekArray.fromdates(dates, system)
+        return pd.Series(weeks, index=self._series.index, name=self._series.name)
+
+    @property
+    def year(self) -> pd.Series:
+        """Return Series of years of weeks."""
+        return self._integers(self._array().years())
+
+    @property
+    def week(self) -> pd.Series:
+        """Return Series of week numbers of weeks."""
+        return self._integers(self._array().weeks())
+
+    @property
+    def serial(self) -> pd.Series:
+        """Return Series of week serial numbers of weeks."""
+        return self._integers(self._array().serials)
+
+    @property
+    def startdate(self) -> pd.Series:
+        """Return Series of first days of weeks."""
+        return self._datetimes(self._array().startdates())
+
+    @property
+    def enddate(self) -> pd.Series:
+        """Return Series of last days of weeks."""
+        return self._datetimes(self._array().enddates())
+
+    def cdcformat(self) -> pd.Series:
+        """Return Series of strings representing weeks in CDC format ``YYYYww``."""
+        return self._strings("")
+
+    def isoformat(self) -> pd.Series:
+        """Return Series of strings representing weeks in ISO format ``YYYYWww``."""
+        return self._strings("W")
+
+    def _array(self) -> EpiWeekArray:
+        """Return underlying EpiWeekArray of Series."""
+        array = self._series.array
+        if not isinstance(array, EpiWeekArray):
+            message = "Series must be of 'epiweek' dtype, use 'fromdates' first"
+            raise AttributeError(message)
+        return array
+
+    def _integers(self, values: NDArray[Any]) -> pd.Series:
+        """Return Series of nullable integers masking missing weeks."""
+        integers = pd.array(values, dtype="Int64")
+        integers[self._array().isna()] = pd.NA
+        return pd.Series(integers, index=self._series.index, name=self._series.name)
+
+    def _datetimes(self, values: NDArray[np.datetime64]) -> pd.Series:
+        """Return Series of datetimes with seconds resolution."""
+        datetimes = values.astype("datetime64[s]")
+        return pd.Series(datetimes, index=self._series.index, name=self._series.name)
+
+    def _strings(self, separator: str) -> pd.Series:
+        """Return Series of strings joining zero-padded years and week numbers."""
+        array = self._array()
+        years = np.char.zfill(array.years().astype(str), 4)
+        weeks = np.char.zfill(array.weeks().astype(str), 2)
+        strings = np.char.add(np.char.add(years, separator), weeks).astype(object)
+        strings[array.isna()] = None
+        return pd.Series(strings, index=self._series.index, name=self._series.name)
+
+
+def _resolve_dtype(dtype: Any) -> EpiWeekDtype:
+    """Return EpiWeekDtype object for a dtype or dtype string."""
+    if isinstance(dtype, EpiWeekDtype):
+        return dtype
+    return EpiWeekDtype.construct_from_string(dtype)
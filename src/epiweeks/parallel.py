@@ -0,0 +1,138 @@
+"""Parallel conversion of large numbers of dates to epidemiological weeks.
+
+Dates are split into chunks that are converted in a pool of worker
+processes or threads, and results are yielded in input order as WeekArray
+objects of week serial numbers. Only a bounded number of chunks are
+converted ahead of the chunk being yielded, so that iterators of dates of
+any length are converted in bounded memory.
+
+Worker processes return week serial numbers as arrays of C integers, which
+are pickled as raw buffers, instead of Week objects. Worker threads share
+memory with the calling thread, but only run in parallel on free-threaded
+builds of Python, as converting dates holds the global interpreter lock.
+"""
+
+import os
+
+from array import array
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from datetime import date
+from itertools import islice
+from typing import Any, Literal, TypeVar
+
+from epiweeks import WeekArray, WeekSystem, _get_system
+
+__all__ = ["convert_many"]
+
+_T = TypeVar("_T")
+
+
+def convert_many(
+    dates: Iterable[date | str],
+    system: str = "cdc",
+    *,
+    workers: int | None = None,
+    backend: Literal["process", "thread"] = "process",
+    chunksize: int = 65536,
+) -> Iterator[WeekArray]:
+    """Return an iterator of arrays of weeks containing dates, in input order.
+
+    Args:
+        dates: Python date objects or ISO formatted ``YYYY-MM-DD`` strings,
+            where any time part after the date is ignored.
+        system: Week numbering system, which may be ``cdc`` where the
+            week starts on Sunday or ``iso`` where the week starts on
+            Monday.
+        workers: Number of worker processes or threads, which defaults to
+            number of CPUs. When 1, dates are converted in calling thread.
+        backend: Whether to convert dates in a pool of worker ``process``
+            or ``thread``.
+        chunksize: Number of dates converted at a time by a worker, which
+            is also the length of yielded arrays except for the last one.
+
+    Raises:
+        ValueError: When ``system`` is not within supported systems.
+        ValueError: When ``workers`` or ``chunksize`` is not positive.
+        ValueError: When ``backend`` is not within supported backends.
+        ValueError: When any of ``dates`` is an invalid date string.
+    """
+    system = _get_system(system)
+    workers = (os.cpu_count() or 1) if workers is None else workers
+    if workers < 1 or chunksize < 1:
+        message = "Workers and chunksize must be positive integers"
+        raise ValueError(message)
+    if backend not in ("process", "thread"):
+        message = "Backend must be in ('process', 'thread')"
+        raise ValueError(message)
+    return _convert_chunks(dates, system, workers, backend, chunksize)
+
+
+def _convert_chunks(
+    dates: Iterable[date | str],
+    system: WeekSystem,
+    workers: int,
+    backend: str,
+    chunksize: int,
+) -> Iterator[WeekArray]:
+    """Yield arrays of weeks of chunks of dates in input order."""
+    offset = system._offset
+    iterator = iter(dates)
+    chunks = iter(lambda: list(islice(iterator, chunksize)), [])
+    arguments = ((chunk, offset) for chunk in chunks)
+    if workers == 1:
+        for serials in _map_ordered(None, _convert_chunk, arguments, 0):
+            yield WeekArray.fromserials(serials, system)
+        return
+    executor: Executor
+    if backend == "process":
+        executor = ProcessPoolExecutor(workers)
+    else:
+        executor = ThreadPoolExecutor(workers)
+    try:
+        for serials in _map_ordered(executor, _convert_chunk, arguments, workers * 2):
+            yield WeekArray.fromserials(serials, system)
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+def _map_ordered(
+    executor: Executor | None,
+    function: Callable[..., _T],
+    arguments: Iterable[tuple[Any, ...]],
+    ahead: int,
+) -> Iterator[_T]:
+    """Yield results of function called with arguments, in input order.
+
+    When an executor is used, at most ``ahead`` calls are submitted ahead of
+    the call whose result is being yielded. Otherwise, function is called in
+    calling thread.
+    """
+    if executor is None:
+        for args in arguments:
+            yield function(*args)
+        return
+    pending: deque[Future[_T]] = deque()
+    for args in arguments:
+        pending.append(executor.submit(function, *args))
+        if len(pending) > ahead:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def _convert_chunk(dates: list[date | str], offset: int) -> "array[int]":
+    """Return week serial numbers of dates for system serial offset."""
+    serials = array("i")
+    append = serials.append
+    fromisoformat = date.fromisoformat
+    for value in dates:
+        date_object = fromisoformat(value[:10]) if isinstance(value, str) else value
+        append((date_object.toordinal() - offset) // 7)
+    return serials
@@ -0,0 +1,150 @@
+"""SQLite functions for epidemiological weeks calculation.
+
+Registering the functions on a ``sqlite3`` connection allows converting
+dates to weeks within queries, so that rows can be grouped, filtered and
+indexed by weeks without reading them into Python. Functions take dates as
+``YYYY-MM-DD`` text, where any time part after the date is ignored, and an
+optional week numbering system, which is ``cdc`` by default. They return
+``NULL`` for ``NULL`` or invalid dates and invalid systems, as the ``date``
+function of SQLite does, so that a single bad row does not fail a whole
+query, and are deterministic, so that they can be used in indexes on
+expressions:
+
+.. code-block:: sql
+
+    SELECT epiweek(onset_date), count(*) FROM cases GROUP BY 1;
+    CREATE INDEX cases_epiweek ON cases (epiweek(onset_date, 'iso'));
+
+The following functions are registered:
+
+- ``epiweek(date[, system])`` returns week as an integer ``YYYYww``.
+- ``epiweek_year(date[, system])`` returns epidemiological year.
+- ``epiweek_start(date[, system])`` returns first day of week as text.
+- ``epiweek_format(date[, system])`` returns week as text formatted as
+  ``YYYYww`` for CDC system and ``YYYYWww`` for other systems.
+"""
+
+import sqlite3
+
+from collections.abc import Callable
+from datetime import date
+
+from epiweeks import Week, _get_system, _ordinal_weektuple, calendar
+
+__all__ = ["create_calendar", "register"]
+
+_Function = Callable[[int, str], int | str]
+
+
+def register(connection: sqlite3.Connection) -> None:
+    """Register epidemiological week functions on a connection.
+
+    Args:
+        connection: SQLite database connection.
+    """
+    functions: dict[str, _Function] = {
+        "epiweek": _epiweek,
+        "epiweek_year": _epiweek_year,
+        "epiweek_start": _epiweek_start,
+        "epiweek_format": _epiweek_format,
+    }
+    for name, function in functions.items():
+        sql_function = _wrap(function)
+        connection.create_function(name, 1, sql_function, deterministic=True)
+        connection.create_function(name, 2, sql_function, deterministic=True)
+
+
+def create_calendar(
+    connection: sqlite3.Connection,
+    start: int = 1900,
+    stop: int = 2100,
+    system: str = "cdc",
+    *,
+    table: str = "epiweek_calendar",
+) -> None:
+    """Create a temporary table of all weeks for a range of years.
+
+    The table has ``epiweek`` integer primary key of week formatted as
+    ``YYYYww``, ``year`` and ``week`` integer columns, and ``startdate`` and
+    ``enddate`` text columns, so that it can be joined with results of the
+    ``epiweek`` function, such as to include weeks without any rows.
+
+    Args:
+        connection: SQLite database connection.
+        start: First year of range.
+        stop: Year at which range stops, which is not included in range.
+        system: Week numbering system, which may be ``cdc`` where the
+            week starts on Sunday or ``iso`` where the week starts on
+            Monday.
+        table: Name of temporary table to create.
+
+    Raises:
+        ValueError: When ``stop`` is not after ``start``.
+        ValueError: When ``start`` or ``stop`` is out of supported range.
+        ValueError: When ``system`` is not within supported systems.
+        sqlite3.OperationalError: When ``table`` already exists.
+    """
+    columns = calendar.columns(start, stop, system)
+    name = '"' + table.replace('"', '""') + '"'
+    connection.execute(
+        f"CREATE TEMP TABLE {name} (epiweek INTEGER PRIMARY KEY, year INTEGER, "
+        "week INTEGER, startdate TEXT, enddate TEXT)"
+    )
+    connection.executemany(
+        f"INSERT INTO {name} VALUES (?, ?, ?, ?, ?)",
+        (
+            (
+                year * 100 + week,
+                year,
+                week,
+                date.fromordinal(start_ordinal).isoformat(),
+                date.fromordinal(end_ordinal).isoformat(),
+            )
+            for year, week, start_ordinal, end_ordinal in zip(
+                columns["year"],
+                columns["week"],
+                columns["startordinal"],
+                columns["endordinal"],
+                strict=True,
+            )
+        ),
+    )
+
+
+def _wrap(function: _Function) -> Callable[..., int | str | None]:
+    """Return SQL function that parses date text and calls function.
+
+    Invalid dates and systems return ``None`` instead of raising, which
+    SQLite would report as an error of the whole statement.
+    """
+
+    def sql_function(value: str | None, system: str = "cdc") -> int | str | None:
+        if value is None:
+            return None
+        try:
+            return function(date.fromisoformat(value[:10]).toordinal(), system)
+        except (TypeError, ValueError):
+            return None
+
+    return sql_function
+
+
+def _epiweek(ordinal: int, system: str) -> int:
+    """Return week of date ordinal as an integer ``YYYYww``."""
+    year, week = _ordinal_weektuple(ordinal, _get_system(system))
+    return year * 100 + week
+
+
+def _epiweek_year(ordinal: int, system: str) -> int:
+    """Return epidemiological year of date ordinal."""
+    return _ordinal_weektuple(ordinal, _get_system(system))[0]
+
+
+def _epiweek_start(ordinal: int, system: str) -> str:
+    """Return first day of week of date ordinal as ``YYYY-MM-DD`` text."""
+    return Week.fromordinal(ordinal, system).startdate().isoformat()
+
+
+def _epiweek_format(ordinal: int, system: str) -> str:
+    """Return week of date ordinal formatted as text."""
+    return str(Week.fromordinal(ordinal, system))
@@ -45,3 +45,25 @@ def test_iso_week_to_startdate(test_input, expected):
 def test_iso_week_from_startdate(test_input, expected):
     week = epiweeks.Week.fromdate(date(*test_input), "ISO").weektuple()
     assert week == expected
+
+
+def generate_weeks(system, years):
+    """Return reference data of weeks and their start dates as in fixtures."""
+    weeks = (w for y in years for w in epiweeks.Year(y, system).iterweeks())
+    return [[list(w.weektuple()), list(w.startdate().timetuple()[:3])] for w in weeks]
+
+
+@pytest.mark.parametrize(
+    ("test_input", "system"),
+    [((6, "cdc_weeks.json"), "CDC"), ((0, "iso_weeks.json"), "ISO")],
+)
+def test_registered_system_weeks(test_input, system):
+    startweekday, file = test_input
+    json_file = pathlib.Path(__file__).parent.joinpath("fixtures", file)
+    reference = json.loads(json_file.read_text(encoding="utf-8"))
+    registered = epiweeks.register_system("test", startweekday)
+    try:
+        assert generate_weeks(registered, range(2007, 2026)) == reference
+        assert generate_weeks(system, range(2007, 2026)) == reference
+    finally:
+        epiweeks.unregister_system("test")
@@ -0,0 +1,100 @@
+import pickle
+
+from datetime import date, datetime
+
+import pytest
+
+import epiweeks
+
+pa = pytest.importorskip("pyarrow")
+epiweeks_arrow = pytest.importorskip("epiweeks.arrow")
+
+
+@pytest.fixture
+def dates():
+    start = date(2014, 12, 1).toordinal()
+    return [date.fromordinal(start + i) for i in range(0, 1500, 5)]
+
+
+def test_type():
+    week_type = epiweeks_arrow.EpiWeekType("iso")
+    assert week_type.__repr__() == "EpiWeekType(ISO)"
+    assert hash(week_type) == hash(epiweeks_arrow.EpiWeekType("iso"))
+    assert week_type.system == "ISO"
+    assert week_type.storage_type == pa.int32()
+    assert week_type.extension_name == "epiweeks.epiweek"
+    assert week_type == epiweeks_arrow.EpiWeekType("ISO")
+    assert week_type != epiweeks_arrow.EpiWeekType("cdc")
+    assert pickle.loads(pickle.dumps(week_type)) == week_type
+
+
+@pytest.mark.parametrize("system", ["cdc", "iso"])
+def test_fromdates(dates, system):
+    weeks = epiweeks_arrow.fromdates(pa.array([*dates, None]), system)
+    expected = [epiweeks.Week.fromdate(d, system) for d in dates]
+    assert weeks.to_pylist() == [*expected, None]
+    assert weeks.storage.to_pylist()[:-1] == [w.toserial() for w in expected]
+    assert epiweeks_arrow.startdates(weeks).to_pylist()[:-1] == [
+        w.startdate() for w in expected
+    ]
+    assert epiweeks_arrow.enddates(weeks).to_pylist()[:-1] == [
+        w.enddate() for w in expected
+    ]
+
+
+def test_fromdates_timestamps():
+    timestamps = pa.array([datetime(2018, 12, 30, 23, 59), datetime(2019, 1, 6)])
+    weeks = epiweeks_arrow.fromdates(timestamps)
+    assert weeks.to_pylist() == [epiweeks.Week(2019, 1), epiweeks.Week(2019, 2)]
+
+
+def test_fromweeks():
+    weeks = [epiweeks.Week(2019, 1, "iso"), None]
+    assert epiweeks_arrow.fromweeks(weeks, "iso").to_pylist() == weeks
+    with pytest.raises(TypeError, match="Item must be 'Week' object of 'CDC'"):
+        epiweeks_arrow.fromweeks(weeks)
+
+
+def test_daydates_exception():
+    with pytest.raises(TypeError, match="Array must be of 'EpiWeekType' type"):
+        epiweeks_arrow.startdates(pa.array([1, 2]))
+
+
+def test_ipc_roundtrip(dates):
+    table = pa.table({"week": epiweeks_arrow.fromdates(dates, "iso")})
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    result = pa.ipc.open_stream(sink.getvalue()).read_all()
+    assert result.schema.field("week").type == epiweeks_arrow.EpiWeekType("iso")
+    assert result.equals(table)
+
+
+def test_parquet_roundtrip(dates, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    table = pa.table({"week": epiweeks_arrow.fromdates([*dates, None])})
+    pq.write_table(table, tmp_path / "weeks.parquet")
+    result = pq.read_table(tmp_path / "weeks.parquet")
+    assert result.equals(table)
+
+
+def test_pandas_roundtrip(dates):
+    pd = pytest.importorskip("pandas")
+    table = pa.table({"week": epiweeks_arrow.fromdates([*dates, None], "iso")})
+    frame = table.to_pandas()
+    assert frame["week"].dtype == pd.api.types.pandas_dtype("epiweek[iso]")
+    assert frame["week"].tolist()[:-1] == table.column("week").to_pylist()[:-1]
+    assert pa.Table.from_pandas(frame).column("week").equals(table.column("week"))
+
+
+def test_calendar():
+    table = epiweeks_arrow.calendar(2014, 2016, "iso", other="cdc")
+    assert table.column_names == [
+        *("year", "week", "epiweek", "startdate", "enddate", "totalweeks"),
+        *("cdc_year", "cdc_week"),
+    ]
+    weeks = [w for y in (2014, 2015) for w in epiweeks.Year(y, "iso").iterweeks()]
+    assert table.column("epiweek").to_pylist() == weeks
+    assert table.column("startdate").to_pylist() == [w.startdate() for w in weeks]
+    assert table.column("enddate").to_pylist() == [w.enddate() for w in weeks]
+    assert table.column("week").type == pa.int32()
@@ -0,0 +1,82 @@
+import csv
+import io
+
+from datetime import date
+
+import pytest
+
+import epiweeks
+
+from epiweeks import calendar
+
+
+@pytest.mark.parametrize("system", ["cdc", "iso"])
+def test_columns(system):
+    columns = calendar.columns(2014, 2017, system, other="iso")
+    weeks = [w for y in range(2014, 2017) for w in epiweeks.Year(y, system).iterweeks()]
+    assert list(columns["year"]) == [w.year for w in weeks]
+    assert list(columns["week"]) == [w.week for w in weeks]
+    assert list(columns["serial"]) == [w.toserial() for w in weeks]
+    assert list(columns["startordinal"]) == [w.startordinal() for w in weeks]
+    assert list(columns["endordinal"]) == [w.enddate().toordinal() for w in weeks]
+    assert list(columns["totalweeks"]) == [
+        epiweeks.Year(w.year, system).totalweeks() for w in weeks
+    ]
+    assert list(zip(columns["iso_year"], columns["iso_week"], strict=True)) == [
+        epiweeks.Week.fromdate(w.daydate(2), "iso").weektuple() for w in weeks
+    ]
+
+
+def test_columns_other():
+    columns = calendar.columns(2014, 2016, "cdc", other="iso")
+    assert list(columns) == [
+        *("year", "week", "serial", "startordinal", "endordinal", "totalweeks"),
+        *("iso_year", "iso_week"),
+    ]
+    index = list(columns["serial"]).index(epiweeks.Week(2014, 53).toserial())
+    assert (columns["iso_year"][index], columns["iso_week"][index]) == (2015, 1)
+    assert columns["year"].itemsize == 4
+
+
+@pytest.mark.parametrize(
+    ("test_input", "expected"),
+    [
+        ((2015, 2015), "Stop year must be after start year"),
+        ((0, 2015), r"Year must be in 1\.\.9999"),
+        ((9999, 10001), r"Year must be in 1\.\.9999"),
+        ((2014, 2015, "mmwr"), r"System must be in \('cdc', 'iso'\)"),
+    ],
+)
+def test_columns_exception(test_input, expected):
+    with pytest.raises(ValueError, match=expected):
+        calendar.columns(*test_input)
+
+
+def test_write_csv():
+    file = io.StringIO(newline="")
+    calendar.write_csv(file, 2014, 2016, other="iso")
+    rows = list(csv.reader(io.StringIO(file.getvalue())))
+    assert rows[0] == [
+        *("year", "week", "serial", "startdate", "enddate", "totalweeks"),
+        *("iso_year", "iso_week"),
+    ]
+    assert len(rows) == 1 + 53 + 52
+    serial = str(epiweeks.Week(2014, 1).toserial())
+    assert rows[1][:6] == ["2014", "1", serial, "2013-12-29", "2014-01-04", "53"]
+    assert rows[1][6:] == ["2014", "1"]
+    assert rows[-1][3:5] == [date(2015, 12, 27).isoformat(), "2016-01-02"]
+    assert file.getvalue().count("\n") == len(rows)
+    assert "\r" not in file.getvalue()
+
+
+def test_write_csv_columns():
+    file = io.StringIO(newline="")
+    calendar.write_csv(file, 1990, 2030, "iso")
+    rows = list(csv.reader(io.StringIO(file.getvalue())))
+    table = calendar.columns(1990, 2030, "iso")
+    assert len(rows[0]) == len(table)
+    for name in ("year", "week", "serial", "totalweeks"):
+        index = rows[0].index(name)
+        assert [int(row[index]) for row in rows[1:]] == table[name].tolist()
+    dates = [date.fromordinal(o).isoformat() for o in table["endordinal"]]
+    assert [row[4] for row in rows[1:]] == dates
@@ -0,0 +1,187 @@
+import io
+import json
+import runpy
+import sys
+
+import pytest
+
+from epiweeks import cli
+
+CSV_INPUT = """\
+id,date,cases
+1,2018-12-30,5
+2,2019-01-05T10:00:00,3
+3,,1
+4,2015-01-01,2
+5,2015-01-01,1
+"""
+
+CSV_OUTPUT = """\
+id,date,cases,epiweek,epiweek_year,epiweek_week,epiweek_startdate
+1,2018-12-30,5,201901,2019,1,2018-12-30
+2,2019-01-05T10:00:00,3,201901,2019,1,2018-12-30
+3,,1,,,,
+4,2015-01-01,2,201453,2014,53,2014-12-28
+5,2015-01-01,1,201453,2014,53,2014-12-28
+"""
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    path = tmp_path / "input.csv"
+    path.write_text(CSV_INPUT, encoding="utf-8")
+    return path
+
+
+@pytest.mark.parametrize(
+    "options",
+    [[], ["--chunk-size", "1"], ["--workers", "2", "--chunk-size", "1"]],
+)
+def test_csv(csv_file, tmp_path, options):
+    output = tmp_path / "output.csv"
+    args = [str(csv_file), "-c", "date", "-o", str(output), "--errors", "coerce"]
+    assert cli.main([*args, *options]) == 0
+    assert output.read_text(encoding="utf-8") == CSV_OUTPUT
+
+
+def test_csv_workers(tmp_path):
+    path = tmp_path / "input.csv"
+    rows = [f"2019-01-{day:02}" for day in range(1, 32)] * 2
+    path.write_text("\n".join(["date", *rows]) + "\n", encoding="utf-8")
+    output = tmp_path / "output.csv"
+    args = [str(path), "-c", "date", "-o", str(output), "-w", "2"]
+    assert cli.main([*args, "--chunk-size", "3"]) == 0
+    lines = output.read_text(encoding="utf-8").splitlines()
+    assert [line.split(",")[0] for line in lines[1:]] == rows
+    assert lines[7] == "2019-01-07,201902,2019,2,2019-01-06"
+
+
+def test_main_module(monkeypatch, capsys):
+    monkeypatch.setattr(sys, "argv", ["epiweeks", "--help"])
+    with pytest.raises(SystemExit) as e:
+        runpy.run_module("epiweeks", run_name="__main__")
+    assert e.value.code == 0
+    assert "usage: epiweeks" in capsys.readouterr().out
+
+
+def test_csv_options(csv_file, capsys):
+    args = [str(csv_file), "-c", "date", "-s", "iso", "--prefix", "w"]
+    args += ["--date-format", "%Y-%m-%d", "--errors", "coerce"]
+    assert cli.main(args) == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0].endswith("w,w_year,w_week,w_startdate")
+    assert lines[1].endswith("2018W52,2018,52,2018-12-24")
+    assert lines[2].endswith(",,,,")
+
+
+def test_ndjson(monkeypatch, capsys):
+    records = [{"date": "2018-12-30", "n": 1}, {"date": None}, {"date": [1]}]
+    lines = "\n".join(json.dumps(r) for r in records) + "\n\n"
+    stdin = io.TextIOWrapper(io.BytesIO(lines.encode()), encoding="utf-8")
+    monkeypatch.setattr(sys, "stdin", stdin)
+    assert cli.main(["-c", "date", "-f", "ndjson", "--errors", "coerce"]) == 0
+    output = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert output[0] == {
+        "date": "2018-12-30",
+        "n": 1,
+        "epiweek": "201901",
+        "epiweek_year": 2019,
+        "epiweek_week": 1,
+        "epiweek_startdate": "2018-12-30",
+    }
+    assert output[1]["epiweek"] is None
+
+
+def test_ndjson_format_guess(tmp_path):
+    path = tmp_path / "input.ndjson"
+    path.write_text('{"d": "2019-01-06"}\n', encoding="utf-8")
+    output = tmp_path / "output.ndjson"
+    assert cli.main([str(path), "-c", "d", "-o", str(output)]) == 0
+    assert json.loads(output.read_text(encoding="utf-8"))["epiweek"] == "201902"
+
+
+def test_empty_input(tmp_path, capsys):
+    path = tmp_path / "input.csv"
+    path.write_text("", encoding="utf-8")
+    assert cli.main([str(path), "-c", "date"]) == 0
+    assert capsys.readouterr().out == ""
+
+
+@pytest.mark.parametrize(
+    ("test_input", "expected"),
+    [
+        (["-c", "day"], "error: Column not found in input: 'day'"),
+        (["-c", "date"], "error: Invalid date '': Invalid isoformat string"),
+        (["-c", "date", "-w", "2"], "error: Invalid date ''"),
+    ],
+)
+def test_errors(csv_file, capsys, test_input, expected):
+    assert cli.main([str(csv_file), *test_input]) == 1
+    assert expected in capsys.readouterr().err
+
+
+def test_missing_field(tmp_path, capsys):
+    path = tmp_path / "input.ndjson"
+    path.write_text('{"d": "2019-01-06"}\n{"e": 1}\n', encoding="utf-8")
+    assert cli.main([str(path), "-c", "d"]) == 1
+    assert "Column not found in row: 'd'" in capsys.readouterr().err
+
+
+def test_missing_field_coerce(tmp_path, capsys):
+    path = tmp_path / "input.ndjson"
+    path.write_text('{"d": "2019-01-06"}\n{"x": 1}\n', encoding="utf-8")
+    assert cli.main([str(path), "-c", "d", "--errors", "coerce"]) == 0
+    output = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert output[0]["epiweek"] == "201902"
+    assert output[1] == {
+        "x": 1,
+        "epiweek": None,
+        "epiweek_year": None,
+        "epiweek_week": None,
+        "epiweek_startdate": None,
+    }
+
+
+@pytest.mark.parametrize("errors", ["raise", "coerce"])
+def test_non_object_record(tmp_path, capsys, errors):
+    path = tmp_path / "input.ndjson"
+    path.write_text('{"d": "2019-01-06"}\n[1, 2]\n', encoding="utf-8")
+    assert cli.main([str(path), "-c", "d", "--errors", errors]) == 1
+    assert "Column not found in row: 'd'" in capsys.readouterr().err
+
+
+def test_short_row_coerce(tmp_path, capsys):
+    path = tmp_path / "input.csv"
+    path.write_text("id,date\n1,2019-01-06\n2\n", encoding="utf-8")
+    assert cli.main([str(path), "-c", "date", "--errors", "coerce"]) == 1
+    assert "Column not found in row: 1" in capsys.readouterr().err
+
+
+def test_file_errors(csv_file, tmp_path, capsys):
+    missing = tmp_path / "missing.csv"
+    with pytest.raises(SystemExit) as e:
+        cli.main([str(missing), "-c", "date"])
+    assert e.value.code == 2
+    assert f"error: can't open '{missing}'" in capsys.readouterr().err
+    output = tmp_path / "missing" / "output.csv"
+    with pytest.raises(SystemExit) as e:
+        cli.main([str(csv_file), "-c", "date", "-o", str(output)])
+    assert e.value.code == 2
+    assert f"error: can't open '{output}'" in capsys.readouterr().err
+    with pytest.raises(SystemExit):
+        cli.main([str(missing), "-c", "date", "-o", str(tmp_path / "output.csv")])
+    assert not (tmp_path / "output.csv").exists()
+
+
+@pytest.mark.parametrize(
+    ("test_input", "expected"),
+    [
+        (["-c", "date", "-s", "mmwr"], "System must be in"),
+        (["-c", "date", "-w", "0"], "must be a positive integer: 0"),
+    ],
+)
+def test_argument_errors(csv_file, capsys, test_input, expected):
+    with pytest.raises(SystemExit) as e:
+        cli.main([str(csv_file), *test_input])
+    assert e.value.code == 2
+    assert expected in capsys.readouterr().err
@@ -0,0 +1,53 @@
+import random
+
+import pytest
+
+import epiweeks
+
+from epiweeks import codec
+
+
+@pytest.mark.parametrize("system", ["cdc", "iso"])
+def test_round_trip(system):
+    random.seed(system)
+    first = epiweeks.Week(1, 1, system).toserial()
+    last = epiweeks.Week(9999, 52, system).toserial()
+    serials = [first, last, *random.sample(range(first, last + 1), 1000)]
+    weeks = epiweeks.WeekArray.fromserials(serials, system)
+    data = codec.encode_weeks(weeks, system)
+    assert codec.decode_weeks(data) == weeks
+    assert codec.encode_weeks(list(weeks), system) == data
+    assert codec.decode_weeks(memoryview(b"\0" + data)[1:]) == weeks
+
+
+def test_encoded_size():
+    weeks = epiweeks.WeekRange(epiweeks.Week(2000, 1), epiweeks.Week(2020, 1))
+    data = codec.encode_weeks(weeks)
+    assert data[:7] == b"EW\x01\x03cdc"
+    assert len(data) == 7 + 2 + 3 + len(weeks) - 1
+    assert codec.decode_weeks(data).tolist() == list(weeks)
+    assert codec.encode_weeks([], "iso") == b"EW\x01\x03iso\x00"
+    assert len(codec.decode_weeks(b"EW\x01\x03iso\x00")) == 0
+
+
+def test_encode_exception():
+    with pytest.raises(TypeError, match="Item must be 'Week' object of 'ISO'"):
+        codec.encode_weeks([epiweeks.Week(2015, 1)], "iso")
+
+
+@pytest.mark.parametrize(
+    ("test_input", "expected"),
+    [
+        (b"", "Data must be weeks encoded by 'encode_weeks'"),
+        (b"EW\x02\x03cdc\x00", "Data must be weeks encoded by 'encode_weeks'"),
+        (b"EW\x01\x04mmwr\x00", r"System must be in \('cdc', 'iso'\)"),
+        (b"EW\x01\x03cdc\x02\x80", "Data of encoded weeks is truncated"),
+        (b"EW\x01\x03cdc\x01\xff\xff\xff\xff\x7f", "truncated or corrupted"),
+        (b"EW\x01\x03cdc\x01\x01", "truncated or corrupted"),
+        (b"EW\x01\x03cdc\x01\xf6\xd7\x3f", "truncated or corrupted"),
+        (b"EW\x01\x03cdc\x00\x00", "Data of encoded weeks has trailing bytes"),
+    ],
+)
+def test_decode_exception(test_input, expected):
+    with pytest.raises(ValueError, match=expected):
+        codec.decode_weeks(test_input)
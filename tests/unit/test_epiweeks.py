@@ -1,4 +1,11 @@
-from datetime import date, timedelta
+import os
+import pickle
+import subprocess
+import sys
+
+from datetime import date, datetime, timedelta, timezone
+from itertools import pairwise
+from zoneinfo import ZoneInfo
 
 import pytest
 
@@ -58,9 +65,25 @@ def test_week_subtracting(week_cdc, week_iso):
     assert (week_iso - 1) == epiweeks.Week(2014, 52, system="iso")
 
 
+def test_week_difference(week_cdc, week_iso):
+    assert week_cdc - epiweeks.Week(2014, 50, system="cdc") == 4
+    assert week_iso - epiweeks.Week(2016, 1, system="iso") == -53
+    assert week_cdc - week_cdc == 0
+
+
+def test_week_difference_exception(week_cdc, week_iso):
+    with pytest.raises(TypeError, match="Can not compare 'Week' objects"):
+        week_cdc - week_iso
+
+
 def test_week_containment(week_cdc, week_iso):
     assert date(2015, 1, 5) in week_cdc
     assert date(2015, 1, 1) in week_iso
+    assert date(2015, 1, 4) in week_cdc
+    assert date(2015, 1, 10) in week_cdc
+    assert date(2015, 1, 3) not in week_cdc
+    assert date(2015, 1, 11) not in week_cdc
+    assert datetime(2015, 1, 10, 23, 59) in week_cdc
 
 
 @pytest.mark.parametrize(
@@ -87,7 +110,7 @@ def test_week_comparison_exception(week_cdc, week_iso, test_input):
     ("test_input", "expected"),
     [
         ("__add__", "Second operand must be 'int'"),
-        ("__sub__", "Second operand must be 'int'"),
+        ("__sub__", "Second operand must be 'int' or 'Week'"),
         ("__contains__", "Tested operand must be 'datetime.date' object"),
     ],
 )
@@ -131,6 +154,188 @@ def test_week_fromstring(test_input, expected):
     assert week.weektuple() == expected
 
 
+@pytest.mark.parametrize("system", ["cdc", "iso"])
+def test_week_fromordinal(system):
+    for day in (date(2014, 12, 27), date(2014, 12, 29), date(2015, 1, 4)):
+        week = epiweeks.Week.fromdate(day, system)
+        assert epiweeks.Week.fromordinal(day.toordinal(), system) == week
+        epochday = (day - date(1970, 1, 1)).days
+        assert epiweeks.Week.fromepochday(epochday, system) == week
+        assert week.startordinal() == week.startdate().toordinal()
+
+
+@pytest.mark.parametrize(
+    ("test_input", "expected"),
+    [
+        ((0, "cdc"), r"Ordinal must be in 1\.\.3652059"),
+        ((3652060, "iso"), r"Ordinal must be in 1\.\.3652059"),
+        ((1, "mmwr"), r"System must be in \('cdc', 'iso'\)"),
+    ],
+)
+def test_week_fromordinal_exception(test_input, expected):
+    with pytest.raises(ValueError, match=expected):
+        epiweeks.Week.fromordinal(*test_input)
+
+
+@pytest.mark.parametrize(
+    ("test_input", "expected"),
+    [
+        ((1420329599, timezone.utc), (2014, 53)),
+        ((1420329600, timezone.utc), (2015, 1)),
+        ((1420329599.5, timezone(timedelta(hours=3))), (2015, 1)),
+        ((1420329600, timezone(timedelta(hours=-5))), (2014, 53)),
+        ((1420329600, ZoneInfo("America/New_York")), (2014, 53)),
+        ((-1, timezone.utc), (1969, 53)),
+    ],
+)
+def test_week_fromtimestamp(test_input, expected):
+    timestamp, tz = test_input
+    week = epiweeks.Week.fromtimestamp(timestamp, tz=tz)
+    assert week.weektuple() == expected
+    local_week = epiweeks.Week.fromdate(date.fromtimestamp(timestamp))
+    assert epiweeks.Week.fromtimestamp(timestamp) == local_week
+
+
+@pytest.mark.parametrize("system", ["cdc", "iso"])
+def test_week_serial(system):
+    week = epiweeks.Week(2015, 1, system)
+    assert week.toserial() == week.startdate().toordinal() // 7
+    assert epiweeks.Week.fromserial(week.toserial(), system) == week
+    assert (week - 1).toserial() == week.toserial() - 1
+    first, last = epiweeks.Week(1, 1, system), epiweeks.Week(9999, 52, system)
+    assert epiweeks.Week.fromserial(first.toserial(), system) == first
+    assert epiweeks.Week.fromserial(last.toserial(), system) == last
+
+
+@pytest.mark.parametrize(
+    ("test_input", "expected"),
+    [
+        ((-1, "cdc"), r"Serial must be in 0\.\.521722"),
+        ((521723, "iso"), r"Serial must be in 0\.\.521722"),
+    ],
+)
+def test_week_fromserial_out_of_range(test_input, expected):
+    with pytest.raises(ValueError, match=expected):
+        epiweeks.Week.fromserial(*test_input)
+
+
+def test_week_fromserial_new_system():
+    system = epiweeks.WeekSystem("test", 2)
+    week = epiweeks.Week.fromserial(100_000, system)
+    assert week.toserial() == 100_000
+    assert week.system is system
+
+
+@pytest.mark.parametrize(
+    ("test_input", "expected"),
+    [
+        ((0, 1, "cdc"), r"Year must be in 1\.\.9999"),
+        ((10000, 1, "iso"), r"Year must be in 1\.\.9999"),
+        ((2014, 54, "cdc"), r"Week must be in 1\.\.53 for year"),
+        ((2015, 1, "mmwr"), r"System must be in"),
+    ],
+)
+def test_week_value_exception(test_input, expected):
+    with pytest.raises(ValueError, match=expected):
+        epiweeks.Week(*test_input)
+
+
+@pytest.mark.parametrize("system", ["cdc", "iso"])
+@pytest.mark.parametrize("year", [-1, 0, 10000, 10001])
+def test_week_unvalidated_out_of_range(year, system):
+    week = epiweeks.Week(year, 2, system, validate=False)
+    startweekday = epiweeks._get_system(system).startweekday
+    start = epiweeks._compute_year_start(year, startweekday)
+    assert week.weektuple() == (year, 2)
+    assert week.toserial() == start // 7 + 1
+
+
+def test_week_unvalidated_system_exception():
+    with pytest.raises(ValueError, match="System must be in"):
+        epiweeks.Week(2019, 1, "mmwr", validate=False)
+
+
+@pytest.mark.parametrize(
+    ("test_input", "expected"),
+    [
+        ((2014, 52, "cdc"), (2014, 52)),
+        ((2014, 53, "cdc"), (2015, 1)),
+        ((2015, 1, "cdc"), (2015, 2)),
+        ((2015, 52, "cdc"), (2015, 53)),
+        ((2016, 1, "cdc"), (2016, 1)),
+        ((2015, 1, "iso"), (2014, 53)),
+        ((2015, 53, "iso"), (2015, 52)),
+        ((2016, 1, "iso"), (2016, 1)),
+        ((2021, 1, "iso"), (2021, 1)),
+    ],
+)
+def test_week_tosystem(test_input, expected):
+    week = epiweeks.Week(*test_input)
+    other = "iso" if week.system == "CDC" else "cdc"
+    equivalent = week.tosystem(other)
+    assert equivalent.weektuple() == expected
+    assert equivalent.system == other.upper()
+    assert equivalent.toserial() == week.toserial()
+    assert equivalent == epiweeks.Week.fromdate(week.daydate(2), other)
+    assert equivalent.tosystem(week.system) == week
+
+
+def test_week_tosystem_custom_systems():
+    system = epiweeks.register_system("test", 5)
+    try:
+        for week in epiweeks.WeekRange(epiweeks.Week(2013, 1), epiweeks.Week(2017, 1)):
+            middle = week.startdate() + timedelta(days=3)
+            equivalent = week.tosystem(system)
+            assert equivalent == epiweeks.Week.fromdate(middle, system)
+            middle = equivalent.startdate() + timedelta(days=3)
+            assert equivalent.tosystem("iso") == epiweeks.Week.fromdate(middle, "iso")
+    finally:
+        epiweeks.unregister_system("test")
+
+
+@pytest.mark.parametrize(
+    ("test_input", "expected"),
+    [((1, 1, "iso"), (1, 1)), ((9999, 52, "iso"), (9999, 52))],
+)
+def test_week_tosystem_range_limits(test_input, expected):
+    assert epiweeks.Week(*test_input).tosystem("cdc").weektuple() == expected
+
+
+@pytest.mark.parametrize("system", ["cdc", "iso"])
+def test_week_fromstrings(system):
+    week_strings = ["201452", "2015W01", "2016-W06", "2018-W01-2", "2017W527"]
+    weeks = epiweeks.Week.fromstrings(week_strings, system)
+    assert weeks == [epiweeks.Week.fromstring(s, system) for s in week_strings]
+    assert [w.toserial() for w in weeks] == [
+        epiweeks.Week.fromstring(s, system).toserial() for s in week_strings
+    ]
+
+
+def test_week_fromstrings_errors():
+    week_strings = ["201453", "201553", "00001", "2015", None, "2015W10"]
+    expected_errors = [
+        (1, "Week must be in 1..52 for year"),
+        (2, "Year must be in 1..9999"),
+        (3, "invalid literal for int() with base 10: ''"),
+        (4, "'NoneType' object has no attribute 'replace'"),
+    ]
+    weeks = [epiweeks.Week(2014, 53), epiweeks.Week(2015, 10)]
+    coerced = epiweeks.Week.fromstrings(week_strings, errors="coerce")
+    collected = epiweeks.Week.fromstrings(week_strings, errors="collect")
+    assert coerced == [weeks[0], None, None, None, None, weeks[1]]
+    assert collected == (weeks, expected_errors)
+    with pytest.raises(ValueError, match=r"Invalid week string at index 1: Week"):
+        epiweeks.Week.fromstrings(week_strings)
+    with pytest.raises(ValueError, match=r"Invalid week string at index 0: a bytes"):
+        epiweeks.Week.fromstrings([b"201901"])
+    assert epiweeks.Week.fromstrings([b"201901"], errors="coerce") == [None]
+
+
+def test_week_fromstrings_invalid_errors():
+    with pytest.raises(ValueError, match=r"Errors must be in \('raise', 'coerce'"):
+        epiweeks.Week.fromstrings([], errors="ignore")
+
+
 def test_week_thisweek():
     cdc_week = epiweeks.Week.thisweek(system="cdc")
     cdc_diff = (date.today().weekday() + 1) % 7
@@ -287,6 +492,66 @@ def test_year_enddate(year_cdc, year_iso):
     assert year_iso.enddate() == date(2016, 1, 3)
 
 
+def test_year_sequence(year_cdc, year_iso):
+    assert len(year_cdc) == 52
+    assert len(year_iso) == 53
+    assert year_cdc[0] == epiweeks.Week(2015, 1)
+    assert year_iso[-1] == epiweeks.Week(2015, 53, "iso")
+    assert list(year_cdc) == list(year_cdc.iterweeks())
+    assert list(reversed(year_cdc)) == list(year_cdc)[::-1]
+    assert year_cdc[10:13] == epiweeks.WeekRange(
+        epiweeks.Week(2015, 11), epiweeks.Week(2015, 14)
+    )
+    assert list(year_iso[::26]) == [epiweeks.Week(2015, w, "iso") for w in (1, 27, 53)]
+    assert epiweeks.Week(2015, 52) in year_cdc
+    assert epiweeks.Week(2014, 52) not in year_cdc
+    assert epiweeks.Week(2015, 52, "iso") not in year_cdc
+    assert "201552" not in year_cdc
+    with pytest.raises(IndexError):
+        year_cdc[52]
+
+
+@pytest.mark.parametrize(
+    ("test_input", "expected"),
+    [
+        ((date(2015, 1, 3), "cdc"), 2014),
+        ((date(2015, 1, 4), "cdc"), 2015),
+        ((date(2016, 1, 3), "iso"), 2015),
+    ],
+)
+def test_year_fromdate(test_input, expected):
+    year = epiweeks.Year.fromdate(*test_input)
+    assert year == epiweeks.Year(expected, test_input[1])
+
+
+def test_year_comparison(year_cdc, year_iso):
+    assert year_cdc == epiweeks.Year(2015)
+    assert year_cdc != epiweeks.Year(2016)
+    assert year_cdc < epiweeks.Year(2016) <= epiweeks.Year(2016)
+    assert year_cdc > epiweeks.Year(2014) >= epiweeks.Year(2014)
+    assert year_cdc.__eq__(2015) == NotImplemented
+    assert year_cdc.__lt__(2015) == NotImplemented
+    assert year_cdc.__le__(2015) == NotImplemented
+    assert year_cdc.__gt__(2015) == NotImplemented
+    assert year_cdc.__ge__(2015) == NotImplemented
+    assert year_cdc != year_iso
+    assert year_cdc != epiweeks.Year(2016, "iso")
+    with pytest.raises(TypeError, match="Can not compare 'Year' objects"):
+        assert year_cdc < year_iso
+
+
+def test_year_arithmetic(year_cdc):
+    assert year_cdc + 1 == epiweeks.Year(2016)
+    assert year_cdc - 1 == epiweeks.Year(2014)
+    assert year_cdc - epiweeks.Year(2010) == 5
+    with pytest.raises(TypeError, match="Second operand must be 'int': str"):
+        year_cdc + "1"
+    with pytest.raises(TypeError, match="Second operand must be 'int' or 'Year'"):
+        year_cdc - 1.0
+    with pytest.raises(ValueError, match=r"Year must be in 1\.\.9999"):
+        epiweeks.Year(9999) + 1
+
+
 def test_year_weeks(year_cdc, year_iso):
     cdc_weeks = []
     for w in range(1, 53):
@@ -324,6 +589,13 @@ def test_check_invalid_year(year):
         epiweeks._check_year(year)
 
 
+def test_check_ordinal():
+    system = epiweeks.WeekSystem("test", 2)
+    with pytest.raises(ValueError, match=r"Ordinal must be in 3\.\.3652056"):
+        epiweeks._check_ordinal(2, system)
+    epiweeks._check_ordinal(3, system)
+
+
 def test_check_valid_system():
     try:
         epiweeks._check_system("CDC")
@@ -356,3 +628,790 @@ def test_year_start_ordinal(test_input, expected):
 )
 def test_year_total_weeks(test_input, expected):
     assert epiweeks._year_total_weeks(*test_input) == expected
+
+
+@pytest.mark.parametrize("system", ["cdc", "iso"])
+def test_year_table(system):
+    year_starts, year_weeks = epiweeks._year_table(system)
+    startweekday = epiweeks._get_system(system).startweekday
+    for year in (1, 1582, 2015, 2020, 9999):
+        jan1 = date(year, 1, 1)
+        assert year_starts[year] == epiweeks._compute_year_start(year, startweekday)
+        assert abs(year_starts[year] - jan1.toordinal()) <= 3
+        assert year_weeks[year] in (52, 53)
+    assert epiweeks._year_table(system) is epiweeks._year_table(system)
+
+
+@pytest.mark.parametrize(
+    ("test_input", "expected"),
+    [((9999, "cdc"), 52), ((9999, "iso"), 52), ((1, "iso"), 52)],
+)
+def test_year_total_weeks_range_limits(test_input, expected):
+    assert epiweeks._year_total_weeks(*test_input) == expected
+
+
+@pytest.fixture(scope="module")
+def season_cdc():
+    return epiweeks.Season(2014)
+
+
+def test_season_representation(season_cdc):
+    assert season_cdc.__repr__() == "Season(2014, CDC, 40)"
+    assert season_cdc.__str__() == "2014-2015"
+
+
+def test_season_attributes(season_cdc):
+    assert season_cdc.year == 2014
+    assert season_cdc.system == "CDC"
+    assert season_cdc.startweek == 40
+    assert season_cdc.totalweeks() == 53
+    assert season_cdc.startdate() == date(2014, 9, 28)
+    assert season_cdc.enddate() == date(2015, 10, 3)
+
+
+def test_season_weeks(season_cdc):
+    weeks = list(epiweeks.WeekRange(epiweeks.Week(2014, 40), epiweeks.Week(2015, 40)))
+    assert list(season_cdc) == weeks
+    assert list(reversed(season_cdc)) == weeks[::-1]
+    assert len(season_cdc) == len(weeks)
+    assert season_cdc[0] == epiweeks.Week(2014, 40)
+    assert season_cdc[-1] == epiweeks.Week(2015, 39)
+    assert list(season_cdc[12:15]) == weeks[12:15]
+    assert epiweeks.Week(2015, 1) in season_cdc
+    assert epiweeks.Week(2014, 39) not in season_cdc
+    assert epiweeks.Week(2015, 40) not in season_cdc
+    assert epiweeks.Week(2015, 1, "iso") not in season_cdc
+
+
+@pytest.mark.parametrize(
+    ("test_input", "expected"),
+    [
+        (((2014, 40), "cdc", 40), (2014, 1)),
+        (((2014, 53), "cdc", 40), (2014, 14)),
+        (((2015, 39), "cdc", 40), (2014, 53)),
+        (((2016, 39), "cdc", 40), (2015, 52)),
+        (((2016, 1), "iso", 40), (2015, 15)),
+        (((2016, 1), "iso", 1), (2016, 1)),
+        (((2016, 1), "iso", 52), (2015, 3)),
+    ],
+)
+def test_season_fromweek(test_input, expected):
+    (year, week), system, startweek = test_input
+    week_object = epiweeks.Week(year, week, system)
+    season = epiweeks.Season.fromweek(week_object, startweek)
+    assert (season.year, season.seasonweek(week_object)) == expected
+    assert season[expected[1] - 1] == week_object
+    startdate = week_object.startdate()
+    assert season == epiweeks.Season.fromdate(startdate, system, startweek)
+
+
+@pytest.mark.parametrize("system", ["cdc", "iso"])
+def test_season_continuity(system):
+    seasons = [epiweeks.Season(year, system) for year in range(1999, 2031)]
+    for season, next_season in pairwise(seasons):
+        assert season[-1] + 1 == next_season[0]
+        assert len(season) == next_season[0] - season[0]
+        assert next_season - season == 1
+        assert season + 1 == next_season
+        assert season < next_season
+
+
+def test_season_comparison(season_cdc):
+    assert season_cdc.__hash__() == hash((2014, "CDC", 40))
+    assert season_cdc == epiweeks.Season(2014)
+    assert season_cdc != epiweeks.Season(2014, "iso")
+    assert season_cdc != epiweeks.Season(2014, startweek=1)
+    assert season_cdc < epiweeks.Season(2015) <= epiweeks.Season(2015)
+    assert season_cdc > epiweeks.Season(2013) >= epiweeks.Season(2013)
+    assert season_cdc.__eq__(2014) == NotImplemented
+    assert season_cdc.__lt__(2014) == NotImplemented
+    assert season_cdc.__le__(2014) == NotImplemented
+    assert season_cdc.__gt__(2014) == NotImplemented
+    assert season_cdc.__ge__(2014) == NotImplemented
+
+
+def test_season_arithmetic(season_cdc):
+    assert season_cdc + 1 == epiweeks.Season(2015)
+    assert season_cdc - 1 == epiweeks.Season(2013)
+    assert season_cdc - epiweeks.Season(2010) == 4
+    with pytest.raises(TypeError, match="Second operand must be 'int': str"):
+        season_cdc + "1"
+    with pytest.raises(TypeError, match="Second operand must be 'int' or 'Season'"):
+        season_cdc - 1.0
+
+
+def test_season_exception(season_cdc):
+    with pytest.raises(ValueError, match=r"Season year must be in 1\.\.9998"):
+        epiweeks.Season(9999)
+    with pytest.raises(ValueError, match=r"Season year must be in 1\.\.9998"):
+        epiweeks.Season.fromweek(epiweeks.Week(1, 1))
+    with pytest.raises(ValueError, match=r"Start week must be in 1\.\.52"):
+        epiweeks.Season(2014, startweek=53)
+    with pytest.raises(ValueError, match=r"Week\(2014, 39, CDC\) is not in season"):
+        season_cdc.seasonweek(epiweeks.Week(2014, 39))
+    with pytest.raises(TypeError, match="different start weeks"):
+        season_cdc < epiweeks.Season(2015, startweek=1)  # noqa: B015
+    with pytest.raises(TypeError, match="different numbering systems"):
+        season_cdc - epiweeks.Season(2014, "iso")
+
+
+@pytest.fixture(scope="module")
+def week_range_cdc():
+    return epiweeks.WeekRange(epiweeks.Week(2014, 50), epiweeks.Week(2015, 4))
+
+
+def test_week_range_representation(week_range_cdc):
+    assert week_range_cdc.__repr__() == (
+        "WeekRange(Week(2014, 50, CDC), Week(2015, 4, CDC), 1)"
+    )
+
+
+@pytest.mark.parametrize(
+    ("test_input", "expected"),
+    [
+        (
+            ("cdc", 9999, slice(-1, None)),
+            "WeekRange(Week(9999, 52, CDC), Week(10000, 1, CDC), 1)",
+        ),
+        (
+            ("iso", 1, slice(None, None, -1)),
+            "WeekRange(Week(1, 52, ISO), Week(0, 52, ISO), -1)",
+        ),
+        (
+            ("cdc", 1, slice(None, None, -20)),
+            "WeekRange(Week(1, 52, CDC), Week(0, 52, CDC), -20)",
+        ),
+    ],
+)
+def test_week_range_limits(test_input, expected):
+    system, year, index = test_input
+    week_range = epiweeks.Year(year, system)[index]
+    assert week_range.__repr__() == expected
+    stop = week_range.stop
+    assert stop.toserial() == week_range._range.stop
+    assert epiweeks.Week(*stop.weektuple(), system, validate=False) == stop
+
+
+@pytest.mark.parametrize("system", ["cdc", "iso"])
+def test_extended_weektuple(system):
+    week_system = epiweeks._get_system(system)
+    for serial in range(-520, 521_722 + 520, 13):
+        year, week = epiweeks._extended_weektuple(serial, week_system)
+        if serial in week_system._serial_range:
+            assert (year, week) == epiweeks.Week.fromserial(serial, system).weektuple()
+        assert epiweeks.Week(year, week, system, validate=False).toserial() == serial
+
+
+def test_week_range_attributes(week_range_cdc):
+    assert week_range_cdc.start == epiweeks.Week(2014, 50)
+    assert week_range_cdc.stop == epiweeks.Week(2015, 4)
+    assert week_range_cdc.step == 1
+    assert week_range_cdc.system == "CDC"
+
+
+@pytest.mark.parametrize(
+    ("test_input", "expected"),
+    [
+        (("cdc", 1), [(2014, 50), (2014, 51), (2014, 52), (2014, 53), (2015, 1)]),
+        (("iso", 1), [(2014, 50), (2014, 51), (2014, 52), (2015, 1), (2015, 2)]),
+        (("iso", 2), [(2014, 50), (2014, 52), (2015, 2)]),
+    ],
+)
+def test_week_range_weeks(test_input, expected):
+    system, step = test_input
+    start = epiweeks.Week(2014, 50, system)
+    week_range = epiweeks.WeekRange(start, start + 5, step)
+    weeks = [epiweeks.Week(y, w, system) for y, w in expected]
+    assert list(week_range) == weeks
+    assert list(reversed(week_range)) == weeks[::-1]
+    assert len(week_range) == len(weeks)
+    assert [week_range[i] for i in range(-len(weeks), len(weeks))] == weeks * 2
+
+
+def test_week_range_slicing(week_range_cdc):
+    weeks = list(week_range_cdc)
+    assert list(week_range_cdc[1:4]) == weeks[1:4]
+    assert list(week_range_cdc[::-2]) == weeks[::-2]
+    assert list(week_range_cdc[10:]) == []
+    assert week_range_cdc[:] == week_range_cdc
+    assert hash(week_range_cdc[:]) == hash(week_range_cdc)
+
+
+def test_week_range_containment(week_range_cdc):
+    assert epiweeks.Week(2014, 53) in week_range_cdc
+    assert epiweeks.Week(2015, 4) not in week_range_cdc
+    assert epiweeks.Week(2015, 1, system="iso") not in week_range_cdc
+    assert "201501" not in week_range_cdc
+
+
+@pytest.mark.parametrize(
+    ("test_input", "expected"),
+    [
+        ((date(2015, 1, 1), date(2015, 1, 31), "cdc", True), ((2014, 53), 5)),
+        ((date(2015, 1, 1), date(2015, 1, 31), "cdc", False), ((2015, 1), 4)),
+        ((date(2015, 1, 4), date(2015, 1, 10), "cdc", False), ((2015, 1), 1)),
+        ((date(2015, 1, 4), date(2015, 1, 9), "cdc", False), ((2015, 1), 0)),
+        ((date(2015, 1, 5), date(2015, 1, 5), "iso", True), ((2015, 2), 1)),
+        ((date(2015, 1, 5), date(2015, 1, 4), "iso", True), ((2015, 2), 0)),
+    ],
+)
+def test_week_range_fromdates(test_input, expected):
+    startdate, enddate, system, partial = test_input
+    (year, week), length = expected
+    week_range = epiweeks.WeekRange.fromdates(
+        startdate, enddate, system, partial=partial
+    )
+    assert week_range.start == epiweeks.Week(year, week, system)
+    assert len(week_range) == length
+    ordinals = range(startdate.toordinal(), enddate.toordinal() + 1)
+    days = {date.fromordinal(o) for o in ordinals}
+    weeks = {epiweeks.Week.fromdate(d, system) for d in days}
+    if not partial:
+        weeks = {w for w in weeks if set(w.iterdates()) <= days}
+    assert set(week_range) == weeks
+
+
+def test_week_range_index(week_range_cdc):
+    assert week_range_cdc.index(epiweeks.Week(2015, 1)) == 4
+    assert week_range_cdc.count(epiweeks.Week(2015, 1)) == 1
+    assert week_range_cdc.count(epiweeks.Week(2015, 4)) == 0
+    with pytest.raises(ValueError, match=r"Week\(2015, 4, CDC\) is not in range"):
+        week_range_cdc.index(epiweeks.Week(2015, 4))
+
+
+def test_week_range_tosystem(week_range_cdc):
+    week_range_iso = week_range_cdc[::2].tosystem("iso")
+    assert week_range_iso.system == "ISO"
+    assert list(week_range_iso) == [w.tosystem("iso") for w in week_range_cdc[::2]]
+    assert week_range_iso.tosystem("cdc") == week_range_cdc[::2]
+
+
+def test_week_range_equality(week_range_cdc):
+    assert week_range_cdc != week_range_cdc[1:]
+    assert week_range_cdc.__eq__(range(5)) == NotImplemented
+
+
+@pytest.mark.parametrize(
+    ("test_input", "expected"),
+    [
+        (("2015", epiweeks.Week(2015, 1), 1), (TypeError, "must be 'Week' objects")),
+        (
+            (epiweeks.Week(2015, 1), epiweeks.Week(2015, 1, "iso"), 1),
+            (TypeError, "different numbering systems"),
+        ),
+        (
+            (epiweeks.Week(2015, 1), epiweeks.Week(2015, 2), 0),
+            (ValueError, "Step must not be zero"),
+        ),
+    ],
+)
+def test_week_range_exception(test_input, expected):
+    exception, message = expected
+    with pytest.raises(exception, match=message):
+        epiweeks.WeekRange(*test_input)
+
+
+@pytest.fixture
+def week_array_cdc():
+    weeks = [(2015, 2), (2014, 53), (2015, 2), (2015, 1)]
+    return epiweeks.WeekArray([epiweeks.Week(y, w) for y, w in weeks])
+
+
+def test_week_array_representation():
+    week_array = epiweeks.WeekArray([epiweeks.Week(2015, 1, "iso")], "iso")
+    assert week_array.__repr__() == "WeekArray([Week(2015, 1, ISO)], ISO)"
+
+
+def test_week_array_items(week_array_cdc):
+    assert len(week_array_cdc) == 4
+    assert week_array_cdc[1] == epiweeks.Week(2014, 53)
+    assert week_array_cdc[-1] == epiweeks.Week(2015, 1)
+    assert list(week_array_cdc) == week_array_cdc.tolist()
+    assert week_array_cdc.tolist()[0] == epiweeks.Week(2015, 2)
+    assert week_array_cdc.system == "CDC"
+
+
+def test_week_array_containment(week_array_cdc):
+    assert epiweeks.Week(2014, 53) in week_array_cdc
+    assert epiweeks.Week(2014, 52) not in week_array_cdc
+    assert epiweeks.Week(2015, 1, "iso") not in week_array_cdc
+    assert "201501" not in week_array_cdc
+
+
+def test_week_array_slicing(week_array_cdc):
+    view = week_array_cdc[1:]
+    assert view.tolist() == week_array_cdc.tolist()[1:]
+    assert view.serials.obj is week_array_cdc.serials.obj
+    assert week_array_cdc[::-2].tolist() == week_array_cdc.tolist()[::-2]
+    view.append(epiweeks.Week(2016, 1))
+    assert len(view) == 4
+    assert len(week_array_cdc) == 4
+
+
+def test_week_array_buffer(week_array_cdc):
+    serials = week_array_cdc.serials
+    assert serials.readonly
+    assert serials.format == "i"
+    assert serials.tolist() == [w.toserial() for w in week_array_cdc]
+    assert epiweeks.WeekArray.fromserials(serials) == week_array_cdc
+    assert week_array_cdc.__buffer__(0).readonly
+
+
+@pytest.mark.skipif(sys.version_info < (3, 12), reason="requires Python 3.12")
+def test_week_array_buffer_protocol(week_array_cdc):
+    view = memoryview(week_array_cdc)
+    assert view.readonly
+    assert view.tolist() == week_array_cdc.serials.tolist()
+    with pytest.raises(TypeError):
+        view[0] = 0
+
+
+@pytest.mark.parametrize("serials", [[0, -1], [521723], [2**31 // 2, 1]])
+def test_week_array_fromserials_out_of_range(serials):
+    with pytest.raises(ValueError, match=r"Serial must be in 0\.\.521722"):
+        epiweeks.WeekArray.fromserials(serials)
+
+
+def test_week_array_fromserials_new_system():
+    system = epiweeks.WeekSystem("test", 5)
+    week_array = epiweeks.WeekArray.fromserials([-1], system)
+    assert week_array.tolist() == [epiweeks.Week(1, 1, system)]
+    with pytest.raises(ValueError, match=r"Serial must be in -1\.\."):
+        epiweeks.WeekArray.fromserials([-2], system)
+
+
+def test_week_array_extend(week_array_cdc):
+    week_array = epiweeks.WeekArray()
+    week_array.extend(week_array_cdc)
+    week_array.extend(
+        epiweeks.WeekRange(epiweeks.Week(2015, 1), epiweeks.Week(2015, 3))
+    )
+    week_array.append(epiweeks.Week(2020, 1))
+    weeks = [*week_array_cdc, epiweeks.Week(2015, 1), epiweeks.Week(2015, 2)]
+    assert week_array.tolist() == [*weeks, epiweeks.Week(2020, 1)]
+
+
+@pytest.mark.parametrize(
+    "test_input",
+    [
+        ["201501"],
+        [epiweeks.Week(2015, 1, "iso")],
+        epiweeks.WeekArray([epiweeks.Week(2015, 1, "iso")], "iso"),
+    ],
+)
+def test_week_array_extend_exception(week_array_cdc, test_input):
+    with pytest.raises(TypeError, match="Item must be 'Week' object of 'CDC' system"):
+        week_array_cdc.extend(test_input)
+
+
+def test_week_array_sort(week_array_cdc):
+    expected = sorted(week_array_cdc.tolist())
+    week_array_cdc.sort()
+    assert week_array_cdc.tolist() == expected
+    week_array_cdc.sort(reverse=True)
+    assert week_array_cdc.tolist() == expected[::-1]
+
+
+def test_week_array_searchsorted(week_array_cdc):
+    week_array_cdc.sort()
+    assert week_array_cdc.searchsorted(epiweeks.Week(2015, 2)) == 2
+    assert week_array_cdc.searchsorted(epiweeks.Week(2015, 2), "right") == 4
+    assert week_array_cdc.searchsorted(epiweeks.Week(2014, 1)) == 0
+
+
+def test_week_array_unique(week_array_cdc):
+    weeks = [epiweeks.Week(2014, 53), epiweeks.Week(2015, 1), epiweeks.Week(2015, 2)]
+    assert week_array_cdc.unique().tolist() == weeks
+    assert week_array_cdc.counts() == dict(zip(weeks, [1, 1, 2], strict=True))
+
+
+@pytest.mark.parametrize("startweek", [1, 30, 40, 52])
+def test_week_array_toseasons(startweek):
+    weeks = list(epiweeks.Year(2015))[::3] + list(epiweeks.Year(2014))[::5]
+    season_years, season_weeks = epiweeks.WeekArray(weeks).toseasons(startweek)
+    seasons = [epiweeks.Season.fromweek(w, startweek) for w in weeks]
+    assert season_years.tolist() == [s.year for s in seasons]
+    assert season_weeks.tolist() == [
+        s.seasonweek(w) for s, w in zip(seasons, weeks, strict=True)
+    ]
+
+
+@pytest.mark.parametrize("week", [(1, 39), (9999, 40)])
+def test_week_array_toseasons_out_of_range(week):
+    week_array = epiweeks.WeekArray([epiweeks.Week(*week)])
+    with pytest.raises(ValueError, match=r"Season year must be in 1\.\.9998"):
+        week_array.toseasons()
+    with pytest.raises(ValueError, match=r"Season year must be in 1\.\.9998"):
+        epiweeks.Season.fromweek(epiweeks.Week(*week))
+
+
+def test_week_array_tosystem(week_array_cdc):
+    week_array_iso = week_array_cdc[1:].tosystem("iso")
+    assert week_array_iso.system == "ISO"
+    assert list(week_array_iso) == [w.tosystem("iso") for w in week_array_cdc[1:]]
+    assert week_array_iso.tosystem("cdc") == week_array_cdc[1:]
+    system = epiweeks.register_system("test", 4)
+    try:
+        week_array_test = week_array_cdc.tosystem(system)
+        assert list(week_array_test) == [w.tosystem(system) for w in week_array_cdc]
+    finally:
+        epiweeks.unregister_system("test")
+
+
+def test_week_array_equality(week_array_cdc):
+    assert week_array_cdc == epiweeks.WeekArray(week_array_cdc)
+    assert week_array_cdc != week_array_cdc[1:]
+    assert week_array_cdc.__eq__([]) == NotImplemented
+    with pytest.raises(TypeError, match="unhashable"):
+        hash(week_array_cdc)
+
+
+@pytest.fixture
+def week_bucketer_cdc():
+    bucketer = epiweeks.WeekBucketer(lateness=2)
+    bucketer.update(
+        [(date(2015, 1, 6), 2), (date(2014, 12, 31), 5), (date(2015, 1, 3), 1)]
+    )
+    bucketer.add(date(2015, 1, 4), 3.5)
+    return bucketer
+
+
+def test_week_bucketer_representation(week_bucketer_cdc):
+    assert week_bucketer_cdc.__repr__() == "WeekBucketer(CDC, lateness=2)"
+    assert len(week_bucketer_cdc) == 2
+    assert week_bucketer_cdc.system == "CDC"
+
+
+def test_week_bucketer_advance(week_bucketer_cdc):
+    week, bucket = epiweeks.Week(2014, 53), epiweeks.WeekBucket(2, 6)
+    assert week_bucketer_cdc.advance(date(2015, 1, 5)) == []
+    assert week_bucketer_cdc.advance(date(2015, 1, 6)) == [(week, bucket)]
+    assert week_bucketer_cdc.advance(date(2015, 1, 6)) == []
+    week_bucketer_cdc.add(date(2015, 1, 3))
+    week_bucketer_cdc.update([(date(2014, 12, 28), 1), (date(2015, 1, 10), 1)])
+    week_bucketer_cdc.add(date(2015, 1, 17), 2)
+    assert week_bucketer_cdc.dropped == 2
+    buckets = [
+        (week + 1, epiweeks.WeekBucket(3, 6.5)),
+        (week + 2, epiweeks.WeekBucket(1, 2)),
+    ]
+    assert week_bucketer_cdc.peek() == buckets
+    assert week_bucketer_cdc.flush() == buckets
+    assert buckets[1][1].n == 1
+    assert len(week_bucketer_cdc) == 0
+
+
+def test_week_bucketer_merge(week_bucketer_cdc):
+    other = epiweeks.WeekBucketer(lateness=2)
+    other.update([(date(2014, 12, 28), 1), (date(2015, 1, 10), 4)])
+    other.advance(date(2014, 12, 31))
+    other.add(date(2014, 12, 20))
+    other.add(date(2015, 1, 17), 2)
+    week_bucketer_cdc.advance(date(2015, 1, 6))
+    week_bucketer_cdc.merge(other)
+    assert week_bucketer_cdc.dropped == 2
+    assert week_bucketer_cdc.flush() == [
+        (epiweeks.Week(2015, 1), epiweeks.WeekBucket(3, 9.5)),
+        (epiweeks.Week(2015, 2), epiweeks.WeekBucket(1, 2)),
+    ]
+    with pytest.raises(TypeError, match="Other must be 'WeekBucketer' of 'CDC'"):
+        week_bucketer_cdc.merge(epiweeks.WeekBucketer("iso"))
+
+
+def test_week_bucketer_first_date():
+    system = epiweeks.WeekSystem("test", 5)
+    bucketer = epiweeks.WeekBucketer(system)
+    bucketer.add(date(1, 1, 1), 2)
+    assert bucketer.dropped == 0
+    assert bucketer.flush() == [
+        (epiweeks.Week(1, 1, system), epiweeks.WeekBucket(1, 2))
+    ]
+
+
+def test_week_bucketer_exception():
+    with pytest.raises(ValueError, match="Lateness must not be negative"):
+        epiweeks.WeekBucketer(lateness=-1)
+
+
+@pytest.fixture
+def instance_cache():
+    epiweeks.enable_cache(maxsize=3)
+    yield
+    epiweeks.disable_cache()
+
+
+def test_cache_shared_instances(instance_cache):
+    week = epiweeks.Week.fromstring("2019W01")
+    assert epiweeks.Week.fromstring("201901") is week
+    assert epiweeks.Week.fromdate(date(2019, 1, 5)) is week
+    assert epiweeks.Week.fromserial(week.toserial()) is week
+    assert epiweeks.Week.fromordinal(week.startordinal()) is week
+    assert epiweeks.Week(2018, 52) + 1 is week
+    assert next(iter(epiweeks.Year(2019).iterweeks())) is week
+    assert epiweeks.Week.fromstrings(["2019-W01"])[0] is week
+    assert epiweeks.Year.thisyear() is epiweeks.Year.thisyear()
+    assert epiweeks.Week(2019, 1) is not week
+    assert epiweeks.Week.fromstring("201901", validate=False) is not week
+
+
+def test_cache_info(instance_cache):
+    assert epiweeks.cache_info() == epiweeks.CacheInfo(0, 0, 3, 0)
+    weeks = [epiweeks.Week.fromstring(f"20190{week}") for week in (1, 2, 1, 3, 4, 2)]
+    assert epiweeks.cache_info() == epiweeks.CacheInfo(1, 5, 3, 3)
+    assert weeks[0] is weeks[2]
+    assert weeks[1] is not weeks[5]
+    epiweeks.cache_clear()
+    assert epiweeks.cache_info() == epiweeks.CacheInfo(0, 0, 3, 0)
+
+
+def test_cache_invalid_week(instance_cache):
+    with pytest.raises(ValueError, match=r"Week must be in 1\.\.52"):
+        epiweeks.Week.fromstring("201953")
+    epiweeks.Week.fromstring("201953", validate=False)
+    with pytest.raises(ValueError, match=r"Week must be in 1\.\.52"):
+        epiweeks.Week.fromstring("201953")
+
+
+def test_cache_disabled():
+    assert epiweeks.cache_info() is None
+    epiweeks.cache_clear()
+    assert epiweeks.Week.fromstring("201901") is not epiweeks.Week.fromstring("201901")
+    with pytest.raises(ValueError, match="Maxsize must be a positive integer"):
+        epiweeks.enable_cache(0)
+
+
+@pytest.fixture
+def stats():
+    epiweeks.enable_stats()
+    yield
+    epiweeks.disable_stats()
+
+
+def test_stats_counts(stats, instance_cache):
+    epiweeks.stats(reset=True)
+    week = epiweeks.Week.fromdate(date(2019, 1, 5))
+    assert date(2019, 1, 1) in week
+    epiweeks.Week.fromstring("201901")
+    epiweeks.Year(2019)[0]
+    counts = epiweeks.stats(reset=True)
+    assert counts is not None
+    assert counts["Week.fromdate"] == 1
+    assert counts["Week.__contains__"] == 1
+    assert counts["Week.fromstring"] == 1
+    assert counts["Year.__getitem__"] == 1
+    assert counts["ordinal.yeartable"] == 1
+    assert counts["cache.misses"] == 1
+    assert counts["cache.hits"] == 2
+    assert epiweeks.stats() == {}
+
+
+def test_stats_enable_twice(stats):
+    epiweeks.Week.fromserial(0)
+    epiweeks.enable_stats()
+    assert epiweeks.stats() == {"Week.fromserial": 1, "ordinal.yeartable": 1}
+
+
+def test_stats_yeartable_builds(stats):
+    epiweeks.Week(2019, 1, epiweeks.WeekSystem("test", 2))
+    with pytest.raises(ValueError, match="Week must be in"):
+        epiweeks.Week(2019, 54, "iso")
+    assert epiweeks.stats() == {"Week.__init__": 2, "yeartable.builds": 1}
+
+
+def test_stats_season(stats):
+    season = epiweeks.Season(2014)
+    season.seasonweek(season[0])
+    counts = epiweeks.stats()
+    assert counts is not None
+    assert counts["Season.__init__"] == 1
+    assert counts["Season.__getitem__"] == 1
+    assert counts["Season.seasonweek"] == 1
+
+
+def test_stats_disabled():
+    fromdate = epiweeks.Week.__dict__["fromdate"]
+    epiweeks.enable_stats()
+    assert epiweeks.Week.__dict__["fromdate"] is not fromdate
+    epiweeks.disable_stats()
+    assert epiweeks.Week.__dict__["fromdate"] is fromdate
+    assert epiweeks.stats() is None
+    epiweeks.disable_stats()
+
+
+def test_stats_environment_variable():
+    code = "import epiweeks; epiweeks.Week(2019, 1); print(epiweeks.stats())"
+    env = {**os.environ, "EPIWEEKS_STATS": "1"}
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    expected = "{'Week.__init__': 1, 'yeartable.builds': 1}"
+    assert result.stdout.strip() == expected
+
+
+@pytest.mark.parametrize(("value", "expected"), [("1", True), ("0", False)])
+def test_stats_environment_check(monkeypatch, value, expected):
+    monkeypatch.setenv("EPIWEEKS_STATS", value)
+    try:
+        epiweeks._enable_environ_stats()
+        assert (epiweeks.stats() is not None) is expected
+    finally:
+        epiweeks.disable_stats()
+
+
+def test_week_system_objects():
+    assert epiweeks.CDC == "CDC"
+    assert epiweeks.ISO == "ISO"
+    assert epiweeks.CDC.name == "cdc"
+    assert epiweeks.CDC.startweekday == 6
+    assert epiweeks.ISO.startweekday == 0
+    assert epiweeks.Week(2015, 1, epiweeks.ISO) == epiweeks.Week(2015, 1, "iso")
+    assert epiweeks.Week(2015, 1, "Cdc").system is epiweeks.CDC
+    assert epiweeks.Year(2015, "iso").system is epiweeks.ISO
+    assert epiweeks.Week.fromdate(date(2015, 1, 1), epiweeks.ISO).system is epiweeks.ISO
+
+
+def test_week_system_pickle():
+    assert pickle.loads(pickle.dumps(epiweeks.CDC)) is epiweeks.CDC
+    week = pickle.loads(pickle.dumps(epiweeks.Week(2015, 1, "iso")))
+    assert week.system is epiweeks.ISO
+
+
+@pytest.mark.parametrize("protocol", [2, 4])
+def test_pickle_legacy_week(protocol):
+    # Weeks pickled by version 2.4.0 before week serial numbers were added
+    data = {
+        2: b"\x80\x02cepiweeks\nWeek\nq\x00)\x81q\x01N}q\x02(X\x07\x00\x00\x00_"
+        b"systemq\x03X\x03\x00\x00\x00CDCq\x04X\x05\x00\x00\x00_weekq\x05K"
+        b"\x05X\x05\x00\x00\x00_yearq\x06M\xe4\x07u\x86q\x07b.",
+        4: b"\x80\x04\x95E\x00\x00\x00\x00\x00\x00\x00\x8c\x08epiweeks\x94\x8c"
+        b"\x04Week\x94\x93\x94)\x81\x94N}\x94(\x8c\x07_system\x94\x8c\x03CDC"
+        b"\x94\x8c\x05_week\x94K\x05\x8c\x05_year\x94M\xe4\x07u\x86\x94b.",
+    }
+    week = pickle.loads(data[protocol])
+    assert week == epiweeks.Week(2020, 5)
+    assert week + 1 == epiweeks.Week(2020, 6)
+    assert week.startdate() == date(2020, 1, 26)
+    assert week.system is epiweeks.CDC
+
+
+@pytest.mark.parametrize("protocol", [2, 4])
+def test_pickle_legacy_year(protocol):
+    # Years pickled by version 2.4.0 before year tables were added
+    data = {
+        2: b"\x80\x02cepiweeks\nYear\nq\x00)\x81q\x01N}q\x02(X\x07\x00\x00\x00_"
+        b"systemq\x03X\x03\x00\x00\x00CDCq\x04X\x05\x00\x00\x00_yearq\x05M"
+        b"\xe4\x07u\x86q\x06b.",
+        4: b"\x80\x04\x95;\x00\x00\x00\x00\x00\x00\x00\x8c\x08epiweeks\x94\x8c"
+        b"\x04Year\x94\x93\x94)\x81\x94N}\x94(\x8c\x07_system\x94\x8c\x03CDC"
+        b"\x94\x8c\x05_year\x94M\xe4\x07u\x86\x94b.",
+    }
+    year = pickle.loads(data[protocol])
+    assert year == epiweeks.Year(2020)
+    assert year.totalweeks() == 53
+    assert year.startdate() == date(2019, 12, 29)
+    assert year.system is epiweeks.CDC
+
+
+def test_pickle():
+    weeks = list(epiweeks.WeekRange(epiweeks.Week(2014, 50), epiweeks.Week(2015, 4)))
+    assert pickle.loads(pickle.dumps(weeks)) == weeks
+    assert pickle.loads(pickle.dumps(weeks[0])).weektuple() == (2014, 50)
+    sizes = [len(pickle.dumps(weeks[:n])) for n in (1, 7)]
+    assert sizes[1] - sizes[0] <= 6 * 16
+    season = epiweeks.Season(2015, "iso", 30)
+    assert pickle.loads(pickle.dumps(season)) == season
+    year = pickle.loads(pickle.dumps(epiweeks.Year(2015, "iso")))
+    assert year == epiweeks.Year(2015, "iso")
+    assert len(year) == 53
+    week_array = epiweeks.WeekArray(weeks)[1:]
+    assert pickle.loads(pickle.dumps(week_array)) == week_array
+
+
+@pytest.fixture
+def week_system_sat():
+    yield epiweeks.register_system("sat", 5)
+    epiweeks.unregister_system("sat")
+
+
+def test_register_system(week_system_sat):
+    assert week_system_sat == "SAT"
+    assert week_system_sat.firstweek == "fourdays"
+    assert week_system_sat._year_table is not None
+    week = epiweeks.Week(2024, 1, "Sat")
+    assert week.system is week_system_sat
+    assert week.startdate() == date(2023, 12, 30)
+    assert week.daydate(3) == date(2024, 1, 4)
+    assert epiweeks.Week.fromdate(date(2023, 12, 29), "sat").weektuple() == (2023, 52)
+    assert epiweeks.Week.fromserial(week.toserial(), "sat") == week
+    assert epiweeks.Week.fromstring("2024W01", "sat") == week
+    assert epiweeks.Year(2024, "sat").startdate() == date(2023, 12, 30)
+    assert (week - 1).weektuple() == (2023, 52)
+    assert pickle.loads(pickle.dumps(week)).system is week_system_sat
+
+
+@pytest.mark.parametrize(
+    ("test_input", "expected"),
+    [
+        (("firstday", 2021), (date(2020, 12, 26), 53)),
+        (("fourdays", 2021), (date(2021, 1, 2), 52)),
+        (("fullweek", 2021), (date(2021, 1, 2), 52)),
+        (("fullweek", 2022), (date(2022, 1, 1), 53)),
+        (("fourdays", 2023), (date(2022, 12, 31), 52)),
+        (("fullweek", 2023), (date(2023, 1, 7), 52)),
+    ],
+)
+def test_register_system_first_week(test_input, expected):
+    firstweek, year = test_input
+    system = epiweeks.register_system("test", 5, firstweek)
+    try:
+        year_object = epiweeks.Year(year, system)
+        assert (year_object.startdate(), year_object.totalweeks()) == expected
+    finally:
+        epiweeks.unregister_system("test")
+
+
+@pytest.mark.parametrize("firstweek", ["firstday", "fourdays", "fullweek"])
+@pytest.mark.parametrize("startweekday", range(7))
+def test_system_date_limits(startweekday, firstweek):
+    system = epiweeks.WeekSystem("test", startweekday, firstweek)
+    last_week = epiweeks.Week(9999, epiweeks.Year(9999, system).totalweeks(), system)
+    first = max(1, epiweeks.Week(1, 1, system).startordinal())
+    last = min(date.max.toordinal(), last_week.startordinal() + 6)
+    assert epiweeks.Week.fromordinal(first, system).weektuple() == (1, 1)
+    assert epiweeks.Week.fromordinal(last, system) == last_week
+    for ordinal in (first - 1, last + 1):
+        with pytest.raises(ValueError, match=f"Ordinal must be in {first}..{last}"):
+            epiweeks.Week.fromordinal(ordinal, system)
+    for day in (date.min, date.max):
+        if first <= day.toordinal() <= last:
+            assert 1 <= epiweeks.Week.fromdate(day, system).year <= 9999
+        else:
+            with pytest.raises(ValueError, match="Ordinal must be in"):
+                epiweeks.Week.fromdate(day, system)
+
+
+@pytest.mark.parametrize(
+    ("test_input", "expected"),
+    [
+        (("cdc", 6), r"System already registered: 'cdc'"),
+        (("test", 7), r"Start weekday must be in 0\.\.6"),
+        (("test", 5, "fivedays"), r"First week must be in \('firstday', "),
+    ],
+)
+def test_register_system_exception(test_input, expected):
+    with pytest.raises(ValueError, match=expected):
+        epiweeks.register_system(*test_input)
+    assert "test" not in epiweeks._systems
+
+
+def test_unregister_system(week_system_sat):
+    epiweeks.unregister_system("SAT")
+    with pytest.raises(ValueError, match=r"System must be in \('cdc', 'iso'\)"):
+        epiweeks.Week(2024, 1, "sat")
+    epiweeks.register_system("sat", 5)
+    with pytest.raises(ValueError, match="System can not be unregistered: 'iso'"):
+        epiweeks.unregister_system("iso")
@@ -0,0 +1,81 @@
+import random
+
+from datetime import date
+
+import pytest
+
+import epiweeks
+
+from epiweeks import Week, lookup
+
+
+@pytest.fixture
+def table_path(tmp_path):
+    path = tmp_path / "epiweeks.bin"
+    lookup.build(path, date(2000, 1, 1), date(2030, 1, 1))
+    yield path
+    lookup.unload()
+
+
+def test_load(table_path):
+    assert lookup.loaded() is None
+    lookup.load(table_path)
+    assert lookup.loaded() == (date(2000, 1, 1), date(2030, 1, 1))
+    lookup.unload()
+    assert lookup.loaded() is None
+
+
+@pytest.mark.parametrize("system", ["cdc", "iso", "CDC", "ISO"])
+def test_fromdate(table_path, system):
+    random.seed(system)
+    ordinals = [
+        *range(date(1999, 12, 20).toordinal(), date(2000, 1, 20).toordinal()),
+        *range(date(2029, 12, 20).toordinal(), date(2030, 1, 20).toordinal()),
+        *random.sample(range(1, date(9999, 12, 31).toordinal()), 1000),
+    ]
+    dates = [date.fromordinal(ordinal) for ordinal in ordinals]
+    expected = [Week.fromdate(d, system) for d in dates]
+    lookup.load(table_path)
+    assert [Week.fromdate(d, system) for d in dates] == expected
+
+
+def test_numpy_fromordinals(table_path):
+    epiweeks_numpy = pytest.importorskip("epiweeks.numpy")
+    ordinals = list(range(date(2000, 1, 1).toordinal(), date(2030, 1, 1).toordinal()))
+    expected = epiweeks_numpy.fromordinals(ordinals, "iso")
+    lookup.load(table_path)
+    years, weeks = epiweeks_numpy.fromordinals(ordinals, "iso")
+    assert years.tolist() == expected[0].tolist()
+    assert weeks.tolist() == expected[1].tolist()
+
+
+def test_build_invalid_range(tmp_path):
+    with pytest.raises(ValueError, match="Stop date must be after start date"):
+        lookup.build(tmp_path / "epiweeks.bin", date(2000, 1, 1), date(2000, 1, 1))
+
+
+def test_load_invalid_file(tmp_path):
+    path = tmp_path / "epiweeks.bin"
+    path.write_bytes(b"EPIWEEK\0" + bytes(100))
+    with pytest.raises(ValueError, match="Invalid lookup table file"):
+        lookup.load(path)
+    path.write_bytes(b"short")
+    with pytest.raises(ValueError, match="Invalid lookup table file"):
+        lookup.load(path)
+    assert lookup.loaded() is None
+
+
+def test_stats_daytable(table_path):
+    lookup.load(table_path)
+    epiweeks.enable_stats()
+    try:
+        Week.fromdate(date(2019, 1, 1))
+        Week.fromdate(date(1990, 1, 1))
+        counts = epiweeks.stats()
+    finally:
+        epiweeks.disable_stats()
+    assert counts == {
+        "Week.fromdate": 2,
+        "ordinal.daytable": 1,
+        "ordinal.yeartable": 1,
+    }
@@ -0,0 +1,84 @@
+from datetime import date
+
+import pytest
+
+import epiweeks
+
+np = pytest.importorskip("numpy")
+epiweeks_numpy = pytest.importorskip("epiweeks.numpy")
+
+
+@pytest.mark.parametrize("system", ["cdc", "iso"])
+def test_fromdates(system):
+    start = date(2007, 12, 1).toordinal()
+    dates = [date.fromordinal(start + i) for i in range(0, 6000, 3)]
+    years, weeks = epiweeks_numpy.fromdates(np.array(dates, "datetime64[D]"), system)
+    expected = [epiweeks.Week.fromdate(d, system).weektuple() for d in dates]
+    assert list(zip(years.tolist(), weeks.tolist(), strict=True)) == expected
+    assert years.dtype == weeks.dtype == np.int32
+
+
+@pytest.mark.parametrize(
+    ("test_input", "expected"),
+    [
+        (([date.min, date.max], "cdc"), ([1, 9999], [1, 52])),
+        (([date.min, date.max], "iso"), ([1, 9999], [1, 52])),
+        (([], "cdc"), ([], [])),
+    ],
+)
+def test_fromdates_range_limits(test_input, expected):
+    years, weeks = epiweeks_numpy.fromdates(*test_input)
+    assert (years.tolist(), weeks.tolist()) == expected
+
+
+def test_fromordinals():
+    ordinals = [date(2014, 12, 28).toordinal(), date(2017, 12, 31).toordinal()]
+    years, weeks = epiweeks_numpy.fromordinals(ordinals, "cdc")
+    assert years.tolist() == [2014, 2018]
+    assert weeks.tolist() == [53, 1]
+
+
+@pytest.mark.parametrize("ordinals", [[0], [date.max.toordinal() + 1]])
+def test_fromordinals_out_of_range(ordinals):
+    with pytest.raises(ValueError, match=r"Ordinal must be in 1\.\.3652059"):
+        epiweeks_numpy.fromordinals(ordinals)
+
+
+def test_fromordinals_custom_system_limits():
+    system = epiweeks.WeekSystem("test", 2)
+    with pytest.raises(ValueError, match=r"Ordinal must be in 3\.\.3652056"):
+        epiweeks_numpy.fromordinals([date.max.toordinal()], system)
+
+
+def test_fromdates_nat():
+    with pytest.raises(ValueError, match=r"Ordinal must be in"):
+        epiweeks_numpy.fromdates(np.array(["2019-01-01", "NaT"], "datetime64[D]"))
+
+
+def test_fromdates_invalid_system():
+    with pytest.raises(ValueError, match=r"System must be in"):
+        epiweeks_numpy.fromdates([date(2019, 1, 1)], "mmwr")
+
+
+def test_pack():
+    packed = epiweeks_numpy.pack([2014, 2019], [53, 1])
+    assert packed.tolist() == [201453, 201901]
+
+
+@pytest.mark.parametrize("startweek", [1, 40, 52])
+def test_toseasons(startweek):
+    weeks = list(epiweeks.Year(2015)) + list(epiweeks.Year(2016))
+    years = [w.year for w in weeks]
+    season_years, season_weeks = epiweeks_numpy.toseasons(
+        years, [w.week for w in weeks], "cdc", startweek
+    )
+    expected = epiweeks.WeekArray(weeks).toseasons(startweek)
+    assert season_years.tolist() == expected[0].tolist()
+    assert season_weeks.tolist() == expected[1].tolist()
+    assert season_years.dtype == season_weeks.dtype == np.int32
+
+
+@pytest.mark.parametrize(("year", "week"), [(1, 39), (9999, 40)])
+def test_toseasons_out_of_range(year, week):
+    with pytest.raises(ValueError, match=r"Season year must be in 1\.\.9998"):
+        epiweeks_numpy.toseasons([year], [week])
@@ -0,0 +1,140 @@
+from datetime import date
+
+import pytest
+
+import epiweeks
+
+pd = pytest.importorskip("pandas")
+epiweeks_pandas = pytest.importorskip("epiweeks.pandas")
+
+
+@pytest.fixture
+def series_cdc():
+    dates = ["2018-12-30", "2019-01-05", None, "2015-01-01"]
+    return pd.Series(pd.to_datetime(dates), name="date").epiweek.fromdates()
+
+
+def test_dtype():
+    dtype = epiweeks_pandas.EpiWeekDtype("iso")
+    assert dtype.name == "epiweek[ISO]"
+    assert dtype == pd.api.types.pandas_dtype("epiweek[iso]")
+    assert pd.api.types.pandas_dtype("epiweek") == epiweeks_pandas.EpiWeekDtype()
+    assert dtype != epiweeks_pandas.EpiWeekDtype("cdc")
+    assert dtype.construct_array_type() is epiweeks_pandas.EpiWeekArray
+
+
+@pytest.mark.parametrize("test_input", ["epiweek[mmwr]", "int64", 1])
+def test_dtype_construction_exception(test_input):
+    with pytest.raises((TypeError, ValueError)):
+        epiweeks_pandas.EpiWeekDtype.construct_from_string(test_input)
+
+
+@pytest.mark.parametrize("system", ["cdc", "iso"])
+def test_accessor_fromdates(system):
+    start = date(2014, 12, 1).toordinal()
+    dates = [date.fromordinal(start + i) for i in range(0, 1500, 5)]
+    series = pd.Series(pd.to_datetime(dates)).epiweek.fromdates(system)
+    expected = [epiweeks.Week.fromdate(d, system) for d in dates]
+    assert series.dtype == epiweeks_pandas.EpiWeekDtype(system)
+    assert series.tolist() == expected
+    assert series.epiweek.year.tolist() == [w.year for w in expected]
+    assert series.epiweek.week.tolist() == [w.week for w in expected]
+    assert series.epiweek.serial.tolist() == [w.toserial() for w in expected]
+    startdates = series.epiweek.startdate.dt.date.tolist()
+    enddates = series.epiweek.enddate.dt.date.tolist()
+    assert startdates == [w.startdate() for w in expected]
+    assert enddates == [w.enddate() for w in expected]
+
+
+def test_accessor_missing(series_cdc):
+    assert series_cdc.isna().tolist() == [False, False, True, False]
+    assert series_cdc.epiweek.year.tolist() == [2019, 2019, pd.NA, 2014]
+    assert series_cdc.epiweek.week.tolist() == [1, 1, pd.NA, 53]
+    assert pd.isna(series_cdc.epiweek.startdate[2])
+    assert series_cdc.epiweek.cdcformat().tolist()[::3] == ["201901", "201453"]
+    assert series_cdc.epiweek.isoformat().tolist()[::3] == ["2019W01", "2014W53"]
+    assert pd.isna(series_cdc.epiweek.cdcformat()[2])
+    assert series_cdc.name == "date"
+
+
+def test_reduce(series_cdc):
+    assert series_cdc.min() == epiweeks.Week(2014, 53)
+    assert series_cdc.max() == epiweeks.Week(2019, 1)
+    assert pd.isna(series_cdc.max(skipna=False))
+    assert pd.isna(series_cdc[2:3].min())
+    with pytest.raises(TypeError):
+        series_cdc.sum()
+
+
+def test_accessor_exception():
+    with pytest.raises(AttributeError, match="Series must be of 'epiweek' dtype"):
+        _ = pd.Series([1, 2]).epiweek.year
+
+
+def test_series_construction():
+    weeks = [epiweeks.Week(2019, 1, "iso"), None, epiweeks.Week(2020, 53, "iso")]
+    series = pd.Series(weeks, dtype="epiweek[iso]")
+    assert series.tolist() == [weeks[0], pd.NA, weeks[2]]
+    inferred = pd.array(weeks, dtype=epiweeks_pandas.EpiWeekDtype("iso"))
+    assert inferred.nbytes == 24
+    parsed = epiweeks_pandas.EpiWeekArray._from_sequence_of_strings(
+        ["2019W01", "bad", None], dtype="epiweek[iso]"
+    )
+    assert parsed.tolist() == [weeks[0], pd.NA, pd.NA]
+
+
+def test_series_construction_strings():
+    series = pd.Series(["201901", None, "2020-W53"])
+    assert series.astype("epiweek[iso]").tolist() == [
+        epiweeks.Week(2019, 1, "iso"),
+        pd.NA,
+        epiweeks.Week(2020, 53, "iso"),
+    ]
+    assert pd.Series(["202001"]).astype("epiweek[cdc]")[0] == epiweeks.Week(2020, 1)
+    assert pd.array(["202001"], dtype="epiweek").dtype.system == "CDC"
+    with pytest.raises(ValueError, match=r"Week must be in 1\.\.52"):
+        pd.Series(["201953"]).astype("epiweek[cdc]")
+
+
+@pytest.mark.parametrize(
+    "test_input",
+    [[201901], [epiweeks.Week(2019, 1), epiweeks.Week(2019, 1, "iso")]],
+)
+def test_series_construction_exception(test_input):
+    with pytest.raises(TypeError, match=r"Item must be 'Week'|Week must be of"):
+        pd.array(test_input, dtype="epiweek")
+
+
+def test_series_ordering(series_cdc):
+    week = epiweeks.Week(2019, 1)
+    first_week = epiweeks.Week(2014, 53)
+    assert series_cdc.sort_values().tolist()[:3] == [first_week, week, week]
+    assert (series_cdc == week).tolist() == [True, True, False, False]
+    assert (series_cdc != week).tolist() == [False, False, True, True]
+    assert (series_cdc < week).tolist() == [False, False, False, True]
+    assert (series_cdc <= week).tolist() == [True, True, False, True]
+    assert (series_cdc > week - 1).tolist() == [True, True, False, False]
+    assert (series_cdc >= week + 1).tolist() == [False, False, False, False]
+    assert (series_cdc == series_cdc.array).tolist() == [True, True, False, True]
+
+
+def test_series_grouping(series_cdc):
+    frame = pd.DataFrame({"week": series_cdc, "cases": [1, 2, 3, 4]})
+    grouped = frame.groupby("week")["cases"].sum()
+    assert grouped.index.tolist() == [epiweeks.Week(2014, 53), epiweeks.Week(2019, 1)]
+    assert grouped.tolist() == [4, 3]
+    assert series_cdc.value_counts().tolist() == [2, 1]
+
+
+def test_series_modification(series_cdc):
+    series = series_cdc.fillna(epiweeks.Week(2000, 1))
+    assert series[2] == epiweeks.Week(2000, 1)
+    series[0:2] = [epiweeks.Week(2001, 1), None]
+    assert series.isna().tolist() == [False, True, False, False]
+    with pytest.raises(TypeError, match="Week must be of 'CDC' system"):
+        series[0] = epiweeks.Week(2001, 1, "iso")
+    combined = pd.concat([series_cdc, series])
+    assert len(combined) == 8
+    arrays = [series_cdc.array, pd.array([None], dtype="epiweek[iso]")]
+    with pytest.raises(TypeError, match="different systems"):
+        epiweeks_pandas.EpiWeekArray._concat_same_type(arrays)
@@ -0,0 +1,57 @@
+from datetime import date, datetime
+
+import pytest
+
+import epiweeks
+
+from epiweeks import parallel
+
+
+@pytest.fixture(scope="module")
+def dates():
+    start = date(2014, 12, 1).toordinal()
+    return [date.fromordinal(start + i) for i in range(0, 2000, 3)]
+
+
+@pytest.mark.parametrize(
+    ("test_input", "system"),
+    [
+        ({"workers": 1}, "cdc"),
+        ({"workers": 2, "backend": "thread"}, "iso"),
+        ({"workers": 2, "backend": "process"}, "cdc"),
+    ],
+)
+def test_convert_many(dates, test_input, system):
+    chunks = parallel.convert_many(iter(dates), system, chunksize=100, **test_input)
+    chunks = list(chunks)
+    assert [len(chunk) for chunk in chunks] == [100] * 6 + [67]
+    assert all(chunk.system == system.upper() for chunk in chunks)
+    weeks = [week for chunk in chunks for week in chunk]
+    assert weeks == [epiweeks.Week.fromdate(d, system) for d in dates]
+
+
+def test_convert_many_values():
+    values = ["2015-01-03", "2015-01-04T10:00:00", datetime(2015, 1, 10, 23, 59)]
+    chunks = list(parallel.convert_many(values, workers=1))
+    assert [w.weektuple() for w in chunks[0]] == [(2014, 53), (2015, 1), (2015, 1)]
+    assert list(parallel.convert_many([], workers=2, backend="thread")) == []
+
+
+@pytest.mark.parametrize(
+    ("test_input", "expected"),
+    [
+        ({"system": "mmwr"}, r"System must be in \('cdc', 'iso'\)"),
+        ({"workers": 0}, "Workers and chunksize must be positive integers"),
+        ({"chunksize": 0}, "Workers and chunksize must be positive integers"),
+        ({"backend": "interpreter"}, r"Backend must be in \('process', 'thread'\)"),
+    ],
+)
+def test_convert_many_exception(test_input, expected):
+    with pytest.raises(ValueError, match=expected):
+        parallel.convert_many([], **test_input)
+
+
+def test_convert_many_invalid_date():
+    chunks = parallel.convert_many(["2015-01-01", "2015-02-30"], workers=2)
+    with pytest.raises(ValueError, match="day is out of range for month"):
+        list(chunks)
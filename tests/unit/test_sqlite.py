@@ -0,0 +1,96 @@
+import sqlite3
+
+from datetime import date, timedelta
+
+import pytest
+
+from epiweeks import Week, sqlite
+
+
+@pytest.fixture
+def connection():
+    connection = sqlite3.connect(":memory:")
+    sqlite.register(connection)
+    yield connection
+    connection.close()
+
+
+@pytest.mark.parametrize("system", ["cdc", "iso"])
+def test_functions(connection, system):
+    dates = [date(2014, 12, 20) + timedelta(days=i) for i in range(30)]
+    connection.execute("CREATE TABLE cases (onset TEXT)")
+    values = [(d.isoformat(),) for d in dates]
+    connection.executemany("INSERT INTO cases VALUES (?)", values)
+    rows = connection.execute(
+        "SELECT epiweek(onset, ?), epiweek_year(onset, ?), epiweek_start(onset, ?),"
+        " epiweek_format(onset, ?) FROM cases",
+        [system] * 4,
+    ).fetchall()
+    weeks = [Week.fromdate(d, system) for d in dates]
+    assert rows == [
+        (w.year * 100 + w.week, w.year, w.startdate().isoformat(), str(w))
+        for w in weeks
+    ]
+
+
+def test_functions_default_system(connection):
+    row = connection.execute(
+        "SELECT epiweek(?), epiweek_year(?), epiweek_start(?), epiweek_format(?)",
+        ["2015-01-03 12:30:00", "2015-01-03", "2015-01-03", "2015-01-03"],
+    ).fetchone()
+    assert row == (201453, 2014, "2014-12-28", "201453")
+    assert connection.execute("SELECT epiweek(NULL, 'iso')").fetchone() == (None,)
+
+
+def test_functions_index(connection):
+    connection.execute("CREATE TABLE cases (onset TEXT)")
+    connection.execute("CREATE INDEX cases_epiweek ON cases (epiweek(onset, 'iso'))")
+    connection.execute("INSERT INTO cases VALUES ('2015-01-01')")
+    query = "SELECT count(*) FROM cases WHERE epiweek(onset, 'iso') = 201501"
+    assert connection.execute(query).fetchone() == (1,)
+
+
+@pytest.mark.parametrize(
+    "test_input", ["'2015-13-01'", "'2015-01-01', 'mmwr'", "20150101", "'2015'"]
+)
+def test_functions_invalid_input(connection, test_input):
+    row = connection.execute(
+        f"SELECT epiweek({test_input}), epiweek_start({test_input})"
+    ).fetchone()
+    assert row == (None, None)
+
+
+def test_functions_invalid_rows(connection):
+    connection.execute("CREATE TABLE cases (onset TEXT)")
+    connection.execute("CREATE INDEX cases_epiweek ON cases (epiweek(onset))")
+    connection.executemany(
+        "INSERT INTO cases VALUES (?)", [("2015-01-01",), ("unknown",), (None,)]
+    )
+    query = "SELECT epiweek(onset), count(*) FROM cases GROUP BY 1 ORDER BY 1"
+    assert connection.execute(query).fetchall() == [(None, 2), (201453, 1)]
+
+
+def test_create_calendar(connection):
+    sqlite.create_calendar(connection, 2014, 2016, "iso", table="calendar")
+    rows = connection.execute("SELECT * FROM calendar ORDER BY epiweek").fetchall()
+    assert len(rows) == 105
+    assert rows[0] == (201401, 2014, 1, "2013-12-30", "2014-01-05")
+    assert rows[-1] == (201553, 2015, 53, "2015-12-28", "2016-01-03")
+    query = (
+        "SELECT count(*) FROM calendar WHERE epiweek = epiweek(startdate, 'iso')"
+        " AND epiweek = epiweek(enddate, 'iso')"
+    )
+    assert connection.execute(query).fetchone() == (105,)
+
+
+@pytest.mark.parametrize(
+    ("test_input", "expected"),
+    [
+        ((2015, 2015), "Stop year must be after start year"),
+        ((9999, 10001), r"Year must be in 1\.\.9999"),
+        ((2014, 2015, "mmwr"), r"System must be in \('cdc', 'iso'\)"),
+    ],
+)
+def test_create_calendar_exception(connection, test_input, expected):
+    with pytest.raises(ValueError, match=expected):
+        sqlite.create_calendar(connection, *test_input)